@@ -36,13 +36,17 @@ class WiringConfiguration:
     from_package: Optional[str]
     auto_wire: bool
     keep_cache: bool
+    warn_unresolved: bool
+    lazy_attributes: bool
     def __init__(
         self,
         modules: Optional[Iterable[Any]] = None,
         packages: Optional[Iterable[Any]] = None,
         from_package: Optional[str] = None,
         auto_wire: bool = True,
-        keep_cache: bool = False,
+        keep_cache: bool = True,
+        warn_unresolved: bool = False,
+        lazy_attributes: bool = False,
     ) -> None: ...
 
 class Container:
@@ -52,6 +56,7 @@ class Container:
     overridden: Tuple[Provider[Any], ...]
     wiring_config: WiringConfiguration
     auto_load_config: bool = True
+    providers_version: int
     __self__: Self
     def __init__(self) -> None: ...
     def __deepcopy__(self, memo: Optional[Dict[str, Any]]) -> _Self: ...
@@ -72,7 +77,9 @@ class Container:
         modules: Optional[Iterable[Any]] = None,
         packages: Optional[Iterable[Any]] = None,
         from_package: Optional[str] = None,
+        keep_cache: Optional[bool] = None,
         warn_unresolved: bool = False,
+        lazy_attributes: Optional[bool] = None,
     ) -> None: ...
     def unwire(self) -> None: ...
     def init_resources(self, resource_type: Type[Resource[Any]] = Resource) -> Optional[Awaitable[None]]: ...
@@ -83,9 +90,14 @@ class Container:
     def check_dependencies(self) -> None: ...
     def from_schema(self, schema: Dict[Any, Any]) -> None: ...
     def from_yaml_schema(
-        self, filepath: Union[Path, str], loader: Optional[Any] = None
+        self,
+        filepath: Union[Path, str],
+        loader: Optional[Any] = None,
+        parser: Optional[str] = None,
+    ) -> None: ...
+    def from_json_schema(
+        self, filepath: Union[Path, str], parser: Optional[str] = None
     ) -> None: ...
-    def from_json_schema(self, filepath: Union[Path, str]) -> None: ...
     @overload
     def resolve_provider_name(self, provider: Provider[Any]) -> str: ...
     @classmethod
@@ -3,14 +3,9 @@
 import asyncio
 import contextlib
 import copy as copy_module
-import json
 import importlib
 import inspect
-
-try:
-    import yaml
-except ImportError:
-    yaml = None
+import sys
 
 from . import providers, errors
 from .providers cimport __is_future_or_coroutine
@@ -26,8 +21,9 @@ class WiringConfiguration:
         packages=None,
         from_package=None,
         auto_wire=True,
-        keep_cache=False,
+        keep_cache=True,
         warn_unresolved=False,
+        lazy_attributes=False,
     ):
         self.modules = [*modules] if modules else []
         self.packages = [*packages] if packages else []
@@ -35,6 +31,7 @@ class WiringConfiguration:
         self.auto_wire = auto_wire
         self.keep_cache = keep_cache
         self.warn_unresolved = warn_unresolved
+        self.lazy_attributes = lazy_attributes
 
     def __deepcopy__(self, memo=None):
         return self.__class__(
@@ -44,6 +41,7 @@ class WiringConfiguration:
             self.auto_wire,
             self.keep_cache,
             self.warn_unresolved,
+            self.lazy_attributes,
         )
 
 
@@ -78,6 +76,12 @@ class DynamicContainer(Container):
         Type of providers that could be placed in container.
 
         :type: type
+
+    .. py:attribute:: providers_version
+
+        Counter incremented on every change of container providers.
+
+        :type: int
     """
 
     __IS_CONTAINER__ = True
@@ -95,6 +99,7 @@ class DynamicContainer(Container):
         self.wiring_config = WiringConfiguration()
         self.wired_to_modules = []
         self.wired_to_packages = []
+        self.providers_version = 0
         self.__self__ = providers.Self(self)
         super(DynamicContainer, self).__init__()
 
@@ -143,6 +148,7 @@ class DynamicContainer(Container):
             _check_provider_type(self, value)
 
             self.providers[name] = value
+            self.providers_version += 1
 
             if isinstance(value, providers.CHILD_PROVIDERS):
                 value.assign_parent(self)
@@ -162,6 +168,7 @@ class DynamicContainer(Container):
         """
         if name in self.providers:
             del self.providers[name]
+            self.providers_version += 1
         super(DynamicContainer, self).__delattr__(name)
 
     @property
@@ -282,6 +289,7 @@ class DynamicContainer(Container):
         from_package=None,
         keep_cache=None,
         warn_unresolved=False,
+        lazy_attributes=None,
     ):
         """Wire container providers with provided packages and modules.
 
@@ -315,6 +323,8 @@ class DynamicContainer(Container):
 
         if keep_cache is None:
             keep_cache = self.wiring_config.keep_cache
+        if lazy_attributes is None:
+            lazy_attributes = self.wiring_config.lazy_attributes
 
         wire(
             container=self,
@@ -322,6 +332,7 @@ class DynamicContainer(Container):
             packages=packages,
             keep_cache=keep_cache,
             warn_unresolved=warn_unresolved,
+            lazy_attributes=lazy_attributes,
         )
 
         if modules:
@@ -445,12 +456,14 @@ class DynamicContainer(Container):
         for name, provider in build_schema(schema).items():
             self.set_provider(name, provider)
 
-    def from_yaml_schema(self, filepath, loader=None):
+    def from_yaml_schema(self, filepath, loader=None, parser=None):
         """Build container providers from YAML schema.
 
         You can specify type of loader as a second argument. By default, method
-        uses ``SafeLoader``.
+        uses automatically selected parser of yaml configuration files, see
+        :py:func:`dependency_injector.providers.register_config_parser`.
         """
+        yaml = _import_yaml()
         if yaml is None:
             raise errors.Error(
                 "Unable to load yaml schema - PyYAML is not installed. "
@@ -458,18 +471,22 @@ class DynamicContainer(Container):
                 "\"pip install dependency-injector[yaml]\""
             )
 
-        if loader is None:
-            loader = yaml.SafeLoader
-
         with open(filepath) as file:
-            schema = yaml.load(file, loader)
+            if loader is None:
+                schema = providers.get_config_parser("yaml", parser)(file.read())
+            else:
+                schema = yaml.load(file, loader)
 
         self.from_schema(schema)
 
-    def from_json_schema(self, filepath):
-        """Build container providers from JSON schema."""
+    def from_json_schema(self, filepath, parser=None):
+        """Build container providers from JSON schema.
+
+        By default, method uses automatically selected parser of json configuration files,
+        see :py:func:`dependency_injector.providers.register_config_parser`.
+        """
         with open(filepath) as file:
-            schema = json.load(file)
+            schema = providers.get_config_parser("json", parser)(file.read())
         self.from_schema(schema)
 
     def resolve_provider_name(self, provider):
@@ -542,6 +559,7 @@ class DeclarativeContainerMetaClass(type):
         attributes["cls_providers"] = cls_providers
         attributes["providers"] = all_providers
         attributes["wiring_config"] = wiring_config
+        attributes["providers_version"] = 0
 
         cls = <type>type.__new__(mcs, class_name, bases, attributes)
 
@@ -579,6 +597,7 @@ class DeclarativeContainerMetaClass(type):
 
             cls.providers[name] = value
             cls.cls_providers[name] = value
+            cls.providers_version += 1
         super(DeclarativeContainerMetaClass, cls).__setattr__(name, value)
 
     def __delattr__(cls, name):
@@ -595,6 +614,7 @@ class DeclarativeContainerMetaClass(type):
         if name in cls.providers and name in cls.cls_providers:
             del cls.providers[name]
             del cls.cls_providers[name]
+            cls.providers_version += 1
         super(DeclarativeContainerMetaClass, cls).__delattr__(name)
 
     @property
@@ -721,6 +741,12 @@ class DeclarativeContainer(Container, metaclass=DeclarativeContainerMetaClass):
     :type: tuple[:py:class:`DeclarativeContainer`]
     """
 
+    providers_version = 0
+    """Counter incremented on every change of container providers.
+
+    :type: int
+    """
+
     __self__ = None
     """Provider that provides current container.
 
@@ -912,6 +938,21 @@ cpdef object _check_provider_type(object container, object provider):
                            "instances".format(container, container.provider_type))
 
 
+def _import_yaml():
+    """Return ``yaml`` module, ``None`` if PyYAML is not installed."""
+    module_globals = globals()
+    if "yaml" not in module_globals:
+        module_globals["yaml"] = providers._import_yaml()
+    return module_globals["yaml"]
+
+
+def __getattr__(name):
+    """Import optional ``yaml`` module on the first access."""
+    if name == "yaml":
+        return _import_yaml()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 cpdef bint _any_relative_string_imports_in(object modules):
     for module in modules:
         if not isinstance(module, str):
@@ -930,9 +971,10 @@ cpdef list _resolve_string_imports(object modules, object from_package):
 
 
 cpdef object _resolve_calling_package_name():
-    stack = inspect.stack()
-    pre_last_frame = stack[0]
-    module = inspect.getmodule(pre_last_frame[0])
+    frame = sys._getframe(0)
+    module = sys.modules.get(frame.f_globals.get("__name__"))
+    if module is None:
+        module = inspect.getmodule(frame)
     return module.__package__
 
 
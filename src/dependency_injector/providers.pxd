@@ -10,6 +10,10 @@ cdef int ASYNC_MODE_UNDEFINED
 cdef int ASYNC_MODE_ENABLED
 cdef int ASYNC_MODE_DISABLED
 
+cdef enum:
+    INJECTION_CALL = 1
+    INJECTION_CONSTANT = 2
+
 cdef set __iscoroutine_typecache
 cdef tuple __COROUTINE_TYPES
 
@@ -56,6 +60,11 @@ cdef class Dependency(Provider):
     cdef object _instance_of
     cdef object _default
     cdef object _parent
+    cdef set _instance_of_types
+    cdef bint _check_once
+    cdef object _checked_provider
+
+    cdef object _check_instance(self, object instance, object provider)
 
 
 cdef class ExternalDependency(Dependency):
@@ -72,14 +81,28 @@ cdef class DependenciesContainer(Object):
 # Callable providers
 cdef class Callable(Provider):
     cdef object _provides
+    cdef tuple _provides_import
 
     cdef tuple _args
+    cdef bytes _args_flags
     cdef int _args_len
+    cdef bint _args_folded
 
-    cdef tuple _kwargs
+    cdef tuple _kwargs_names
+    cdef tuple _kwargs_values
+    cdef bytes _kwargs_flags
     cdef int _kwargs_len
 
+    cdef dict _static_kwargs
+    cdef dict _kwargs_routes
+
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef object _resolve_provides(self)
+    cdef bint _copy_provides_import(self, Callable copied)
+    cdef object _represent_provides(self)
+    cdef object _set_callable_provides(self, object provides)
+    cdef void _set_args(self, tuple args)
+    cdef void _set_kwargs(self, tuple names, tuple values)
 
 
 cdef class DelegatedCallable(Callable):
@@ -118,28 +141,60 @@ cdef class ConfigurationOption(Provider):
     cdef dict _children
     cdef bint _required
     cdef object _cache
+    cdef unsigned long long _cache_generation
+
+    cdef bint _is_cache_actual(self)
 
 
 cdef class TypedConfigurationOption(Callable):
     pass
 
 
+cdef class ConfigurationPath:
+    cdef Configuration _root
+    cdef object _selector
+    cdef tuple _keys
+
+
+cdef class ConfigurationSnapshot(Provider):
+    cdef Configuration _root
+    cdef object _selector
+    cdef tuple _keys
+    cdef object _schema
+    cdef object _snapshot
+    cdef unsigned long long _snapshot_generation
+
+
 cdef class Configuration(Object):
     cdef str _name
     cdef bint __strict
+    cdef object _cache_dir
+    cdef dict _parsers
+    cdef Py_ssize_t _max_children
     cdef dict _children
     cdef list _ini_files
     cdef list _yaml_files
     cdef list _json_files
     cdef list _pydantic_settings
+    cdef unsigned long long _generation
+    cdef unsigned long long _full_generation
+    cdef tuple _changes
+    cdef set _linked_options
     cdef object __weakref__
 
+    cdef object _get(self, object selector, tuple keys, bint required)
+    cdef bint _is_changed(self, tuple keys, unsigned long long since)
+    cdef Object _apply_changes(self, object value, Object replaced, list selectors)
+    cdef void _reset_linked_caches(self)
+
 
 # Factory providers
 cdef class Factory(Provider):
     cdef Callable _instantiator
 
-    cdef tuple _attributes
+    cdef tuple _attributes_names
+    cdef tuple _attributes_values
+    cdef bytes _attributes_flags
     cdef int _attributes_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
@@ -212,13 +267,16 @@ cdef class SingletonDelegate(Delegate):
 
 cdef class List(Provider):
     cdef tuple _args
+    cdef bytes _args_flags
     cdef int _args_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
 
 
 cdef class Dict(Provider):
-    cdef tuple _kwargs
+    cdef tuple _kwargs_names
+    cdef tuple _kwargs_values
+    cdef bytes _kwargs_flags
     cdef int _kwargs_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
@@ -231,9 +289,12 @@ cdef class Resource(Provider):
     cdef object _resource
 
     cdef tuple _args
+    cdef bytes _args_flags
     cdef int _args_len
 
-    cdef tuple _kwargs
+    cdef tuple _kwargs_names
+    cdef tuple _kwargs_values
+    cdef bytes _kwargs_flags
     cdef int _kwargs_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
@@ -251,6 +312,10 @@ cdef class Container(Provider):
 cdef class Selector(Provider):
     cdef object _selector
     cdef dict _providers
+    cdef bint _cache
+    cdef object _selected
+    cdef Configuration _selected_root
+    cdef unsigned long long _selected_generation
 
     cpdef object _provide(self, tuple args, dict kwargs)
 
@@ -279,8 +344,11 @@ cdef class ItemGetter(Provider):
 cdef class MethodCaller(Provider):
     cdef object _provides
     cdef tuple _args
+    cdef bytes _args_flags
     cdef int _args_len
-    cdef tuple _kwargs
+    cdef tuple _kwargs_names
+    cdef tuple _kwargs_values
+    cdef bytes _kwargs_flags
     cdef int _kwargs_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
@@ -307,6 +375,10 @@ cpdef tuple parse_positional_injections(tuple args)
 
 cpdef tuple parse_named_injections(dict kwargs)
 
+cdef bytes _parse_injection_flags(tuple values)
+
+cdef tuple _get_kwargs_routes(dict routes_cache, dict kwargs)
+
 
 # Utils
 cdef class OverridingContext:
@@ -367,9 +439,38 @@ cdef inline object __get_value_kwargs(Injection self, dict kwargs):
     return self._value(**kwargs)
 
 
-cdef inline tuple __separate_prefixed_kwargs(dict kwargs):
+cdef inline object __get_injection_value(object value, unsigned char flags):
+    if flags & INJECTION_CALL:
+        return value()
+    return value
+
+
+cdef inline object __get_injection_value_kwargs(object value, unsigned char flags, dict kwargs):
+    if flags & INJECTION_CALL:
+        return value(**kwargs)
+    return value
+
+
+cdef inline tuple __separate_prefixed_kwargs(dict kwargs, dict routes_cache):
     cdef dict plain_kwargs = {}
     cdef dict prefixed_kwargs = {}
+    cdef tuple routes
+
+    if routes_cache is not None:
+        routes = _get_kwargs_routes(routes_cache, kwargs)
+        if routes is None:
+            return kwargs, prefixed_kwargs
+
+        for key, prefix, name in routes:
+            if prefix is None:
+                plain_kwargs[key] = kwargs[key]
+                continue
+
+            if prefix not in prefixed_kwargs:
+                prefixed_kwargs[prefix] = {}
+            prefixed_kwargs[prefix][name] = kwargs[key]
+
+        return plain_kwargs, prefixed_kwargs
 
     for key, value in kwargs.items():
         if "__" not in key:
@@ -391,21 +492,21 @@ cdef inline tuple __separate_prefixed_kwargs(dict kwargs):
 cdef inline object __provide_positional_args(
         tuple args,
         tuple inj_args,
+        bytes inj_args_flags,
         int inj_args_len,
         int async_mode,
 ):
     cdef int index
     cdef list positional_args = []
     cdef list future_args = []
-    cdef PositionalInjection injection
+    cdef const unsigned char* flags = inj_args_flags
     cdef object value
 
     if inj_args_len == 0:
         return args
 
     for index in range(inj_args_len):
-        injection = <PositionalInjection>inj_args[index]
-        value = __get_value(injection)
+        value = __get_injection_value(inj_args[index], flags[index])
         positional_args.append(value)
 
         if async_mode != ASYNC_MODE_DISABLED and __is_future_or_coroutine(value):
@@ -423,40 +524,40 @@ cdef inline object __provide_positional_args(
 @cython.wraparound(False)
 cdef inline object __provide_keyword_args(
         dict kwargs,
-        tuple inj_kwargs,
+        tuple inj_kwargs_names,
+        tuple inj_kwargs_values,
+        bytes inj_kwargs_flags,
         int inj_kwargs_len,
         int async_mode,
+        dict routes_cache,
 ):
     cdef int index
     cdef object name
     cdef object value
     cdef dict prefixed = {}
     cdef list future_kwargs = []
-    cdef NamedInjection kw_injection
+    cdef const unsigned char* flags = inj_kwargs_flags
 
     if len(kwargs) == 0:
         for index in range(inj_kwargs_len):
-            kw_injection = <NamedInjection>inj_kwargs[index]
-            name = __get_name(kw_injection)
-            value = __get_value(kw_injection)
+            name = inj_kwargs_names[index]
+            value = __get_injection_value(inj_kwargs_values[index], flags[index])
             kwargs[name] = value
             if async_mode != ASYNC_MODE_DISABLED and __is_future_or_coroutine(value):
                 future_kwargs.append((name, value))
     else:
-        kwargs, prefixed = __separate_prefixed_kwargs(kwargs)
-
+        kwargs, prefixed = __separate_prefixed_kwargs(kwargs, routes_cache)
 
         for index in range(inj_kwargs_len):
-            kw_injection = <NamedInjection>inj_kwargs[index]
-            name = __get_name(kw_injection)
+            name = inj_kwargs_names[index]
 
             if name in kwargs:
                 continue
 
             if name in prefixed:
-                value = __get_value_kwargs(kw_injection, prefixed[name])
+                value = __get_injection_value_kwargs(inj_kwargs_values[index], flags[index], prefixed[name])
             else:
-                value = __get_value(kw_injection)
+                value = __get_injection_value(inj_kwargs_values[index], flags[index])
 
             kwargs[name] = value
             if async_mode != ASYNC_MODE_DISABLED and __is_future_or_coroutine(value):
@@ -503,15 +604,20 @@ cdef inline void __async_prepare_args_kwargs_callback(
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef inline object __provide_attributes(tuple attributes, int attributes_len):
-    cdef NamedInjection attr_injection
+cdef inline object __provide_attributes(
+        tuple attributes_names,
+        tuple attributes_values,
+        bytes attributes_flags,
+        int attributes_len,
+):
+    cdef int index
     cdef dict attribute_injections = {}
     cdef list future_attributes = []
+    cdef const unsigned char* flags = attributes_flags
 
     for index in range(attributes_len):
-        attr_injection = <NamedInjection>attributes[index]
-        name = __get_name(attr_injection)
-        value = __get_value(attr_injection)
+        name = attributes_names[index]
+        value = __get_injection_value(attributes_values[index], flags[index])
         attribute_injections[name] = value
         if __is_future_or_coroutine(value):
             future_attributes.append((name, value))
@@ -558,25 +664,131 @@ cdef inline object __call(
         object call,
         tuple context_args,
         tuple injection_args,
+        bytes injection_args_flags,
         int injection_args_len,
         dict context_kwargs,
-        tuple injection_kwargs,
+        tuple injection_kwargs_names,
+        tuple injection_kwargs_values,
+        bytes injection_kwargs_flags,
         int injection_kwargs_len,
         int async_mode,
 ):
     cdef object args = __provide_positional_args(
         context_args,
         injection_args,
+        injection_args_flags,
         injection_args_len,
         async_mode,
     )
     cdef object kwargs = __provide_keyword_args(
         context_kwargs,
-        injection_kwargs,
+        injection_kwargs_names,
+        injection_kwargs_values,
+        injection_kwargs_flags,
         injection_kwargs_len,
         async_mode,
+        None,
     )
+    return __call_with_args_kwargs(call, args, kwargs, async_mode)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline object __provide_folded_keyword_args(
+        dict kwargs,
+        dict static_kwargs,
+        tuple inj_kwargs_names,
+        tuple inj_kwargs_values,
+        bytes inj_kwargs_flags,
+        int inj_kwargs_len,
+        int async_mode,
+        dict routes_cache,
+):
+    cdef int index
+    cdef object name
+    cdef object value
+    cdef dict provided = static_kwargs.copy()
+    cdef dict prefixed = {}
+    cdef list future_kwargs = []
+    cdef const unsigned char* flags = inj_kwargs_flags
 
+    if len(kwargs) != 0:
+        kwargs, prefixed = __separate_prefixed_kwargs(kwargs, routes_cache)
+        provided.update(kwargs)
+
+    for index in range(inj_kwargs_len):
+        if flags[index] & INJECTION_CONSTANT:
+            continue
+
+        name = inj_kwargs_names[index]
+
+        if name in kwargs:
+            continue
+
+        if name in prefixed:
+            value = __get_injection_value_kwargs(inj_kwargs_values[index], flags[index], prefixed[name])
+        else:
+            value = __get_injection_value(inj_kwargs_values[index], flags[index])
+
+        provided[name] = value
+        if async_mode != ASYNC_MODE_DISABLED and __is_future_or_coroutine(value):
+            future_kwargs.append((name, value))
+
+    if future_kwargs:
+        return __combine_future_injections(provided, future_kwargs)
+
+    return provided
+
+
+cdef inline object __callable_provide_call(Callable self, tuple context_args, dict context_kwargs, int async_mode):
+    cdef object args
+    cdef object kwargs
+
+    if self._provides_import is not None:
+        self._resolve_provides()
+
+    if not self._args_folded:
+        args = __provide_positional_args(
+            context_args,
+            self._args,
+            self._args_flags,
+            self._args_len,
+            async_mode,
+        )
+    elif len(context_args) == 0:
+        args = self._args
+    else:
+        args = self._args + context_args
+
+    if len(context_kwargs) != 0 and self._kwargs_routes is None:
+        self._kwargs_routes = {}
+
+    if self._static_kwargs is None:
+        kwargs = __provide_keyword_args(
+            context_kwargs,
+            self._kwargs_names,
+            self._kwargs_values,
+            self._kwargs_flags,
+            self._kwargs_len,
+            async_mode,
+            self._kwargs_routes,
+        )
+    else:
+        kwargs = __provide_folded_keyword_args(
+            context_kwargs,
+            self._static_kwargs,
+            self._kwargs_names,
+            self._kwargs_values,
+            self._kwargs_flags,
+            self._kwargs_len,
+            async_mode,
+            self._kwargs_routes,
+        )
+
+    return __call_with_args_kwargs(self._provides, args, kwargs, async_mode)
+
+
+cdef inline object __call_with_args_kwargs(object call, object args, object kwargs, int async_mode):
     if async_mode == ASYNC_MODE_DISABLED:
         return call(*args, **kwargs)
 
@@ -628,34 +840,21 @@ cdef inline object __async_result_callback(object future_result, object future):
 
 
 cdef inline object __callable_call(Callable self, tuple args, dict kwargs, ):
-    return __call(
-        self._provides,
-        args,
-        self._args,
-        self._args_len,
-        kwargs,
-        self._kwargs,
-        self._kwargs_len,
-        self._async_mode,
-    )
+    return __callable_provide_call(self, args, kwargs, self._async_mode)
 
 
 cdef inline object __factory_call(Factory self, tuple args, dict kwargs):
     cdef object instance
 
-    instance = __call(
-        self._instantiator._provides,
-        args,
-        self._instantiator._args,
-        self._instantiator._args_len,
-        kwargs,
-        self._instantiator._kwargs,
-        self._instantiator._kwargs_len,
-        self._async_mode,
-    )
+    instance = __callable_provide_call(self._instantiator, args, kwargs, self._async_mode)
 
     if self._attributes_len > 0:
-        attributes = __provide_attributes(self._attributes, self._attributes_len)
+        attributes = __provide_attributes(
+            self._attributes_names,
+            self._attributes_values,
+            self._attributes_flags,
+            self._attributes_len,
+        )
 
         is_future_instance = __is_future_or_coroutine(instance)
         is_future_attributes = __is_future_or_coroutine(attributes)
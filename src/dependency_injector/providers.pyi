@@ -131,12 +131,16 @@ class Dependency(Provider[T]):
         self,
         instance_of: Type[T] = object,
         default: Optional[Union[Provider, Any]] = None,
+        check_once: bool = False,
     ) -> None: ...
     def __getattr__(self, name: str) -> Any: ...
     @property
     def instance_of(self) -> Type[T]: ...
     def set_instance_of(self, instance_of: Type[T]) -> Dependency[T]: ...
     @property
+    def check_once(self) -> bool: ...
+    def set_check_once(self, check_once: bool) -> Dependency[T]: ...
+    @property
     def default(self) -> Provider[T]: ...
     def set_default(self, default: Optional[Union[Provider, Any]]) -> Dependency[T]: ...
     @property
@@ -219,6 +223,9 @@ class ConfigurationOption(Provider[Any]):
         self, callback: _Callable[..., T], *args: Injection, **kwargs: Injection
     ) -> TypedConfigurationOption[T]: ...
     def required(self) -> ConfigurationOption: ...
+    def snapshot(
+        self, schema: Optional[_Dict[Any, Any]] = None
+    ) -> ConfigurationSnapshot: ...
     def is_required(self) -> bool: ...
     def update(self, value: Any) -> None: ...
     def from_ini(
@@ -251,12 +258,71 @@ class ConfigurationOption(Provider[Any]):
         required: bool = False,
         as_: Optional[_Callable[..., Any]] = None,
     ) -> None: ...
+    def from_envs(
+        self,
+        prefix: str,
+        delimiter: str = "__",
+        as_: Optional[Union[_Callable[..., Any], _Dict[str, _Callable[..., Any]]]] = None,
+        required: bool = False,
+        case_sensitive: bool = False,
+    ) -> None: ...
     def from_value(self, value: Any) -> None: ...
 
 class TypedConfigurationOption(Callable[T]):
     @property
     def option(self) -> ConfigurationOption: ...
 
+class ConfigurationPath:
+    def __init__(self, root: Configuration, selector: str) -> None: ...
+    def __call__(self, required: bool = False) -> Any: ...
+    @property
+    def root(self) -> Configuration: ...
+    @property
+    def selector(self) -> str: ...
+    @property
+    def keys(self) -> Tuple[str, ...]: ...
+
+class ConfigurationSnapshot(Provider[Any]):
+    def __init__(
+        self,
+        root: Configuration,
+        selector: Optional[str] = None,
+        schema: Optional[_Dict[Any, Any]] = None,
+    ) -> None: ...
+    @property
+    def root(self) -> Configuration: ...
+    @property
+    def selector(self) -> Optional[str]: ...
+    @property
+    def schema(self) -> Optional[_Dict[Any, Any]]: ...
+
+class FrozenOptions:
+    def __getattr__(self, name: str) -> Any: ...
+    def __getitem__(self, key: str) -> Any: ...
+    def __contains__(self, key: object) -> bool: ...
+    def __iter__(self) -> _Iterator[str]: ...
+    def __len__(self) -> int: ...
+
+class ConfigurationWatcher:
+    config: Configuration
+    interval: float
+    on_change: Optional[_Callable[[_List[str]], Any]]
+    envs_required: Optional[bool]
+    def __init__(
+        self,
+        config: Configuration,
+        interval: float = 1.0,
+        on_change: Optional[_Callable[[_List[str]], Any]] = None,
+        envs_required: Optional[bool] = False,
+    ) -> None: ...
+    def __enter__(self) -> ConfigurationWatcher: ...
+    def __exit__(self, *exc_info: Any) -> None: ...
+    @property
+    def is_running(self) -> bool: ...
+    def start(self) -> ConfigurationWatcher: ...
+    def stop(self) -> None: ...
+    def check(self) -> _List[str]: ...
+
 class Configuration(Object[Any]):
     DEFAULT_NAME: str = "config"
     def __init__(
@@ -269,6 +335,9 @@ class Configuration(Object[Any]):
         yaml_files: Optional[_Iterable[Union[Path, str]]] = None,
         json_files: Optional[_Iterable[Union[Path, str]]] = None,
         pydantic_settings: Optional[_Iterable[PydanticSettings]] = None,
+        cache_dir: Optional[Union[Path, str]] = None,
+        parsers: Optional[_Dict[str, str]] = None,
+        max_children: Optional[int] = None,
     ) -> None: ...
     def __enter__(self) -> Configuration: ...
     def __exit__(self, *exc_info: Any) -> None: ...
@@ -280,6 +349,12 @@ class Configuration(Object[Any]):
     def set_default(self, default: _Dict[Any, Any]): ...
     def get_strict(self) -> bool: ...
     def set_strict(self, strict: bool) -> Configuration: ...
+    def get_cache_dir(self) -> Optional[Union[Path, str]]: ...
+    def set_cache_dir(self, cache_dir: Optional[Union[Path, str]]) -> Configuration: ...
+    def get_parsers(self) -> _Dict[str, str]: ...
+    def set_parsers(self, parsers: _Dict[str, str]) -> Configuration: ...
+    def get_max_children(self) -> Optional[int]: ...
+    def set_max_children(self, max_children: Optional[int]) -> Configuration: ...
     def get_children(self) -> _Dict[str, ConfigurationOption]: ...
     def set_children(
         self, children: _Dict[str, ConfigurationOption]
@@ -294,10 +369,25 @@ class Configuration(Object[Any]):
     def set_pydantic_settings(
         self, settings: _Iterable[PydanticSettings]
     ) -> Configuration: ...
-    def load(self, required: bool = False, envs_required: bool = False) -> None: ...
-    def get(self, selector: str) -> Any: ...
+    def load(
+        self,
+        required: bool = False,
+        envs_required: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> None: ...
+    def get(self, selector: str, required: bool = False) -> Any: ...
+    def path(self, selector: str) -> ConfigurationPath: ...
+    def snapshot(
+        self, schema: Optional[_Dict[Any, Any]] = None
+    ) -> ConfigurationSnapshot: ...
     def set(self, selector: str, value: Any) -> OverridingContext[P]: ...
     def reset_cache(self) -> None: ...
+    def watch(
+        self,
+        interval: float = 1.0,
+        on_change: Optional[_Callable[[_List[str]], Any]] = None,
+        envs_required: Optional[bool] = False,
+    ) -> ConfigurationWatcher: ...
     def update(self, value: Any) -> None: ...
     def from_ini(
         self,
@@ -329,6 +419,14 @@ class Configuration(Object[Any]):
         required: bool = False,
         as_: Optional[_Callable[..., Any]] = None,
     ) -> None: ...
+    def from_envs(
+        self,
+        prefix: str,
+        delimiter: str = "__",
+        as_: Optional[Union[_Callable[..., Any], _Dict[str, _Callable[..., Any]]]] = None,
+        required: bool = False,
+        case_sensitive: bool = False,
+    ) -> None: ...
     def from_value(self, value: Any) -> None: ...
 
 class Factory(Provider[T]):
@@ -529,7 +627,10 @@ class Container(Provider[T]):
 
 class Selector(Provider[Any]):
     def __init__(
-        self, selector: Optional[_Callable[..., Any]] = None, **providers: Provider
+        self,
+        selector: Optional[_Callable[..., Any]] = None,
+        cache: bool = False,
+        **providers: Provider,
     ): ...
     def __getattr__(self, name: str) -> Provider: ...
     @property
@@ -538,6 +639,9 @@ class Selector(Provider[Any]):
     @property
     def providers(self) -> _Dict[str, Provider]: ...
     def set_providers(self, **providers: Provider) -> Selector: ...
+    def is_cache_enabled(self) -> bool: ...
+    def set_cache(self, cache: bool) -> Selector: ...
+    def reset_cache(self) -> Selector: ...
 
 class ProvidedInstanceFluentInterface:
     def __getattr__(self, item: Any) -> AttributeGetter: ...
@@ -606,6 +710,14 @@ def deepcopy_kwargs(
     memo: Optional[_Dict[int, Any]] = None,
 ) -> Dict[str, Any]: ...
 def merge_dicts(dict1: _Dict[Any, Any], dict2: _Dict[Any, Any]) -> _Dict[Any, Any]: ...
+def register_config_parser(
+    file_type: str, name: str, parser: _Callable[[str], Any]
+) -> None: ...
+def unregister_config_parser(file_type: str, name: str) -> None: ...
+def get_config_parser(
+    file_type: str, name: Optional[str] = None
+) -> _Callable[[str], Any]: ...
+def get_config_parser_names(file_type: str) -> _List[str]: ...
 def traverse(
     *providers: Provider, types: Optional[_Iterable[Type]] = None
 ) -> _Iterator[Provider]: ...
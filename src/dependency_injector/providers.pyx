@@ -8,18 +8,21 @@ import copy
 import errno
 import functools
 import importlib
+import importlib.util
 import inspect
 import json
+import keyword
 import os
 import re
 import sys
 import threading
 import warnings
 from asyncio import ensure_future
-from configparser import ConfigParser as IniConfigParser
-from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, suppress
 from contextvars import ContextVar
 from inspect import isasyncgenfunction, isgeneratorfunction
+from types import MappingProxyType
 
 try:
     from inspect import _is_coroutine_mark as _is_coroutine_marker
@@ -35,29 +38,59 @@ try:
 except ImportError:
     _is_coroutine = True
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
-
-has_pydantic_settings = True
+# Optional dependencies are imported on the first use. Module attributes ``yaml``,
+# ``PydanticSettings`` and ``has_pydantic_settings`` are set by _import_yaml() and
+# _import_pydantic_settings(), module __getattr__() imports them on the first access.
 cdef bint pydantic_v1 = False
 cdef str pydantic_module = "pydantic_settings"
 cdef str pydantic_extra = "pydantic2"
 
-try:
-    from pydantic_settings import BaseSettings as PydanticSettings
-except ImportError:
-    try:
-        # pydantic-settings requires pydantic v2,
-        # so it is safe to assume that we're dealing with v1:
-        from pydantic import BaseSettings as PydanticSettings
-        pydantic_v1 = True
-        pydantic_module = "pydantic"
-        pydantic_extra = "pydantic"
-    except ImportError:
-        # if it is present, ofc
-        has_pydantic_settings = False
+
+def _import_yaml():
+    """Return ``yaml`` module, ``None`` if PyYAML is not installed."""
+    module_globals = globals()
+    if "yaml" not in module_globals:
+        try:
+            import yaml as yaml_module
+        except ImportError:
+            yaml_module = None
+        module_globals["yaml"] = yaml_module
+    return module_globals["yaml"]
+
+
+cdef object _import_pydantic_settings():
+    """Return pydantic ``BaseSettings`` class, ``None`` if pydantic is not installed."""
+    global pydantic_v1, pydantic_module, pydantic_extra
+    module_globals = globals()
+    if "PydanticSettings" not in module_globals:
+        try:
+            from pydantic_settings import BaseSettings
+        except ImportError:
+            try:
+                # pydantic-settings requires pydantic v2,
+                # so it is safe to assume that we're dealing with v1:
+                from pydantic import BaseSettings
+                pydantic_v1 = True
+                pydantic_module = "pydantic"
+                pydantic_extra = "pydantic"
+            except ImportError:
+                # if it is present, ofc
+                BaseSettings = None
+        module_globals["has_pydantic_settings"] = BaseSettings is not None
+        module_globals["PydanticSettings"] = BaseSettings
+    return module_globals["PydanticSettings"]
+
+
+def __getattr__(name):
+    """Import optional dependencies and create :py:class:`YamlLoader` on the first access."""
+    if name == "YamlLoader":
+        return _get_yaml_loader()
+    if name == "yaml":
+        return _import_yaml()
+    if name in ("PydanticSettings", "has_pydantic_settings"):
+        _import_pydantic_settings()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 from .errors import (
@@ -74,55 +107,406 @@ config_env_marker_pattern = re.compile(
 )
 
 cdef str _resolve_config_env_markers(config_content: str, envs_required: bool):
-    """Replace environment variable markers with their values."""
-    findings = list(config_env_marker_pattern.finditer(config_content))
+    """Replace environment variable markers with their values.
 
-    for match in reversed(findings):
-        env_name = match.group("name")
-        has_default = match.group("separator") == ":"
+    Markers are replaced in a single pass, every environment variable is looked up once.
+    """
+    return config_env_marker_pattern.sub(
+        functools.partial(_resolve_config_env_marker, environ={}, envs_required=envs_required),
+        config_content,
+    )
 
-        value = os.getenv(env_name)
-        if value is None:
-            if not has_default and envs_required:
-                raise ValueError(f"Missing required environment variable \"{env_name}\"")
-            value = match.group("default")
 
-        span_min, span_max = match.span()
-        config_content = f"{config_content[:span_min]}{value}{config_content[span_max:]}"
+def _resolve_config_env_marker(match, dict environ, bint envs_required):
+    env_name = match.group("name")
+
+    value = environ.get(env_name, UNDEFINED)
+    if value is UNDEFINED:
+        value = environ[env_name] = os.environ.get(env_name)
+
+    if value is None:
+        if envs_required and match.group("separator") != ":":
+            raise ValueError(f"Missing required environment variable \"{env_name}\"")
+        value = match.group("default")
+    return value
+
+
+cdef object _read_config_file(object filepath, object required, bint strict):
+    """Return content of the configuration file, ``UNDEFINED`` if the file is skipped."""
+    try:
+        with open(filepath) as opened_file:
+            return opened_file.read()
+    except IOError as exception:
+        if required is not False \
+                and (strict or required is True) \
+                and exception.errno in (errno.ENOENT, errno.EISDIR):
+            exception.strerror = "Unable to load configuration file {0}".format(exception.strerror)
+            raise
+        return UNDEFINED
+
+
+cdef object _read_config_content(object filepath, object required, object envs_required, bint strict):
+    config_content = _read_config_file(filepath, required, strict)
+    if config_content is not UNDEFINED and envs_required is not None:
+        config_content = _resolve_config_env_markers(
+            config_content,
+            envs_required if envs_required is not UNDEFINED else strict,
+        )
     return config_content
 
 
-cdef object _parse_ini_file(filepath, envs_required: bool | None):
-    parser = IniConfigParser()
+cdef object _load_ini_config(Configuration root, object filepath, object required, object envs_required):
+    """Return options parsed from the ini file, ``UNDEFINED`` if the file is skipped."""
+    return _load_config(root, "ini", filepath, required, envs_required)
 
-    with open(filepath) as config_file:
-        config_string = config_file.read()
 
-        if envs_required is not None:
-            config_string = _resolve_config_env_markers(
-                config_string,
-                envs_required=envs_required,
-            )
-    parser.read_string(config_string)
-    return parser
+cdef object _load_yaml_config(
+        Configuration root,
+        object filepath,
+        object required,
+        object envs_required,
+        object loader,
+):
+    """Return options parsed from the yaml file, ``UNDEFINED`` if the file is skipped."""
+    yaml = _import_yaml()
+    if yaml is None:
+        raise Error(
+            "Unable to load yaml configuration - PyYAML is not installed. "
+            "Install PyYAML or install Dependency Injector with yaml extras: "
+            "\"pip install dependency-injector[yaml]\""
+        )
 
+    if loader is None:
+        return _load_config(root, "yaml", filepath, required, envs_required)
+
+    return _load_config(
+        root,
+        "yaml",
+        filepath,
+        required,
+        envs_required,
+        functools.partial(yaml.load, Loader=loader),
+        f"{loader.__module__}.{loader.__qualname__}",
+        loader,
+    )
 
-if yaml:
-    class YamlLoader(yaml.SafeLoader):
-        """YAML loader.
 
-        This loader mimics ``yaml.SafeLoader``.
-        """
-else:
-    class YamlLoader:
-        """YAML loader.
+cdef object _load_json_config(Configuration root, object filepath, object required, object envs_required):
+    """Return options parsed from the json file, ``UNDEFINED`` if the file is skipped."""
+    return _load_config(root, "json", filepath, required, envs_required)
+
+
+def _load_config_file(Configuration root, str file_type, object filepath, object required, object envs_required):
+    if file_type == "yaml":
+        return _load_yaml_config(root, filepath, required, envs_required, None)
+    return _load_config(root, file_type, filepath, required, envs_required)
+
+
+cdef object _load_config(
+        Configuration root,
+        str file_type,
+        object filepath,
+        object required,
+        object envs_required,
+        object parser=None,
+        str parser_name=None,
+        object loader=None,
+):
+    config_content = _read_config_content(filepath, required, envs_required, root.get_strict())
+    if config_content is UNDEFINED:
+        return UNDEFINED
+
+    if parser is None:
+        parser_name = _get_config_parser_name(file_type, root._parsers.get(file_type))
+        parser = _config_parsers[file_type][parser_name]
+        if file_type == "yaml" and parser_name in _YAML_LOADER_PARSERS:
+            loader = _get_yaml_loader()
+
+    if root._cache_dir is None:
+        return parser(config_content)
+
+    parser_key = f"{CONFIG_CACHE_VERSION}:{file_type}:{parser_name}"
+    if loader is not None:
+        # Loader classes are keyed by their names, ``cache_version`` attribute of the loader
+        # invalidates entries parsed with its previous constructors and resolvers.
+        loader_version = getattr(loader, "cache_version", None)
+        parser_key = f"{parser_key}:{loader.__module__}.{loader.__qualname__}:{loader_version}"
+
+    cache_key = _get_config_cache_key(parser_key, config_content)
+    config = _read_config_cache(root._cache_dir, cache_key)
+    if config is UNDEFINED:
+        config = parser(config_content)
+        _write_config_cache(root._cache_dir, cache_key, config)
+    return config
+
+
+cdef str _get_config_cache_key(str parser, str config_content):
+    """Return cache key of the configuration content with resolved environment variables."""
+    import hashlib
+
+    content_hash = hashlib.sha256()
+    content_hash.update(f"{parser}:".encode())
+    content_hash.update(config_content.encode("utf-8", "surrogatepass"))
+    return content_hash.hexdigest()
 
-        This loader mimics ``yaml.SafeLoader``.
-        """
+
+cdef object _read_config_cache(object cache_dir, str cache_key):
+    import pickle
+
+    try:
+        with open(os.path.join(cache_dir, f"{cache_key}.pickle"), "rb") as cache_file:
+            return pickle.load(cache_file)
+    except Exception:
+        return UNDEFINED
+
+
+cdef object _write_config_cache(object cache_dir, str cache_key, object config):
+    """Write parsed configuration to the cache, cache is skipped if it is not writable."""
+    import pickle
+    import tempfile
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_file = tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False)
+    except OSError:
+        return
+
+    try:
+        with cache_file:
+            pickle.dump(config, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_file.name, os.path.join(cache_dir, f"{cache_key}.pickle"))
+    except Exception:
+        with suppress(OSError):
+            os.remove(cache_file.name)
+        return
+
+    _prune_config_cache(cache_dir)
+
+
+cdef void _prune_config_cache(object cache_dir):
+    """Remove the oldest cache entries when there are more than ``CONFIG_CACHE_MAXSIZE`` of them."""
+    try:
+        entries = [
+            (entry.stat().st_mtime_ns, entry.path)
+            for entry in os.scandir(cache_dir)
+            if entry.name.endswith(".pickle")
+        ]
+    except OSError:
+        return
+    entries.sort()
+
+    for _, path in entries[:len(entries) - CONFIG_CACHE_MAXSIZE]:
+        with suppress(OSError):
+            os.remove(path)
+
+
+def _get_yaml_loader():
+    """Return :py:class:`YamlLoader`, the class is created with the first access."""
+    loader = globals().get("YamlLoader")
+    if loader is not None:
+        return loader
+
+    yaml = _import_yaml()
+    if yaml:
+        class YamlLoader(yaml.SafeLoader):
+            """YAML loader.
+
+            This loader mimics ``yaml.SafeLoader``.
+            """
+    else:
+        class YamlLoader:
+            """YAML loader.
+
+            This loader mimics ``yaml.SafeLoader``.
+            """
+    YamlLoader.__qualname__ = YamlLoader.__name__
+    return globals().setdefault("YamlLoader", YamlLoader)
 
 
 UNDEFINED = object()
 
+cdef dict _config_parsers = {}
+
+
+def register_config_parser(file_type, name, parser):
+    """Register parser of the configuration files.
+
+    Parsers of the file type are selected automatically in the order of registration,
+    the first registered parser is used unless :py:class:`Configuration` selects another
+    parser by its name.
+
+    :param file_type: Type of configuration files: ``"ini"``, ``"yaml"`` or ``"json"``.
+    :type file_type: str
+
+    :param name: Parser name.
+    :type name: str
+
+    :param parser: Callable that takes content of the file and returns parsed options.
+    :type parser: Callable[[str], Any]
+
+    :rtype: None
+    """
+    _get_config_parsers(file_type)
+    _config_parsers.setdefault(file_type, {})[name] = parser
+
+
+def unregister_config_parser(file_type, name):
+    """Unregister parser of the configuration files.
+
+    :param file_type: Type of configuration files: ``"ini"``, ``"yaml"`` or ``"json"``.
+    :type file_type: str
+
+    :param name: Parser name.
+    :type name: str
+
+    :rtype: None
+    """
+    parsers = _get_config_parsers(file_type)
+    if not parsers or name not in parsers:
+        raise Error(f"Parser \"{name}\" of {file_type} configuration files is not registered")
+    del parsers[name]
+
+
+def get_config_parser(file_type, name=None):
+    """Return parser of the configuration files.
+
+    :param file_type: Type of configuration files: ``"ini"``, ``"yaml"`` or ``"json"``.
+    :type file_type: str
+
+    :param name: Parser name, automatically selected parser is returned if not specified.
+    :type name: str | None
+
+    :rtype: Callable[[str], Any]
+    """
+    return _config_parsers[file_type][_get_config_parser_name(file_type, name)]
+
+
+def get_config_parser_names(file_type):
+    """Return names of registered parsers of the configuration files in selection order.
+
+    :param file_type: Type of configuration files: ``"ini"``, ``"yaml"`` or ``"json"``.
+    :type file_type: str
+
+    :rtype: List[str]
+    """
+    return list(_get_config_parsers(file_type) or ())
+
+
+cdef str _get_config_parser_name(str file_type, object name):
+    parsers = _get_config_parsers(file_type)
+    if not parsers:
+        raise Error(f"No parsers of {file_type} configuration files are registered")
+
+    if name is None:
+        return next(iter(parsers))
+
+    if name not in parsers:
+        raise Error(f"Parser \"{name}\" of {file_type} configuration files is not registered")
+    return name
+
+
+def _parse_ini_config(config_content):
+    from configparser import ConfigParser as IniConfigParser
+
+    parser = IniConfigParser()
+    parser.read_string(config_content)
+
+    config = {}
+    for section in parser.sections():
+        config[section] = dict(parser.items(section))
+    return config
+
+
+def _parse_yaml_config(config_content):
+    return _import_yaml().load(config_content, _get_yaml_loader())
+
+
+def _parse_yaml_config_with_libyaml(config_content):
+    yaml = _import_yaml()
+    YamlLoader = _get_yaml_loader()
+    if YamlLoader.yaml_constructors is not yaml.SafeLoader.yaml_constructors \
+            or YamlLoader.yaml_multi_constructors is not yaml.SafeLoader.yaml_multi_constructors \
+            or YamlLoader.yaml_implicit_resolvers is not yaml.SafeLoader.yaml_implicit_resolvers:
+        # YamlLoader is customized, C loader would ignore its constructors and resolvers.
+        return yaml.load(config_content, YamlLoader)
+    return yaml.load(config_content, yaml.CSafeLoader)
+
+
+cdef bint _register_yaml_config_parsers():
+    yaml = _import_yaml()
+    if not yaml:
+        return False
+    if getattr(yaml, "__with_libyaml__", False):
+        _config_parsers.setdefault("yaml", {})["libyaml"] = _parse_yaml_config_with_libyaml
+    _config_parsers.setdefault("yaml", {})["pyyaml"] = _parse_yaml_config
+    return True
+
+
+def _parse_json_config_with_orjson(config_content):
+    import orjson
+
+    return orjson.loads(config_content)
+
+
+def _parse_json_config_with_msgspec(config_content):
+    import msgspec.json
+
+    return msgspec.json.decode(config_content)
+
+
+cdef bint _register_json_config_parsers():
+    # Faster parsers are selected by name only, they parse big integers, NaN and Infinity
+    # differently from the json module. Their libraries are imported when they parse a file.
+    _config_parsers.setdefault("json", {})["json"] = json.loads
+    if importlib.util.find_spec("orjson") is not None:
+        _config_parsers.setdefault("json", {})["orjson"] = _parse_json_config_with_orjson
+    if importlib.util.find_spec("msgspec") is not None:
+        _config_parsers.setdefault("json", {})["msgspec"] = _parse_json_config_with_msgspec
+    return True
+
+
+cdef dict _get_config_parsers(str file_type):
+    """Return parsers of the file type, built-in parsers are registered with the first access.
+
+    Built-in parsers import their libraries, so they are registered only when needed.
+    """
+    if file_type == "yaml" and not _yaml_config_parsers_registered:
+        _register_builtin_config_parsers(file_type)
+    elif file_type == "json" and not _json_config_parsers_registered:
+        _register_builtin_config_parsers(file_type)
+    return _config_parsers.get(file_type)
+
+
+cdef void _register_builtin_config_parsers(str file_type):
+    global _yaml_config_parsers_registered, _json_config_parsers_registered
+
+    # Built-in parsers go before the parsers registered by users.
+    registered = _config_parsers.pop(file_type, {})
+    if file_type == "yaml":
+        _yaml_config_parsers_registered = _register_yaml_config_parsers()
+    else:
+        _json_config_parsers_registered = _register_json_config_parsers()
+    _config_parsers.setdefault(file_type, {}).update(registered)
+
+
+cdef bint _yaml_config_parsers_registered = False
+cdef tuple _YAML_LOADER_PARSERS = ("libyaml", "pyyaml")
+cdef bint _json_config_parsers_registered = False
+
+register_config_parser("ini", "configparser", _parse_ini_config)
+
+SELECTOR_CACHE_MAXSIZE = 4096
+KWARGS_ROUTES_MAXSIZE = 64
+INJECTION_FLAGS_MAXSIZE = 1024
+DEPENDENCY_TYPES_CACHE_MAXSIZE = 256
+CONFIGURATION_CHANGES_MAXSIZE = 64
+FROZEN_OPTIONS_CLASSES_MAXSIZE = 1024
+CONFIG_CACHE_VERSION = 1
+CONFIG_CACHE_MAXSIZE = 1024
+cdef dict _selector_keys_cache = {}
+cdef dict _injection_flags = {}
+cdef dict _frozen_options_classes = {}
+
 cdef int ASYNC_MODE_UNDEFINED = 0
 cdef int ASYNC_MODE_ENABLED = 1
 cdef int ASYNC_MODE_DISABLED = 2
@@ -131,7 +515,8 @@ cdef set __iscoroutine_typecache = set()
 cdef tuple __COROUTINE_TYPES = asyncio.coroutines._COROUTINE_TYPES
 
 cdef dict pydantic_settings_to_dict(settings, dict kwargs):
-    if not has_pydantic_settings:
+    PydanticSettings = _import_pydantic_settings()
+    if not globals()["has_pydantic_settings"]:
         raise Error(
             f"Unable to load pydantic configuration - {pydantic_module} is not installed. "
             "Install pydantic or install Dependency Injector with pydantic extras: "
@@ -771,6 +1156,10 @@ cdef class Dependency(Provider):
 
         database = database_provider()
 
+    Types of the checked instances are memorized, so the instance type check runs once per type.
+    With ``check_once=True`` only the first instance of every overriding or default provider is
+    checked.
+
     .. py:attribute:: instance_of
        :noindex:
 
@@ -779,14 +1168,19 @@ cdef class Dependency(Provider):
         :type: type
    """
 
-    def __init__(self, object instance_of=object, default=None):
+    def __init__(self, object instance_of=object, default=None, check_once=False):
         """Initialize provider."""
         self._instance_of = None
+        self._instance_of_types = None
         self.set_instance_of(instance_of)
 
         self._default = None
         self.set_default(default)
 
+        self._check_once = False
+        self._checked_provider = None
+        self.set_check_once(check_once)
+
         self._parent = None
 
         super(Dependency, self).__init__()
@@ -800,6 +1194,7 @@ cdef class Dependency(Provider):
         copied = _memorized_duplicate(self, memo)
         copied.set_instance_of(self.instance_of)
         copied.set_default(deepcopy(self.default, memo))
+        copied.set_check_once(self._check_once)
 
         self._copy_parent(copied, memo)
         self._copy_overridings(copied, memo)
@@ -814,14 +1209,16 @@ cdef class Dependency(Provider):
         :rtype: object
         """
         if self._last_overriding:
-            result = self._last_overriding(*args, **kwargs)
+            provider = self._last_overriding
         elif self._default:
-            result = self._default(*args, **kwargs)
+            provider = self._default
         else:
             self._raise_undefined_error()
 
+        result = provider(*args, **kwargs)
+
         if self._async_mode == ASYNC_MODE_DISABLED:
-            self._check_instance_type(result)
+            self._check_instance(result, provider)
             return result
         elif self._async_mode == ASYNC_MODE_ENABLED:
             if __is_future_or_coroutine(result):
@@ -830,7 +1227,7 @@ cdef class Dependency(Provider):
                 result.add_done_callback(functools.partial(self._async_provide, future_result))
                 return future_result
             else:
-                self._check_instance_type(result)
+                self._check_instance(result, provider)
                 return __future_result(result)
         elif self._async_mode == ASYNC_MODE_UNDEFINED:
             if __is_future_or_coroutine(result):
@@ -842,7 +1239,7 @@ cdef class Dependency(Provider):
                 return future_result
             else:
                 self.disable_async_mode()
-                self._check_instance_type(result)
+                self._check_instance(result, provider)
                 return result
 
     def __getattr__(self, name):
@@ -883,6 +1280,19 @@ cdef class Dependency(Provider):
                 f"\"instance_of\" is not a class (got {instance_of!r}))",
             )
         self._instance_of = instance_of
+        self._instance_of_types = None
+        self._checked_provider = None
+        return self
+
+    @property
+    def check_once(self):
+        """Return True if only the first instance of every provider is checked."""
+        return self._check_once
+
+    def set_check_once(self, check_once):
+        """Set checking of the first instance of every provider only."""
+        self._check_once = <bint>check_once
+        self._checked_provider = None
         return self
 
     @property
@@ -947,12 +1357,29 @@ cdef class Dependency(Provider):
     def _async_provide(self, future_result, future):
         try:
             instance = future.result()
-            self._check_instance_type(instance)
+            self._check_instance(instance, None)
         except Exception as exception:
             future_result.set_exception(exception)
         else:
             future_result.set_result(instance)
 
+    cdef object _check_instance(self, object instance, object provider):
+        if self._check_once and provider is not None and provider is self._checked_provider:
+            return
+
+        cls = type(instance)
+        if self._instance_of_types is None:
+            self._check_instance_type(instance)
+            self._instance_of_types = {cls}
+        elif cls not in self._instance_of_types:
+            self._check_instance_type(instance)
+            if len(self._instance_of_types) >= DEPENDENCY_TYPES_CACHE_MAXSIZE:
+                self._instance_of_types.clear()
+            self._instance_of_types.add(cls)
+
+        if self._check_once:
+            self._checked_provider = provider
+
     def _check_instance_type(self, instance):
         if not isinstance(instance, self.instance_of):
             raise Error("{0} is not an instance of {1}".format(instance, self.instance_of))
@@ -1195,15 +1622,12 @@ cdef class Callable(Provider):
     def __init__(self, provides=None, *args, **kwargs):
         """Initialize provider."""
         self._provides = None
+        self._provides_import = None
         self.set_provides(provides)
 
-        self._args = tuple()
-        self._args_len = 0
-        self.set_args(*args)
-
-        self._kwargs = tuple()
-        self._kwargs_len = 0
-        self.set_kwargs(**kwargs)
+        self._set_args(args)
+        self._set_kwargs(tuple(kwargs), tuple(kwargs.values()))
+        self._kwargs_routes = None
 
         super(Callable, self).__init__()
 
@@ -1214,7 +1638,8 @@ cdef class Callable(Provider):
             return copied
 
         copied = _memorized_duplicate(self, memo)
-        copied.set_provides(_copy_if_provider(self.provides, memo))
+        if not self._copy_provides_import(copied):
+            copied.set_provides(_copy_if_provider(self.provides, memo))
         copied.set_args(*deepcopy_args(self, self.args, memo))
         copied.set_kwargs(**deepcopy_kwargs(self, self.kwargs, memo))
         self._copy_overridings(copied, memo)
@@ -1225,46 +1650,40 @@ cdef class Callable(Provider):
 
         :rtype: str
         """
-        return represent_provider(provider=self, provides=self._provides)
+        return represent_provider(provider=self, provides=self._represent_provides())
 
     @property
     def provides(self):
         """Return provider provides."""
+        if self._provides_import is not None:
+            self._resolve_provides()
         return self._provides
 
     def set_provides(self, provides):
-        """Set provider provides."""
-        provides = _resolve_string_import(provides)
-        if provides and not callable(provides):
-            raise Error(
-                "Provider {0} expected to get callable, got {1} instead".format(
-                    _class_qualname(self),
-                    provides,
-                ),
-            )
-        self._provides = provides
+        """Set provider provides.
+
+        String imports (``"module.Class"``) are resolved on the first call.
+        """
+        if isinstance(provides, str):
+            self._provides = None
+            self._provides_import = _defer_string_import(provides)
+            return self
+
+        self._provides_import = None
+        self._set_callable_provides(provides)
         return self
 
     @property
     def args(self):
         """Return positional argument injections."""
-        cdef int index
-        cdef PositionalInjection arg
-        cdef list args
-
-        args = list()
-        for index in range(self._args_len):
-            arg = self._args[index]
-            args.append(arg._value)
-        return tuple(args)
+        return self._args
 
     def add_args(self, *args):
         """Add positional argument injections.
 
         :return: Reference ``self``
         """
-        self._args += parse_positional_injections(args)
-        self._args_len = len(self._args)
+        self._set_args(self._args + args)
         return self
 
     def set_args(self, *args):
@@ -1274,8 +1693,7 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
-        self._args = parse_positional_injections(args)
-        self._args_len = len(self._args)
+        self._set_args(args)
         return self
 
     def clear_args(self):
@@ -1283,30 +1701,23 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
-        self._args = tuple()
-        self._args_len = len(self._args)
+        self._set_args(tuple())
         return self
 
     @property
     def kwargs(self):
         """Return keyword argument injections."""
-        cdef int index
-        cdef NamedInjection kwarg
-        cdef dict kwargs
-
-        kwargs = dict()
-        for index in range(self._kwargs_len):
-            kwarg = self._kwargs[index]
-            kwargs[kwarg._name] = kwarg._value
-        return kwargs
+        return dict(zip(self._kwargs_names, self._kwargs_values))
 
     def add_kwargs(self, **kwargs):
         """Add keyword argument injections.
 
         :return: Reference ``self``
         """
-        self._kwargs += parse_named_injections(kwargs)
-        self._kwargs_len = len(self._kwargs)
+        # Constant injections are folded into a dictionary, so a name injected again is replaced
+        # in place to keep the last injection winning.
+        kwargs = {**dict(zip(self._kwargs_names, self._kwargs_values)), **kwargs}
+        self._set_kwargs(tuple(kwargs), tuple(kwargs.values()))
         return self
 
     def set_kwargs(self, **kwargs):
@@ -1316,8 +1727,7 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
-        self._kwargs = parse_named_injections(kwargs)
-        self._kwargs_len = len(self._kwargs)
+        self._set_kwargs(tuple(kwargs), tuple(kwargs.values()))
         return self
 
     def clear_kwargs(self):
@@ -1325,14 +1735,13 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
-        self._kwargs = tuple()
-        self._kwargs_len = len(self._kwargs)
+        self._set_kwargs(tuple(), tuple())
         return self
 
     @property
     def related(self):
         """Return related providers generator."""
-        yield from filter(is_provider, [self.provides])
+        yield from filter(is_provider, [self._provides])
         yield from filter(is_provider, self.args)
         yield from filter(is_provider, self.kwargs.values())
         yield from super().related
@@ -1341,6 +1750,69 @@ cdef class Callable(Provider):
         """Return result of provided callable call."""
         return __callable_call(self, args, kwargs)
 
+    cdef object _resolve_provides(self):
+        """Import provides deferred by :py:meth:`set_provides`."""
+        provides, module = self._provides_import
+        self._set_callable_provides(_import_string(provides, module))
+        self._provides_import = None
+
+    cdef bint _copy_provides_import(self, Callable copied):
+        """Copy string import that is not resolved yet, return False if there is none."""
+        if self._provides_import is None:
+            return False
+        copied._provides = None
+        copied._provides_import = self._provides_import
+        return True
+
+    cdef object _represent_provides(self):
+        """Return provides or its string import that is not resolved yet."""
+        if self._provides_import is not None:
+            return self._provides_import[0]
+        return self._provides
+
+    cdef object _set_callable_provides(self, object provides):
+        if provides and not callable(provides):
+            raise Error(
+                "Provider {0} expected to get callable, got {1} instead".format(
+                    _class_qualname(self),
+                    provides,
+                ),
+            )
+        self._provides = provides
+
+    cdef void _set_args(self, tuple args):
+        """Set positional injections, constant arguments are passed to the call as is."""
+        cdef int index
+        cdef const unsigned char* flags
+
+        self._args = args
+        self._args_flags = _parse_injection_flags(args)
+        self._args_len = len(args)
+        self._args_folded = True
+
+        flags = self._args_flags
+        for index in range(self._args_len):
+            if not flags[index] & INJECTION_CONSTANT:
+                self._args_folded = False
+                break
+
+    cdef void _set_kwargs(self, tuple names, tuple values):
+        """Set keyword injections and prebuild dictionary of constant keyword arguments."""
+        cdef int index
+        cdef const unsigned char* flags
+        cdef dict static_kwargs = {}
+
+        self._kwargs_names = names
+        self._kwargs_values = values
+        self._kwargs_flags = _parse_injection_flags(values)
+        self._kwargs_len = len(names)
+
+        flags = self._kwargs_flags
+        for index in range(self._kwargs_len):
+            if flags[index] & INJECTION_CONSTANT:
+                static_kwargs[names[index]] = values[index]
+        self._static_kwargs = static_kwargs or None
+
 
 cdef class DelegatedCallable(Callable):
     """Callable that is injected "as is".
@@ -1533,6 +2005,7 @@ cdef class ConfigurationOption(Provider):
         self._children = {}
         self._required = required
         self._cache = UNDEFINED
+        self._cache_generation = 0
         super().__init__()
 
     def __deepcopy__(self, memo):
@@ -1566,30 +2039,37 @@ cdef class ConfigurationOption(Provider):
                 "'{attribute_name}'".format(cls=self.__class__.__name__, attribute_name=item)
             )
 
-        child = self._children.get(item)
-        if child is None:
-            child_name = self._name + (item,)
-            child = ConfigurationOption(child_name, self._root)
-            self._children[item] = child
-        return child
+        return _get_child_option(self._root, self._children, self._name, item)
 
     def __getitem__(self, item):
-        child = self._children.get(item)
-        if child is None:
-            child_name = self._name + (item,)
-            child = ConfigurationOption(child_name, self._root)
-            self._children[item] = child
-        return child
+        return _get_child_option(self._root, self._children, self._name, item)
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return new instance."""
-        if self._cache is not UNDEFINED:
-            return self._cache
+        cdef unsigned long long generation = self._root._generation
 
-        value = self._root.get(self._get_self_name(), self._required)
+        if self._cache is not UNDEFINED:
+            if self._cache_generation == generation:
+                return self._cache
+            if self._is_cache_actual():
+                self._cache_generation = generation
+                return self._cache
+
+        selector = self._get_self_name()
+        value = self._root._get(selector, _parse_selector(selector), self._required)
         self._cache = value
+        self._cache_generation = generation
         return value
 
+    cdef bint _is_cache_actual(self):
+        for segment in self._name:
+            if is_provider(segment):
+                return False
+        return not self._root._is_changed(
+            _parse_selector(self._get_self_name()),
+            self._cache_generation,
+        )
+
     def _get_self_name(self):
         return ".".join(
             segment() if is_provider(segment) else segment for segment in self._name
@@ -1616,6 +2096,17 @@ cdef class ConfigurationOption(Provider):
     def required(self):
         return self.__class__(self._name, self._root, required=True)
 
+    def snapshot(self, schema=None):
+        """Return provider of the immutable snapshot of configuration option.
+
+        :param schema: Dictionary of the option names and callables used for type casting,
+                       only options from the schema are included if specified.
+        :type schema: dict | None
+
+        :rtype: :py:class:`ConfigurationSnapshot`
+        """
+        return ConfigurationSnapshot(self._root, self._get_self_name(), schema)
+
     def is_required(self):
         return self._required
 
@@ -1632,13 +2123,19 @@ cdef class ConfigurationOption(Provider):
 
     def reset_cache(self):
         self._cache = UNDEFINED
+        self._root.reset_cache()
 
-        for provider in self._children.values():
-            provider.reset_cache()
+    def register_overrides(self, provider):
+        """Register provider that overrides current provider."""
+        super().register_overrides(provider)
+        if self._root is not None:
+            self._root._linked_options.add(self)
 
-        for provider in self.overrides:
-            if isinstance(provider, (Configuration, ConfigurationOption)):
-                provider.reset_cache()
+    def unregister_overrides(self, provider):
+        """Unregister provider that overrides current provider."""
+        super().unregister_overrides(provider)
+        if self._root is not None and not self.overrides:
+            self._root._linked_options.discard(self)
 
     def update(self, value):
         """Set configuration options.
@@ -1670,23 +2167,10 @@ cdef class ConfigurationOption(Provider):
 
         :rtype: None
         """
-        try:
-            parser = _parse_ini_file(
-                filepath,
-                envs_required if envs_required is not UNDEFINED else self._is_strict_mode_enabled(),
-            )
-        except IOError as exception:
-            if required is not False \
-                    and (self._is_strict_mode_enabled() or required is True) \
-                    and exception.errno in (errno.ENOENT, errno.EISDIR):
-                exception.strerror = "Unable to load configuration file {0}".format(exception.strerror)
-                raise
+        config = _load_ini_config(self._root, filepath, required, envs_required)
+        if config is UNDEFINED:
             return
 
-        config = {}
-        for section in parser.sections():
-            config[section] = dict(parser.items(section))
-
         current_config = self.__call__()
         if not current_config:
             current_config = {}
@@ -1711,34 +2195,10 @@ cdef class ConfigurationOption(Provider):
 
         :rtype: None
         """
-        if yaml is None:
-            raise Error(
-                "Unable to load yaml configuration - PyYAML is not installed. "
-                "Install PyYAML or install Dependency Injector with yaml extras: "
-                "\"pip install dependency-injector[yaml]\""
-            )
-
-        if loader is None:
-            loader = YamlLoader
-
-        try:
-            with open(filepath) as opened_file:
-                config_content = opened_file.read()
-        except IOError as exception:
-            if required is not False \
-                    and (self._is_strict_mode_enabled() or required is True) \
-                    and exception.errno in (errno.ENOENT, errno.EISDIR):
-                exception.strerror = "Unable to load configuration file {0}".format(exception.strerror)
-                raise
+        config = _load_yaml_config(self._root, filepath, required, envs_required, loader)
+        if config is UNDEFINED:
             return
 
-        if envs_required is not None:
-            config_content = _resolve_config_env_markers(
-                config_content,
-                envs_required if envs_required is not UNDEFINED else self._is_strict_mode_enabled(),
-            )
-        config = yaml.load(config_content, loader)
-
         current_config = self.__call__()
         if not current_config:
             current_config = {}
@@ -1760,24 +2220,10 @@ cdef class ConfigurationOption(Provider):
 
         :rtype: None
         """
-        try:
-            with open(filepath) as opened_file:
-                config_content = opened_file.read()
-        except IOError as exception:
-            if required is not False \
-                    and (self._is_strict_mode_enabled() or required is True) \
-                    and exception.errno in (errno.ENOENT, errno.EISDIR):
-                exception.strerror = "Unable to load configuration file {0}".format(exception.strerror)
-                raise
+        config = _load_json_config(self._root, filepath, required, envs_required)
+        if config is UNDEFINED:
             return
 
-        if envs_required is not None:
-            config_content = _resolve_config_env_markers(
-                config_content,
-                envs_required if envs_required is not UNDEFINED else self._is_strict_mode_enabled(),
-            )
-        config = json.loads(config_content)
-
         current_config = self.__call__()
         if not current_config:
             current_config = {}
@@ -1862,6 +2308,50 @@ cdef class ConfigurationOption(Provider):
 
         self.override(value)
 
+    def from_envs(self, prefix, delimiter="__", as_=UNDEFINED, required=UNDEFINED, case_sensitive=False):
+        """Load configuration from the environment variables with the prefix.
+
+        Environment variables are read once and loaded configuration is merged recursively
+        over existing configuration, e.g. ``APP_DB__HOST`` with ``"APP_"`` prefix is loaded
+        as ``db.host`` option.
+
+        :param prefix: Prefix of the environment variables, e.g. ``"APP_"``.
+        :type prefix: str
+
+        :param delimiter: Delimiter of the nested option names.
+        :type delimiter: str
+
+        :param as_: Callable used for type casting of every value or dictionary of
+                    callables by option selectors, e.g. ``{"db.port": int}``.
+        :type as_: object
+
+        :param required: When required is True, raise an exception if no environment
+                         variables are found.
+        :type required: bool
+
+        :param case_sensitive: When False, option names are converted to lower case.
+        :type case_sensitive: bool
+
+        :rtype: None
+        """
+        options = _envs_to_dict(prefix, delimiter, as_, case_sensitive)
+
+        if not options:
+            if required is not False \
+                    and (self._is_strict_mode_enabled() or required is True):
+                raise ValueError("Environment variables with prefix \"{0}\" are undefined".format(prefix))
+            return
+
+        try:
+            current_config = self.__call__()
+        except Error:
+            current_config = {}
+        else:
+            if not current_config:
+                current_config = {}
+
+        self.override(merge_dicts(current_config, options))
+
     def from_value(self, value):
         """Load configuration value.
 
@@ -1890,6 +2380,166 @@ cdef class TypedConfigurationOption(Callable):
         return self.args[0]
 
 
+cdef class ConfigurationPath:
+    """Compiled configuration selector.
+
+    Selector is parsed once, so every call only walks the configuration tree:
+
+    .. code-block:: python
+
+        rps = config.path("limits.rps")
+        rps()  # same as config.get("limits.rps")
+    """
+
+    def __init__(self, Configuration root, selector):
+        self._root = root
+        self._selector = selector
+        self._keys = _parse_selector(selector)
+
+    def __call__(self, required=False):
+        """Return configuration option value."""
+        return self._root._get(self._selector, self._keys, required)
+
+    def __str__(self):
+        return represent_provider(provider=self, provides=f"{self._root.get_name()}.{self._selector}")
+
+    def __repr__(self):
+        return self.__str__()
+
+    @property
+    def root(self):
+        """Return configuration provider."""
+        return self._root
+
+    @property
+    def selector(self):
+        """Return selector string."""
+        return self._selector
+
+    @property
+    def keys(self):
+        """Return tuple of selector keys."""
+        return self._keys
+
+
+cdef class ConfigurationSnapshot(Provider):
+    """Configuration snapshot provider provides immutable copy of configuration options.
+
+    Snapshot is built on the first call and built again only after the configuration is
+    changed. Options are available as attributes, values are converted according to the
+    schema:
+
+    .. code-block:: python
+
+        settings = config.snapshot({"db": {"host": str, "port": int}})
+        settings().db.port  # 5432
+    """
+
+    def __init__(self, Configuration root, selector=None, schema=None):
+        self._root = root
+        self._selector = selector
+        self._keys = _parse_selector(selector) if selector is not None else None
+        self._schema = schema
+        self._snapshot = UNDEFINED
+        self._snapshot_generation = 0
+        super().__init__()
+
+    def __deepcopy__(self, memo):
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        copied = self.__class__(deepcopy(self._root, memo), self._selector, self._schema)
+        memo[id(self)] = copied
+        self._copy_overridings(copied, memo)
+        return copied
+
+    def __str__(self):
+        if self._selector is None:
+            return represent_provider(provider=self, provides=self._root.get_name())
+        return represent_provider(provider=self, provides=f"{self._root.get_name()}.{self._selector}")
+
+    @property
+    def root(self):
+        """Return configuration provider."""
+        return self._root
+
+    @property
+    def selector(self):
+        """Return selector string."""
+        return self._selector
+
+    @property
+    def schema(self):
+        """Return snapshot schema."""
+        return self._schema
+
+    @property
+    def related(self):
+        """Return related providers generator."""
+        yield self._root
+        yield from super().related
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return snapshot of configuration options."""
+        cdef unsigned long long generation = self._root._generation
+
+        if self._snapshot is not UNDEFINED and self._snapshot_generation == generation:
+            return self._snapshot
+
+        if self._keys is None:
+            value = self._root.__call__()
+        else:
+            value = self._root._get(self._selector, self._keys, False)
+
+        snapshot = _freeze_options(value, self._schema)
+        self._snapshot = snapshot
+        self._snapshot_generation = generation
+        return snapshot
+
+
+class FrozenOptions:
+    """Immutable configuration options of the :py:class:`ConfigurationSnapshot`.
+
+    Options are stored in ``__slots__`` of the class that is created for every set of
+    option names. Options are available as attributes and by their names as keys.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"\"{type(self).__name__}\" object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"\"{type(self).__name__}\" object is immutable")
+
+    def __getitem__(self, key):
+        if key not in type(self).__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in type(self).__slots__
+
+    def __iter__(self):
+        return iter(type(self).__slots__)
+
+    def __len__(self):
+        return len(type(self).__slots__)
+
+    def __eq__(self, other):
+        # Classes are created again for the same option names after their cache is cleared.
+        if not isinstance(other, FrozenOptions) or type(other).__slots__ != type(self).__slots__:
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in type(self).__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        options = ", ".join(f"{key}={getattr(self, key)!r}" for key in type(self).__slots__)
+        return f"{type(self).__name__}({options})"
+
+
 cdef class Configuration(Object):
     """Configuration provider provides configuration options to the other providers.
 
@@ -1912,14 +2562,21 @@ cdef class Configuration(Object):
 
     DEFAULT_NAME = "config"
 
-    def __init__(self, name=DEFAULT_NAME, default=None, strict=False, ini_files=None, yaml_files=None, json_files=None, pydantic_settings=None):
+    def __init__(self, name=DEFAULT_NAME, default=None, strict=False, ini_files=None, yaml_files=None, json_files=None, pydantic_settings=None, cache_dir=None, parsers=None, max_children=None):
         self._name = name
         self.__strict = strict
+        self._max_children = 0
+        self._cache_dir = cache_dir
+        self._parsers = {}
         self._children = {}
         self._ini_files = []
         self._yaml_files = []
         self._json_files = []
         self._pydantic_settings = []
+        self._generation = 0
+        self._full_generation = 0
+        self._changes = ()
+        self._linked_options = set()
 
         super().__init__(provides={})
         self.set_default(default)
@@ -1940,6 +2597,12 @@ cdef class Configuration(Object):
             pydantic_settings = []
         self.set_pydantic_settings(pydantic_settings)
 
+        if parsers is None:
+            parsers = {}
+        self.set_parsers(parsers)
+
+        self.set_max_children(max_children)
+
     def __deepcopy__(self, memo):
         copied = memo.get(id(self))
         if copied is not None:
@@ -1949,11 +2612,15 @@ cdef class Configuration(Object):
         copied.set_name(self.get_name())
         copied.set_default(self.get_default())
         copied.set_strict(self.get_strict())
+        copied.set_cache_dir(self.get_cache_dir())
+        copied.set_parsers(self.get_parsers())
+        copied.set_max_children(self.get_max_children())
         copied.set_children(deepcopy(self.get_children(), memo))
         copied.set_ini_files(self.get_ini_files())
         copied.set_yaml_files(self.get_yaml_files())
         copied.set_json_files(self.get_json_files())
         copied.set_pydantic_settings(self.get_pydantic_settings())
+        (<Configuration> copied)._linked_options = deepcopy(self._linked_options, memo)
 
         self._copy_overridings(copied, memo)
         return copied
@@ -1974,18 +2641,10 @@ cdef class Configuration(Object):
                 "'{attribute_name}'".format(cls=self.__class__.__name__, attribute_name=item)
             )
 
-        child = self._children.get(item)
-        if child is None:
-            child = ConfigurationOption((item,), self)
-            self._children[item] = child
-        return child
+        return _get_child_option(self, self._children, (), item)
 
     def __getitem__(self, item):
-        child = self._children.get(item)
-        if child is None:
-            child = ConfigurationOption(item, self)
-            self._children[item] = child
-        return child
+        return _get_child_option(self, self._children, (), item)
 
     def get_name(self):
         """Return name."""
@@ -2018,6 +2677,44 @@ cdef class Configuration(Object):
         self.__strict = strict
         return self
 
+    def get_cache_dir(self):
+        """Return directory of parsed configuration files cache."""
+        return self._cache_dir
+
+    def set_cache_dir(self, cache_dir):
+        """Set directory of parsed configuration files cache."""
+        self._cache_dir = cache_dir
+        return self
+
+    def get_parsers(self):
+        """Return names of the selected configuration file parsers by file type."""
+        return dict(self._parsers)
+
+    def set_parsers(self, parsers):
+        """Set names of the configuration file parsers by file type.
+
+        Parsers of the file types that are not specified are selected automatically.
+        """
+        for file_type, name in parsers.items():
+            _get_config_parser_name(file_type, name)
+        self._parsers = dict(parsers)
+        return self
+
+    def get_max_children(self):
+        """Return maximum number of children of every option, ``None`` if not limited."""
+        return self._max_children or None
+
+    def set_max_children(self, max_children):
+        """Set maximum number of children of every option.
+
+        When the limit is reached, the least recently used child option is dropped. Dropped
+        options keep working, accessing the same key creates a new option.
+        """
+        if max_children is not None and max_children < 1:
+            raise ValueError("Maximum number of children must be positive")
+        self._max_children = max_children or 0
+        return self
+
     def get_children(self):
         """Return children options."""
         return self._children
@@ -2063,7 +2760,7 @@ cdef class Configuration(Object):
         self._pydantic_settings = list(settings)
         return self
 
-    def load(self, required=UNDEFINED, envs_required=UNDEFINED):
+    def load(self, required=UNDEFINED, envs_required=UNDEFINED, max_workers=None):
         """Load configuration.
 
         This method loads configuration from configuration files or pydantic settings that
@@ -2074,23 +2771,54 @@ cdef class Configuration(Object):
            config = providers.Configuration(yaml_files=[file1, file2])
            config.load()
 
+        Files are read and parsed concurrently in a thread pool. Loaded options are merged
+        in the declared order and the configuration is overridden once.
+
         :param required: When required is True, raise an exception if file does not exist.
         :type required: bool
 
         :param envs_required: When True, raises an error on undefined environment variable.
         :type envs_required: bool
-        """
-        for file in self.get_ini_files():
-            self.from_ini(file, required=required, envs_required=envs_required)
 
-        for file in self.get_yaml_files():
-            self.from_yaml(file, required=required, envs_required=envs_required)
+        :param max_workers: Maximum number of threads that load files, files are loaded in
+                            the current thread if it is 1.
+        :type max_workers: int | None
+        """
+        files = [("ini", filepath) for filepath in self._ini_files]
+        files += [("yaml", filepath) for filepath in self._yaml_files]
+        files += [("json", filepath) for filepath in self._json_files]
+
+        if len(files) > 1 and max_workers != 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_load_config_file, self, file_type, filepath, required, envs_required)
+                    for file_type, filepath in files
+                ]
+                loaded = [future.result() for future in futures]
+        else:
+            loaded = [
+                _load_config_file(self, file_type, filepath, required, envs_required)
+                for file_type, filepath in files
+            ]
 
-        for file in self.get_json_files():
-            self.from_json(file, required=required, envs_required=envs_required)
+        for settings in self._pydantic_settings:
+            options = pydantic_settings_to_dict(settings, {})
+            if required is not False \
+                    and (self.__strict or required is True) \
+                    and not options:
+                raise ValueError("Can not use empty dictionary")
+            loaded.append(options)
 
-        for settings in self.get_pydantic_settings():
-            self.from_pydantic(settings, required=required)
+        loaded = [options for options in loaded if options is not UNDEFINED]
+        if not loaded:
+            return
+
+        current_config = self.__call__()
+        if not current_config:
+            current_config = {}
+        for options in loaded:
+            current_config = merge_dicts(current_config, options)
+        self.override(current_config)
 
     def get(self, selector, required=False):
         """Return configuration option.
@@ -2104,20 +2832,44 @@ cdef class Configuration(Object):
         :return: Option value.
         :rtype: Any
         """
+        return self._get(selector, _parse_selector(selector), required)
+
+    def snapshot(self, schema=None):
+        """Return provider of the immutable snapshot of configuration.
+
+        :param schema: Dictionary of the option names and callables used for type casting,
+                       only options from the schema are included if specified.
+        :type schema: dict | None
+
+        :rtype: :py:class:`ConfigurationSnapshot`
+        """
+        return ConfigurationSnapshot(self, schema=schema)
+
+    def path(self, selector):
+        """Return compiled accessor of configuration option.
+
+        Selector is parsed once, calling the accessor is equivalent to ``config.get(selector)``.
+
+        :param selector: Selector string, e.g. "option1.option2"
+        :type selector: str
+
+        :rtype: :py:class:`ConfigurationPath`
+        """
+        return ConfigurationPath(self, selector)
+
+    cdef object _get(self, object selector, tuple keys, bint required):
         value = self.__call__()
 
         if value is None:
-            if self._is_strict_mode_enabled() or required:
+            if self.__strict or required:
                 raise Error("Undefined configuration option \"{0}.{1}\"".format(self._name, selector))
             return None
 
-        keys = selector.split(".")
-        while len(keys) > 0:
-            key = keys.pop(0)
+        for key in keys:
             value = value.get(key, UNDEFINED)
 
             if value is UNDEFINED:
-                if self._is_strict_mode_enabled() or required:
+                if self.__strict or required:
                     raise Error("Undefined configuration option \"{0}.{1}\"".format(self._name, selector))
                 return None
 
@@ -2126,6 +2878,9 @@ cdef class Configuration(Object):
     def set(self, selector, value):
         """Override configuration option.
 
+        Only dictionaries on the selector path are copied, the rest of the configuration
+        is shared with the current value.
+
         :param selector: Selector string, e.g. "option1.option2"
         :type selector: str
 
@@ -2135,19 +2890,9 @@ cdef class Configuration(Object):
         :return: Overriding context.
         :rtype: :py:class:`OverridingContext`
         """
-        original_value = current_value = deepcopy(self.__call__())
-
-        keys = selector.split(".")
-        while len(keys) > 0:
-            key = keys.pop(0)
-            if len(keys) == 0:
-                current_value[key] = value
-                break
-            temp_value = current_value.get(key, {})
-            current_value[key] = temp_value
-            current_value = temp_value
-
-        return self.override(original_value)
+        return self.override(
+            _replace_option(self.__call__(), _parse_selector(selector), 0, value),
+        )
 
     def override(self, provider):
         """Override provider with another provider.
@@ -2186,15 +2931,95 @@ cdef class Configuration(Object):
     def reset_cache(self):
         """Reset children providers cache.
 
+        Children options cache values together with the generation of the configuration,
+        so the reset only increments the generation and does not visit the children. Only
+        the options linked to other configurations are visited to reset their caches too.
+
         :rtype: None
         """
-        for provider in self._children.values():
-            provider.reset_cache()
+        self._full_generation = self._generation + 1
+        self._changes = ()
+        self._generation += 1
+        self._reset_linked_caches()
+
+    def watch(self, interval=1.0, on_change=None, envs_required=UNDEFINED):
+        """Start watching configuration files for changes.
+
+        Files set with ``set_*_files()`` methods or provided to the ``__init__()`` are polled
+        for changes in a background thread. Only changed files are parsed again and only
+        caches of changed options are reset.
+
+        .. code-block:: python
+
+           def on_change(selectors):
+               if any(selector.startswith("database.") for selector in selectors):
+                   container.database.reset()
+
+           watcher = config.watch(interval=5.0, on_change=on_change)
+
+        :param interval: Polling interval in seconds.
+        :type interval: float
+
+        :param on_change: Callback that is called with the list of changed option selectors.
+        :type on_change: Callable[[List[str]], None]
+
+        :param envs_required: When True, raises an error on undefined environment variable.
+        :type envs_required: bool
+
+        :rtype: :py:class:`ConfigurationWatcher`
+        """
+        return ConfigurationWatcher(self, interval, on_change, envs_required).start()
+
+    cdef bint _is_changed(self, tuple keys, unsigned long long since):
+        """Check if the option could have been changed since the generation."""
+        cdef tuple changes = self._changes
+
+        if since < self._full_generation or not changes or changes[0][0] > since + 1:
+            return True
+
+        for generation, changed_keys in changes:
+            if generation <= since:
+                continue
+            for path in changed_keys:
+                length = min(len(path), len(keys))
+                if path[:length] == keys[:length]:
+                    return True
+        return False
+
+    cdef Object _apply_changes(self, object value, Object replaced, list selectors):
+        """Override configuration with the new value, reset caches of the changed options only.
+
+        Overriding provider ``replaced`` is updated in place while it is the last overriding.
+        """
+        cdef list changed = []
+
+        _diff_options(self.__call__(), value, (), changed)
+        if not changed:
+            return replaced
+
+        if replaced is not None and self._last_overriding is replaced:
+            replaced.set_provides(value)
+        else:
+            replaced = Object(value)
+            Provider.override(self, replaced)
 
+        self._changes = (self._changes + ((self._generation + 1, tuple(changed)),))[-CONFIGURATION_CHANGES_MAXSIZE:]
+        self._generation += 1
+        self._reset_linked_caches()
+
+        selectors.extend(".".join(str(key) for key in keys) for keys in changed)
+        return replaced
+
+    cdef void _reset_linked_caches(self):
         for provider in self.overrides:
             if isinstance(provider, (Configuration, ConfigurationOption)):
                 provider.reset_cache()
 
+        for option in tuple(self._linked_options):
+            for provider in option.overrides:
+                if isinstance(provider, (Configuration, ConfigurationOption)):
+                    provider.reset_cache()
+
     def update(self, value):
         """Set configuration options.
 
@@ -2225,23 +3050,10 @@ cdef class Configuration(Object):
 
         :rtype: None
         """
-        try:
-            parser = _parse_ini_file(
-                filepath,
-                envs_required if envs_required is not UNDEFINED else self._is_strict_mode_enabled(),
-            )
-        except IOError as exception:
-            if required is not False \
-                    and (self._is_strict_mode_enabled() or required is True) \
-                    and exception.errno in (errno.ENOENT, errno.EISDIR):
-                exception.strerror = "Unable to load configuration file {0}".format(exception.strerror)
-                raise
+        config = _load_ini_config(self, filepath, required, envs_required)
+        if config is UNDEFINED:
             return
 
-        config = {}
-        for section in parser.sections():
-            config[section] = dict(parser.items(section))
-
         current_config = self.__call__()
         if not current_config:
             current_config = {}
@@ -2266,34 +3078,10 @@ cdef class Configuration(Object):
 
         :rtype: None
         """
-        if yaml is None:
-            raise Error(
-                "Unable to load yaml configuration - PyYAML is not installed. "
-                "Install PyYAML or install Dependency Injector with yaml extras: "
-                "\"pip install dependency-injector[yaml]\""
-            )
-
-        if loader is None:
-            loader = YamlLoader
-
-        try:
-            with open(filepath) as opened_file:
-                config_content = opened_file.read()
-        except IOError as exception:
-            if required is not False \
-                    and (self._is_strict_mode_enabled() or required is True) \
-                    and exception.errno in (errno.ENOENT, errno.EISDIR):
-                exception.strerror = "Unable to load configuration file {0}".format(exception.strerror)
-                raise
+        config = _load_yaml_config(self, filepath, required, envs_required, loader)
+        if config is UNDEFINED:
             return
 
-        if envs_required is not None:
-            config_content = _resolve_config_env_markers(
-                config_content,
-                envs_required if envs_required is not UNDEFINED else self._is_strict_mode_enabled(),
-            )
-        config = yaml.load(config_content, loader)
-
         current_config = self.__call__()
         if not current_config:
             current_config = {}
@@ -2315,24 +3103,10 @@ cdef class Configuration(Object):
 
         :rtype: None
         """
-        try:
-            with open(filepath) as opened_file:
-                config_content = opened_file.read()
-        except IOError as exception:
-            if required is not False \
-                    and (self._is_strict_mode_enabled() or required is True) \
-                    and exception.errno in (errno.ENOENT, errno.EISDIR):
-                exception.strerror = "Unable to load configuration file {0}".format(exception.strerror)
-                raise
+        config = _load_json_config(self, filepath, required, envs_required)
+        if config is UNDEFINED:
             return
 
-        if envs_required is not None:
-            config_content = _resolve_config_env_markers(
-                config_content,
-                envs_required if envs_required is not UNDEFINED else self._is_strict_mode_enabled(),
-            )
-        config = json.loads(config_content)
-
         current_config = self.__call__()
         if not current_config:
             current_config = {}
@@ -2411,6 +3185,45 @@ cdef class Configuration(Object):
 
         self.override(value)
 
+    def from_envs(self, prefix, delimiter="__", as_=UNDEFINED, required=UNDEFINED, case_sensitive=False):
+        """Load configuration from the environment variables with the prefix.
+
+        Environment variables are read once and loaded configuration is merged recursively
+        over existing configuration, e.g. ``APP_DB__HOST`` with ``"APP_"`` prefix is loaded
+        as ``db.host`` option.
+
+        :param prefix: Prefix of the environment variables, e.g. ``"APP_"``.
+        :type prefix: str
+
+        :param delimiter: Delimiter of the nested option names.
+        :type delimiter: str
+
+        :param as_: Callable used for type casting of every value or dictionary of
+                    callables by option selectors, e.g. ``{"db.port": int}``.
+        :type as_: object
+
+        :param required: When required is True, raise an exception if no environment
+                         variables are found.
+        :type required: bool
+
+        :param case_sensitive: When False, option names are converted to lower case.
+        :type case_sensitive: bool
+
+        :rtype: None
+        """
+        options = _envs_to_dict(prefix, delimiter, as_, case_sensitive)
+
+        if not options:
+            if required is not False \
+                    and (self._is_strict_mode_enabled() or required is True):
+                raise ValueError("Environment variables with prefix \"{0}\" are undefined".format(prefix))
+            return
+
+        current_config = self.__call__()
+        if not current_config:
+            current_config = {}
+        self.override(merge_dicts(current_config, options))
+
     def from_value(self, value):
         """Load configuration value.
 
@@ -2431,6 +3244,123 @@ cdef class Configuration(Object):
         return self.__strict
 
 
+class ConfigurationWatcher:
+    """Configuration files watcher.
+
+    Watcher polls configuration files of the :py:class:`Configuration` provider and reloads
+    the files that have changed:
+
+    .. code-block:: python
+
+        with config.watch(interval=5.0, on_change=print):
+            ...
+    """
+
+    def __init__(self, config, interval=1.0, on_change=None, envs_required=UNDEFINED):
+        self.config = config
+        self.interval = interval
+        self.on_change = on_change
+        self.envs_required = envs_required
+        self._overriding = None
+        self._stamps = {}
+        self._options = {}
+        for file_type, filepath in self._get_files():
+            self._stamps[filepath] = _stat_config_file(filepath)
+            self._options[filepath] = _load_config_file(config, file_type, filepath, False, envs_required)
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def is_running(self):
+        """Check if watcher thread is running."""
+        return self._thread is not None
+
+    def start(self):
+        """Start watcher thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"{self.config.get_name()}-watcher",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop watcher thread."""
+        thread, self._thread = self._thread, None
+        self._stopped.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def check(self):
+        """Reload changed configuration files.
+
+        Changed files are parsed again and only the options that differ from their previous
+        contents are applied to the current configuration. Options that are defined by the files
+        declared later keep their values.
+
+        :return: Selectors of the changed options.
+        :rtype: List[str]
+        """
+        cdef Configuration config = self.config
+        cdef list selectors = []
+        cdef object value = None
+        cdef int index
+
+        files = self._get_files()
+        for index, (file_type, filepath) in enumerate(files):
+            stamp = _stat_config_file(filepath)
+            if stamp == self._stamps.get(filepath):
+                continue
+            self._stamps[filepath] = stamp
+
+            options = _load_config_file(config, file_type, filepath, False, self.envs_required)
+            previous_options = self._options.get(filepath, UNDEFINED)
+            self._options[filepath] = options
+
+            if value is None:
+                value = config.__call__()
+                if not isinstance(value, dict):
+                    value = {}
+            value = _apply_file_changes(
+                value,
+                previous_options,
+                options,
+                [self._options.get(path, UNDEFINED) for _, path in files[:index]],
+                [self._options.get(path, UNDEFINED) for _, path in files[index + 1:]],
+            )
+
+        if value is None:
+            return selectors
+
+        self._overriding = config._apply_changes(value, self._overriding, selectors)
+
+        if selectors and self.on_change is not None:
+            self.on_change(selectors)
+        return selectors
+
+    def _get_files(self):
+        files = [("ini", filepath) for filepath in self.config.get_ini_files()]
+        files += [("yaml", filepath) for filepath in self.config.get_yaml_files()]
+        files += [("json", filepath) for filepath in self.config.get_json_files()]
+        return files
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception as exception:
+                warnings.warn(f"Unable to reload configuration: {exception}", RuntimeWarning)
+
+
 cdef class Factory(Provider):
     r"""Factory provider creates new instance on every call.
 
@@ -2491,7 +3421,9 @@ cdef class Factory(Provider):
         self.set_args(*args)
         self.set_kwargs(**kwargs)
 
-        self._attributes = tuple()
+        self._attributes_names = tuple()
+        self._attributes_values = tuple()
+        self._attributes_flags = b""
         self._attributes_len = 0
 
         super(Factory, self).__init__()
@@ -2503,7 +3435,8 @@ cdef class Factory(Provider):
             return copied
 
         copied = _memorized_duplicate(self, memo)
-        copied.set_provides(_copy_if_provider(self.provides, memo))
+        if not self._instantiator._copy_provides_import((<Factory> copied)._instantiator):
+            copied.set_provides(_copy_if_provider(self.provides, memo))
         copied.set_args(*deepcopy_args(self, self.args, memo))
         copied.set_kwargs(**deepcopy_kwargs(self, self.kwargs, memo))
         copied.set_attributes(**deepcopy(self.attributes, memo))
@@ -2516,7 +3449,7 @@ cdef class Factory(Provider):
         :rtype: str
         """
         return represent_provider(provider=self,
-                                  provides=self._instantiator.provides)
+                                  provides=self._instantiator._represent_provides())
 
     @property
     def cls(self):
@@ -2530,7 +3463,8 @@ cdef class Factory(Provider):
 
     def set_provides(self, provides):
         """Set provider provides."""
-        provides = _resolve_string_import(provides)
+        if self.__class__.provided_type:
+            provides = _resolve_string_import(provides)
         if (provides
                 and self.__class__.provided_type and
                 not issubclass(provides, self.__class__.provided_type)):
@@ -2608,23 +3542,17 @@ cdef class Factory(Provider):
     @property
     def attributes(self):
         """Return attribute injections."""
-        cdef int index
-        cdef NamedInjection attribute
-        cdef dict attributes
-
-        attributes = dict()
-        for index in range(self._attributes_len):
-            attribute = self._attributes[index]
-            attributes[attribute._name] = attribute._value
-        return attributes
+        return dict(zip(self._attributes_names, self._attributes_values))
 
     def add_attributes(self, **kwargs):
         """Add attribute injections.
 
         :return: Reference ``self``
         """
-        self._attributes += parse_named_injections(kwargs)
-        self._attributes_len = len(self._attributes)
+        self._attributes_names += tuple(kwargs)
+        self._attributes_values += tuple(kwargs.values())
+        self._attributes_flags = _parse_injection_flags(self._attributes_values)
+        self._attributes_len = len(self._attributes_names)
         return self
 
     def set_attributes(self, **kwargs):
@@ -2634,8 +3562,10 @@ cdef class Factory(Provider):
 
         :return: Reference ``self``
         """
-        self._attributes = parse_named_injections(kwargs)
-        self._attributes_len = len(self._attributes)
+        self._attributes_names = tuple(kwargs)
+        self._attributes_values = tuple(kwargs.values())
+        self._attributes_flags = _parse_injection_flags(self._attributes_values)
+        self._attributes_len = len(self._attributes_names)
         return self
 
     def clear_attributes(self):
@@ -2643,14 +3573,16 @@ cdef class Factory(Provider):
 
         :return: Reference ``self``
         """
-        self._attributes = tuple()
-        self._attributes_len = len(self._attributes)
+        self._attributes_names = tuple()
+        self._attributes_values = tuple()
+        self._attributes_flags = b""
+        self._attributes_len = 0
         return self
 
     @property
     def related(self):
         """Return related providers generator."""
-        yield from filter(is_provider, [self.provides])
+        yield from filter(is_provider, [self._instantiator._provides])
         yield from filter(is_provider, self.args)
         yield from filter(is_provider, self.kwargs.values())
         yield from filter(is_provider, self.attributes.values())
@@ -2793,7 +3725,7 @@ cdef class BaseSingleton(Provider):
         :rtype: str
         """
         return represent_provider(provider=self,
-                                  provides=self._instantiator.cls)
+                                  provides=self._instantiator._instantiator._represent_provides())
 
     def __deepcopy__(self, memo):
         """Create and return full copy of provider."""
@@ -2802,7 +3734,9 @@ cdef class BaseSingleton(Provider):
             return copied
 
         copied = _memorized_duplicate(self, memo)
-        copied.set_provides(_copy_if_provider(self.provides, memo))
+        if not self._instantiator._instantiator._copy_provides_import(
+                (<BaseSingleton> copied)._instantiator._instantiator):
+            copied.set_provides(_copy_if_provider(self.provides, memo))
         copied.set_args(*deepcopy_args(self, self.args, memo))
         copied.set_kwargs(**deepcopy_kwargs(self, self.kwargs, memo))
         copied.set_attributes(**deepcopy(self.attributes, memo))
@@ -2821,7 +3755,8 @@ cdef class BaseSingleton(Provider):
 
     def set_provides(self, provides):
         """Set provider provides."""
-        provides = _resolve_string_import(provides)
+        if self.__class__.provided_type:
+            provides = _resolve_string_import(provides)
         if (provides
                 and self.__class__.provided_type and
                 not issubclass(provides, self.__class__.provided_type)):
@@ -2947,7 +3882,7 @@ cdef class BaseSingleton(Provider):
     @property
     def related(self):
         """Return related providers generator."""
-        yield from filter(is_provider, [self._instantiator.provides])
+        yield from filter(is_provider, [self._instantiator._instantiator._provides])
         yield from filter(is_provider, self.args)
         yield from filter(is_provider, self.kwargs.values())
         yield from filter(is_provider, self.attributes.values())
@@ -3399,8 +4334,6 @@ cdef class List(Provider):
 
     def __init__(self, *args):
         """Initializer."""
-        self._args = tuple()
-        self._args_len = 0
         self.set_args(*args)
         super(List, self).__init__()
 
@@ -3425,22 +4358,15 @@ cdef class List(Provider):
     @property
     def args(self):
         """Return positional argument injections."""
-        cdef int index
-        cdef PositionalInjection arg
-        cdef list args
-
-        args = list()
-        for index in range(self._args_len):
-            arg = self._args[index]
-            args.append(arg._value)
-        return tuple(args)
+        return self._args
 
     def add_args(self, *args):
         """Add positional argument injections.
 
         :return: Reference ``self``
         """
-        self._args += parse_positional_injections(args)
+        self._args += args
+        self._args_flags = _parse_injection_flags(self._args)
         self._args_len = len(self._args)
         return self
 
@@ -3451,7 +4377,8 @@ cdef class List(Provider):
 
         :return: Reference ``self``
         """
-        self._args = parse_positional_injections(args)
+        self._args = args
+        self._args_flags = _parse_injection_flags(self._args)
         self._args_len = len(self._args)
         return self
 
@@ -3461,7 +4388,8 @@ cdef class List(Provider):
         :return: Reference ``self``
         """
         self._args = tuple()
-        self._args_len = len(self._args)
+        self._args_flags = b""
+        self._args_len = 0
         return self
 
     @property
@@ -3472,7 +4400,7 @@ cdef class List(Provider):
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return result of provided callable call."""
-        return __provide_positional_args(args, self._args, self._args_len, self._async_mode)
+        return __provide_positional_args(args, self._args, self._args_flags, self._args_len, self._async_mode)
 
 
 cdef class Dict(Provider):
@@ -3507,9 +4435,7 @@ cdef class Dict(Provider):
 
     def __init__(self, dict_=None, **kwargs):
         """Initializer."""
-        self._kwargs = tuple()
-        self._kwargs_len = 0
-        self.add_kwargs(dict_, **kwargs)
+        self.set_kwargs(dict_, **kwargs)
         super(Dict, self).__init__()
 
     def __deepcopy__(self, memo):
@@ -3533,15 +4459,7 @@ cdef class Dict(Provider):
     @property
     def kwargs(self):
         """Return keyword argument injections."""
-        cdef int index
-        cdef NamedInjection kwarg
-        cdef dict kwargs
-
-        kwargs = dict()
-        for index in range(self._kwargs_len):
-            kwarg = self._kwargs[index]
-            kwargs[kwarg._name] = kwarg._value
-        return kwargs
+        return dict(zip(self._kwargs_names, self._kwargs_values))
 
     def add_kwargs(self, dict_=None, **kwargs):
         """Add keyword argument injections.
@@ -3551,9 +4469,10 @@ cdef class Dict(Provider):
         if dict_ is None:
             dict_ = {}
 
-        self._kwargs += parse_named_injections(dict_)
-        self._kwargs += parse_named_injections(kwargs)
-        self._kwargs_len = len(self._kwargs)
+        self._kwargs_names += tuple(dict_) + tuple(kwargs)
+        self._kwargs_values += tuple(dict_.values()) + tuple(kwargs.values())
+        self._kwargs_flags = _parse_injection_flags(self._kwargs_values)
+        self._kwargs_len = len(self._kwargs_names)
 
         return self
 
@@ -3564,22 +4483,18 @@ cdef class Dict(Provider):
 
         :return: Reference ``self``
         """
-        if dict_ is None:
-            dict_ = {}
-
-        self._kwargs = parse_named_injections(dict_)
-        self._kwargs += parse_named_injections(kwargs)
-        self._kwargs_len = len(self._kwargs)
-
-        return self
+        self.clear_kwargs()
+        return self.add_kwargs(dict_, **kwargs)
 
     def clear_kwargs(self):
         """Drop keyword argument injections.
 
         :return: Reference ``self``
         """
-        self._kwargs = tuple()
-        self._kwargs_len = len(self._kwargs)
+        self._kwargs_names = tuple()
+        self._kwargs_values = tuple()
+        self._kwargs_flags = b""
+        self._kwargs_len = 0
         return self
 
     @property
@@ -3598,7 +4513,15 @@ cdef class Dict(Provider):
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return result of provided callable call."""
-        return __provide_keyword_args(kwargs, self._kwargs, self._kwargs_len, self._async_mode)
+        return __provide_keyword_args(
+            kwargs,
+            self._kwargs_names,
+            self._kwargs_values,
+            self._kwargs_flags,
+            self._kwargs_len,
+            self._async_mode,
+            None,
+        )
 
 
 @cython.no_gc
@@ -3624,12 +4547,7 @@ cdef class Resource(Provider):
         self._resource = None
         self._shutdowner = None
 
-        self._args = tuple()
-        self._args_len = 0
         self.set_args(*args)
-
-        self._kwargs = tuple()
-        self._kwargs_len = 0
         self.set_kwargs(**kwargs)
 
         super().__init__()
@@ -3679,22 +4597,15 @@ cdef class Resource(Provider):
     @property
     def args(self):
         """Return positional argument injections."""
-        cdef int index
-        cdef PositionalInjection arg
-        cdef list args
-
-        args = list()
-        for index in range(self._args_len):
-            arg = self._args[index]
-            args.append(arg._value)
-        return tuple(args)
+        return self._args
 
     def add_args(self, *args):
         """Add positional argument injections.
 
         :return: Reference ``self``
         """
-        self._args += parse_positional_injections(args)
+        self._args += args
+        self._args_flags = _parse_injection_flags(self._args)
         self._args_len = len(self._args)
         return self
 
@@ -3705,7 +4616,8 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
-        self._args = parse_positional_injections(args)
+        self._args = args
+        self._args_flags = _parse_injection_flags(self._args)
         self._args_len = len(self._args)
         return self
 
@@ -3715,29 +4627,24 @@ cdef class Resource(Provider):
         :return: Reference ``self``
         """
         self._args = tuple()
-        self._args_len = len(self._args)
+        self._args_flags = b""
+        self._args_len = 0
         return self
 
     @property
     def kwargs(self):
         """Return keyword argument injections."""
-        cdef int index
-        cdef NamedInjection kwarg
-        cdef dict kwargs
-
-        kwargs = dict()
-        for index in range(self._kwargs_len):
-            kwarg = self._kwargs[index]
-            kwargs[kwarg._name] = kwarg._value
-        return kwargs
+        return dict(zip(self._kwargs_names, self._kwargs_values))
 
     def add_kwargs(self, **kwargs):
         """Add keyword argument injections.
 
         :return: Reference ``self``
         """
-        self._kwargs += parse_named_injections(kwargs)
-        self._kwargs_len = len(self._kwargs)
+        self._kwargs_names += tuple(kwargs)
+        self._kwargs_values += tuple(kwargs.values())
+        self._kwargs_flags = _parse_injection_flags(self._kwargs_values)
+        self._kwargs_len = len(self._kwargs_names)
         return self
 
     def set_kwargs(self, **kwargs):
@@ -3747,8 +4654,10 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
-        self._kwargs = parse_named_injections(kwargs)
-        self._kwargs_len = len(self._kwargs)
+        self._kwargs_names = tuple(kwargs)
+        self._kwargs_values = tuple(kwargs.values())
+        self._kwargs_flags = _parse_injection_flags(self._kwargs_values)
+        self._kwargs_len = len(self._kwargs_names)
         return self
 
     def clear_kwargs(self):
@@ -3756,8 +4665,10 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
-        self._kwargs = tuple()
-        self._kwargs_len = len(self._kwargs)
+        self._kwargs_names = tuple()
+        self._kwargs_values = tuple()
+        self._kwargs_flags = b""
+        self._kwargs_len = 0
         return self
 
     @property
@@ -3841,9 +4752,12 @@ cdef class Resource(Provider):
             self._provides,
             args,
             self._args,
+            self._args_flags,
             self._args_len,
             kwargs,
-            self._kwargs,
+            self._kwargs_names,
+            self._kwargs_values,
+            self._kwargs_flags,
             self._kwargs_len,
             self._async_mode,
         )
@@ -4036,16 +4950,30 @@ cdef class Selector(Provider):
         config.override({"one_or_another": "another"})
         instance_2 = selector()
         assert isinstance(instance_2, SomeOtherClass)
+
+    With ``cache=True`` the selected provider is memorized. The memorized provider is dropped
+    when the configuration of the ``selector`` option changes, or when :py:meth:`reset_cache` is
+    called for other callables.
     """
 
-    def __init__(self, selector=None, **providers):
+    def __init__(self, selector=None, cache=False, **providers):
         """Initialize provider."""
+        if is_provider(cache):
+            providers["cache"] = cache
+            cache = False
+
         self._selector = None
+        self._selected = None
+        self._selected_root = None
+        self._selected_generation = 0
         self.set_selector(selector)
 
         self._providers = {}
         self.set_providers(**providers)
 
+        self._cache = False
+        self.set_cache(cache)
+
         super(Selector, self).__init__()
 
     def __deepcopy__(self, memo):
@@ -4057,6 +4985,7 @@ cdef class Selector(Provider):
         copied = _memorized_duplicate(self, memo)
         copied.set_selector(deepcopy(self._selector, memo))
         copied.set_providers(**deepcopy(self._providers, memo))
+        copied.set_cache(self._cache)
 
         self._copy_overridings(copied, memo)
 
@@ -4097,6 +5026,8 @@ cdef class Selector(Provider):
     def set_selector(self, selector):
         """Set selector."""
         self._selector = selector
+        self._selected_root = _get_selector_configuration(selector)
+        self.reset_cache()
         return self
 
     @property
@@ -4107,6 +5038,22 @@ cdef class Selector(Provider):
     def set_providers(self, **providers: Provider):
         """Set providers."""
         self._providers = providers
+        self.reset_cache()
+        return self
+
+    def is_cache_enabled(self):
+        """Check if selected provider is memorized."""
+        return self._cache
+
+    def set_cache(self, cache):
+        """Enable or disable memorization of the selected provider."""
+        self._cache = <bint>cache
+        self.reset_cache()
+        return self
+
+    def reset_cache(self):
+        """Drop memorized selected provider."""
+        self._selected = None
         return self
 
     @property
@@ -4118,6 +5065,14 @@ cdef class Selector(Provider):
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
+        cdef unsigned long long generation = 0
+
+        if self._cache:
+            if self._selected_root is not None:
+                generation = self._selected_root._generation
+            if self._selected is not None and self._selected_generation == generation:
+                return self._selected(*args, **kwargs)
+
         selector_value = self._selector()
 
         if selector_value is None:
@@ -4126,7 +5081,11 @@ cdef class Selector(Provider):
         if selector_value not in self._providers:
             raise Error("Selector has no \"{0}\" provider".format(selector_value))
 
-        return self._providers[selector_value](*args, **kwargs)
+        provider = self._providers[selector_value]
+        if self._cache and _is_selector_cacheable(self._selector):
+            self._selected = provider
+            self._selected_generation = generation
+        return provider(*args, **kwargs)
 
 
 cdef class ProvidedInstance(Provider):
@@ -4271,13 +5230,13 @@ cdef class AttributeGetter(Provider):
         yield from super().related
 
     cpdef object _provide(self, tuple args, dict kwargs):
-        provided = self.provides(*args, **kwargs)
+        provided = _provide_chain_link(self._provides, args, kwargs)
         if __is_future_or_coroutine(provided):
             future_result = asyncio.Future()
             provided = asyncio.ensure_future(provided)
             provided.add_done_callback(functools.partial(self._async_provide, future_result))
             return future_result
-        return getattr(provided, self.name)
+        return getattr(provided, self._name)
 
     def _async_provide(self, future_result, future):
         try:
@@ -4353,13 +5312,13 @@ cdef class ItemGetter(Provider):
         yield from super().related
 
     cpdef object _provide(self, tuple args, dict kwargs):
-        provided = self.provides(*args, **kwargs)
+        provided = _provide_chain_link(self._provides, args, kwargs)
         if __is_future_or_coroutine(provided):
             future_result = asyncio.Future()
             provided = asyncio.ensure_future(provided)
             provided.add_done_callback(functools.partial(self._async_provide, future_result))
             return future_result
-        return provided[self.name]
+        return provided[self._name]
 
     def _async_provide(self, future_result, future):
         try:
@@ -4381,12 +5340,7 @@ cdef class MethodCaller(Provider):
         self._provides = None
         self.set_provides(provides)
 
-        self._args = tuple()
-        self._args_len = 0
         self.set_args(*args)
-
-        self._kwargs = tuple()
-        self._kwargs_len = 0
         self.set_kwargs(**kwargs)
 
         super().__init__()
@@ -4428,15 +5382,7 @@ cdef class MethodCaller(Provider):
     @property
     def args(self):
         """Return positional argument injections."""
-        cdef int index
-        cdef PositionalInjection arg
-        cdef list args
-
-        args = list()
-        for index in range(self._args_len):
-            arg = self._args[index]
-            args.append(arg._value)
-        return tuple(args)
+        return self._args
 
     def set_args(self, *args):
         """Set positional argument injections.
@@ -4445,22 +5391,15 @@ cdef class MethodCaller(Provider):
 
         :return: Reference ``self``
         """
-        self._args = parse_positional_injections(args)
+        self._args = args
+        self._args_flags = _parse_injection_flags(self._args)
         self._args_len = len(self._args)
         return self
 
     @property
     def kwargs(self):
         """Return keyword argument injections."""
-        cdef int index
-        cdef NamedInjection kwarg
-        cdef dict kwargs
-
-        kwargs = dict()
-        for index in range(self._kwargs_len):
-            kwarg = self._kwargs[index]
-            kwargs[kwarg._name] = kwarg._value
-        return kwargs
+        return dict(zip(self._kwargs_names, self._kwargs_values))
 
     def set_kwargs(self, **kwargs):
         """Set keyword argument injections.
@@ -4469,8 +5408,10 @@ cdef class MethodCaller(Provider):
 
         :return: Reference ``self``
         """
-        self._kwargs = parse_named_injections(kwargs)
-        self._kwargs_len = len(self._kwargs)
+        self._kwargs_names = tuple(kwargs)
+        self._kwargs_values = tuple(kwargs.values())
+        self._kwargs_flags = _parse_injection_flags(self._kwargs_values)
+        self._kwargs_len = len(self._kwargs_names)
         return self
 
     @property
@@ -4483,7 +5424,7 @@ cdef class MethodCaller(Provider):
         yield from super().related
 
     cpdef object _provide(self, tuple args, dict kwargs):
-        call = self.provides()
+        call = _provide_chain_link(self._provides, tuple(), {})
         if __is_future_or_coroutine(call):
             future_result = asyncio.Future()
             call = asyncio.ensure_future(call)
@@ -4493,9 +5434,12 @@ cdef class MethodCaller(Provider):
             call,
             args,
             self._args,
+            self._args_flags,
             self._args_len,
             kwargs,
-            self._kwargs,
+            self._kwargs_names,
+            self._kwargs_values,
+            self._kwargs_flags,
             self._kwargs_len,
             self._async_mode,
         )
@@ -4507,9 +5451,12 @@ cdef class MethodCaller(Provider):
                 call,
                 args,
                 self._args,
+                self._args_flags,
                 self._args_len,
                 kwargs,
-                self._kwargs,
+                self._kwargs_names,
+                self._kwargs_values,
+                self._kwargs_flags,
                 self._kwargs_len,
                 self._async_mode,
             )
@@ -4519,6 +5466,43 @@ cdef class MethodCaller(Provider):
             future_result.set_result(result)
 
 
+cdef Configuration _get_selector_configuration(object selector):
+    """Return configuration of the selector option, if selector is a configuration option."""
+    if isinstance(selector, TypedConfigurationOption):
+        selector = selector.args[0]
+    if isinstance(selector, Configuration):
+        return <Configuration>selector
+    if isinstance(selector, ConfigurationOption):
+        return (<ConfigurationOption>selector)._root
+    return None
+
+
+cdef bint _is_selector_cacheable(object selector):
+    """Check if selector value can be memorized, option names with providers can change any time."""
+    if isinstance(selector, TypedConfigurationOption):
+        selector = selector.args[0]
+    if isinstance(selector, ConfigurationOption):
+        for segment in (<ConfigurationOption>selector)._name:
+            if is_provider(segment):
+                return False
+    return True
+
+
+cdef object _provide_chain_link(object provides, tuple args, dict kwargs):
+    """Return result of the provided instance chain link.
+
+    Chain links that are not overridden and are known to be synchronous are provided directly,
+    without calling the provider, so the whole ``.provided`` chain is evaluated in one call.
+    """
+    cdef Provider link
+
+    if isinstance(provides, (ProvidedInstance, AttributeGetter, ItemGetter, MethodCaller)):
+        link = <Provider>provides
+        if link._last_overriding is None and link._async_mode == ASYNC_MODE_DISABLED:
+            return link._provide(args, kwargs)
+    return provides(*args, **kwargs)
+
+
 cdef class Injection:
     """Abstract injection class."""
 
@@ -4646,6 +5630,65 @@ cpdef tuple parse_named_injections(dict kwargs):
     return tuple(injections)
 
 
+cdef bytes _parse_injection_flags(tuple values):
+    """Return packed flags of injection values.
+
+    Equal flags are shared between providers, so providers with the same injection kinds
+    don't keep a copy each.
+    """
+    cdef int index
+    cdef bytearray flags = bytearray(len(values))
+    cdef bytes packed
+    cdef object shared
+
+    for index in range(len(values)):
+        value = values[index]
+        if is_provider(value) and not is_delegated(value):
+            flags[index] = INJECTION_CALL
+        elif not __is_future_or_coroutine(value):
+            flags[index] = INJECTION_CONSTANT
+
+    packed = bytes(flags)
+    shared = _injection_flags.get(packed)
+    if shared is not None:
+        return shared
+    if len(_injection_flags) < INJECTION_FLAGS_MAXSIZE:
+        _injection_flags[packed] = packed
+    return packed
+
+
+cdef tuple _get_kwargs_routes(dict routes_cache, dict kwargs):
+    """Return routes of context keyword arguments, routes are cached per set of argument names.
+
+    Route is a ``(key, prefix, name)`` tuple, ``prefix`` is ``None`` for plain arguments. ``None``
+    is returned if there are no prefixed arguments.
+    """
+    cdef tuple keys = tuple(kwargs)
+    cdef list routes
+    cdef tuple result
+    cdef bint is_prefixed = False
+
+    try:
+        return routes_cache[keys]
+    except KeyError:
+        pass
+
+    routes = []
+    for key in keys:
+        if "__" not in key:
+            routes.append((key, None, None))
+            continue
+        index = key.index("__")
+        routes.append((key, key[:index], key[index+2:]))
+        is_prefixed = True
+
+    result = tuple(routes) if is_prefixed else None
+    if len(routes_cache) >= KWARGS_ROUTES_MAXSIZE:
+        routes_cache.clear()
+    routes_cache[keys] = result
+    return result
+
+
 cdef class OverridingContext:
     """Provider overriding context.
 
@@ -4856,6 +5899,219 @@ def __add_sys_streams(memo):
     memo[id(sys.stderr)] = sys.stderr
 
 
+cdef tuple _parse_selector(object selector):
+    """Return tuple of selector keys, parsed selectors are interned in a bounded cache."""
+    keys = _selector_keys_cache.get(selector)
+    if keys is None:
+        keys = tuple(selector.split("."))
+        if len(_selector_keys_cache) >= SELECTOR_CACHE_MAXSIZE:
+            _selector_keys_cache.clear()
+        _selector_keys_cache[selector] = keys
+    return keys
+
+
+cdef object _replace_option(object options, tuple keys, Py_ssize_t index, object value):
+    """Return copy of options with the value replaced, unchanged subtrees are shared."""
+    key = keys[index]
+    options = options.copy()
+    if index == len(keys) - 1:
+        options[key] = value
+    else:
+        options[key] = _replace_option(options.get(key, {}), keys, index + 1, value)
+    return options
+
+
+cdef object _diff_options(object old, object new, tuple keys, list changed):
+    """Collect keys of the options that differ between configuration trees."""
+    if old is new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in old.items():
+            _diff_options(value, new.get(key, UNDEFINED), keys + (key,), changed)
+        for key in new:
+            if key not in old:
+                changed.append(keys + (key,))
+    elif type(old) is not type(new) or old != new:
+        changed.append(keys)
+
+
+cdef dict _apply_file_changes(dict value, object previous_options, object options, list before, list after):
+    """Return configuration tree with the changes of the file options applied.
+
+    Options defined by the files declared ``after`` the file keep their values, options removed
+    from the file get the values of the files declared ``before`` it, if any.
+    """
+    cdef list changed = []
+    cdef bint overridden
+
+    if not isinstance(previous_options, dict):
+        previous_options = {}
+    if not isinstance(options, dict):
+        options = {}
+    _diff_options(previous_options, options, (), changed)
+
+    for keys in changed:
+        overridden = False
+        for later_options in after:
+            if _get_option(later_options, keys) is not UNDEFINED:
+                overridden = True
+                break
+        if overridden:
+            continue
+
+        option = _get_option(options, keys)
+        if option is UNDEFINED:
+            for earlier_options in reversed(before):
+                option = _get_option(earlier_options, keys)
+                if option is not UNDEFINED:
+                    break
+        elif isinstance(option, dict):
+            current = _get_option(value, keys)
+            if isinstance(current, dict):
+                option = merge_dicts(current, option)
+        value = _update_option(value, keys, option)
+    return value
+
+
+cdef object _get_option(object tree, tuple keys):
+    for key in keys:
+        if not isinstance(tree, dict):
+            return UNDEFINED
+        tree = tree.get(key, UNDEFINED)
+        if tree is UNDEFINED:
+            return UNDEFINED
+    return tree
+
+
+cdef dict _update_option(dict tree, tuple keys, object value):
+    """Return copy of the tree with the option updated, ``UNDEFINED`` value removes the option."""
+    cdef dict result = tree.copy()
+
+    key = keys[0]
+    if len(keys) == 1:
+        if value is UNDEFINED:
+            result.pop(key, None)
+        else:
+            result[key] = value
+        return result
+
+    child = result.get(key)
+    if not isinstance(child, dict):
+        if value is UNDEFINED:
+            return result
+        child = {}
+    result[key] = _update_option(child, keys[1:], value)
+    return result
+
+
+cdef object _stat_config_file(object filepath):
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+cdef dict _envs_to_dict(str prefix, str delimiter, object as_, bint case_sensitive):
+    """Return nested options loaded from the environment variables with the prefix."""
+    cdef dict options = {}
+    cdef dict parent
+
+    for name, value in sorted(os.environ.items()):
+        if not name.startswith(prefix):
+            continue
+
+        name = name[len(prefix):]
+        if not case_sensitive:
+            name = name.lower()
+
+        keys = name.split(delimiter)
+        if not all(keys):
+            continue
+
+        if isinstance(as_, dict):
+            cast = as_.get(".".join(keys))
+            if cast is not None:
+                value = cast(value)
+        elif as_ is not UNDEFINED:
+            value = as_(value)
+
+        parent = options
+        for key in keys[:-1]:
+            child = parent.get(key)
+            if not isinstance(child, dict):
+                child = parent[key] = {}
+            parent = child
+        parent[keys[-1]] = value
+
+    return options
+
+
+cdef object _freeze_options(object value, object schema):
+    """Return immutable copy of the options converted according to the schema."""
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            value = {}
+        return _create_frozen_options(
+            {key: _freeze_options(value.get(key), key_schema) for key, key_schema in schema.items()},
+        )
+
+    if schema is not None:
+        return schema(value) if value is not None else None
+
+    if isinstance(value, dict):
+        return _create_frozen_options({key: _freeze_options(item, None) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_options(item, None) for item in value)
+    return value
+
+
+cdef object _create_frozen_options(dict options):
+    cdef tuple keys = tuple(options)
+
+    for key in keys:
+        if not isinstance(key, str) \
+                or not key.isidentifier() \
+                or keyword.iskeyword(key) \
+                or key.startswith("__"):
+            return MappingProxyType(options)
+
+    cls = _frozen_options_classes.get(keys)
+    if cls is None:
+        cls = type("FrozenOptions", (FrozenOptions,), {"__slots__": keys})
+        if len(_frozen_options_classes) >= FROZEN_OPTIONS_CLASSES_MAXSIZE:
+            _frozen_options_classes.clear()
+        _frozen_options_classes[keys] = cls
+
+    instance = cls.__new__(cls)
+    for key, value in options.items():
+        object.__setattr__(instance, key, value)
+    return instance
+
+
+cdef ConfigurationOption _get_child_option(Configuration root, dict children, tuple name, object item):
+    """Return child option, create it if it does not exist.
+
+    If number of children is limited, the least recently used child is dropped.
+    """
+    cdef ConfigurationOption child = children.get(item)
+
+    if root is None or root._max_children == 0:
+        if child is None:
+            child = children[item] = ConfigurationOption(name + (item,), root)
+        return child
+
+    if child is None:
+        if len(children) >= root._max_children:
+            del children[next(iter(children))]
+        child = ConfigurationOption(name + (item,), root)
+    else:
+        del children[item]
+    children[item] = child
+    return child
+
+
 def merge_dicts(dict1, dict2):
     """Merge dictionaries recursively.
 
@@ -4868,12 +6124,13 @@ def merge_dicts(dict1, dict2):
     :return: New resulting dictionary
     :rtype: dict
     """
-    for key, value in dict1.items():
-        if key in dict2:
-            if isinstance(value, dict) and isinstance(dict2[key], dict):
-                dict2[key] = merge_dicts(value, dict2[key])
     result = dict1.copy()
-    result.update(dict2)
+    for key, value in dict2.items():
+        if isinstance(value, dict):
+            current_value = result.get(key)
+            if isinstance(current_value, dict):
+                value = merge_dicts(current_value, value)
+        result[key] = value
     return result
 
 
@@ -4923,19 +6180,26 @@ def _resolve_string_import(provides):
     if not isinstance(provides, str):
         return provides
 
+    return _import_string(provides, _resolve_calling_module())
+
+
+cdef tuple _defer_string_import(str provides):
+    """Return string import with the calling module to resolve it later."""
+    return provides, _resolve_calling_module()
+
+
+def _import_string(provides, module):
     segments = provides.split(".")
     member_name = segments[-1]
 
     if len(segments) == 1:
-        if  member_name in dir(builtins):
+        if member_name in builtins.__dict__:
             module = builtins
-        else:
-            module = _resolve_calling_module()
         return getattr(module, member_name)
 
     module_name = ".".join(segments[:-1])
 
-    package_name = _resolve_calling_package_name()
+    package_name = module.__package__ if module is not None else None
     if module_name.startswith(".") and package_name is None:
         raise ImportError("Attempted relative import with no known parent package")
 
@@ -4944,14 +6208,16 @@ def _resolve_string_import(provides):
 
 
 def _resolve_calling_module():
-    stack = inspect.stack()
-    pre_last_frame = stack[0]
-    return inspect.getmodule(pre_last_frame[0])
+    """Return module of the closest Python frame.
 
-
-def _resolve_calling_package_name():
-    module = _resolve_calling_module()
-    return module.__package__
+    Frames are not created for the compiled functions, so it is the frame of the code calling
+    the provider.
+    """
+    frame = sys._getframe(0)
+    module = sys.modules.get(frame.f_globals.get("__name__"))
+    if module is None:
+        module = inspect.getmodule(frame)
+    return module
 
 
 cpdef _copy_parent(object from_, object to, dict memo):
@@ -1,11 +1,16 @@
 """Wiring module."""
 
+import dis
 import functools
 import importlib
 import importlib.machinery
+import importlib.util
 import inspect
 import pkgutil
 import sys
+import threading
+import weakref
+from collections import OrderedDict
 from contextlib import suppress
 from inspect import isbuiltin, isclass
 from types import ModuleType
@@ -15,9 +20,11 @@ from typing import (
     AsyncIterator,
     Callable,
     Dict,
+    Generic,
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Protocol,
     Set,
@@ -34,13 +41,6 @@ try:
 except ImportError:
     from typing_extensions import Self, assert_never
 
-try:
-    from functools import cache
-except ImportError:
-    from functools import lru_cache
-
-    cache = lru_cache(maxsize=None)
-
 # Hotfix, see: https://github.com/ets-labs/python-dependency-injector/issues/362
 if sys.version_info >= (3, 9):
     from types import GenericAlias
@@ -63,46 +63,52 @@ else:
             return None
 
 
-MARKER_EXTRACTORS: List[Callable[[Any], Any]] = []
-INSPECT_EXCLUSION_FILTERS: List[Callable[[Any], bool]] = [isbuiltin]
-
-with suppress(ImportError):
-    from fastapi.params import Depends as FastAPIDepends
-
-    def extract_marker_from_fastapi(param: Any) -> Any:
-        if isinstance(param, FastAPIDepends):
-            return param.dependency
+def _get_loaded_attribute(module_name: str, name: str) -> Any:
+    # Integrations are looked up lazily: objects of an integration class can
+    # only exist once the module defining it has been imported by the application.
+    module = sys.modules.get(module_name)
+    if module is None:
         return None
+    return getattr(module, name, None)
 
-    MARKER_EXTRACTORS.append(extract_marker_from_fastapi)
 
-with suppress(ImportError):
-    from fast_depends.dependencies import Depends as FastDepends
-
-    def extract_marker_from_fast_depends(param: Any) -> Any:
-        if isinstance(param, FastDepends):
-            return param.dependency
-        return None
+def extract_marker_from_fastapi(param: Any) -> Any:
+    FastAPIDepends = _get_loaded_attribute("fastapi.params", "Depends")
+    if FastAPIDepends is not None and isinstance(param, FastAPIDepends):
+        return param.dependency
+    return None
 
-    MARKER_EXTRACTORS.append(extract_marker_from_fast_depends)
 
+def extract_marker_from_fast_depends(param: Any) -> Any:
+    FastDepends = _get_loaded_attribute("fast_depends.dependencies", "Depends")
+    if FastDepends is not None and isinstance(param, FastDepends):
+        return param.dependency
+    return None
 
-with suppress(ImportError):
-    from starlette.requests import Request as StarletteRequest
 
-    def is_starlette_request_cls(obj: Any) -> bool:
-        return isclass(obj) and _safe_is_subclass(obj, StarletteRequest)
-
-    INSPECT_EXCLUSION_FILTERS.append(is_starlette_request_cls)
+def is_starlette_request_cls(obj: Any) -> bool:
+    StarletteRequest = _get_loaded_attribute("starlette.requests", "Request")
+    return (
+        StarletteRequest is not None
+        and isclass(obj)
+        and _safe_is_subclass(obj, StarletteRequest)
+    )
 
 
-with suppress(ImportError):
-    from werkzeug.local import LocalProxy as WerkzeugLocalProxy
+def is_werkzeug_local_proxy(obj: Any) -> bool:
+    WerkzeugLocalProxy = _get_loaded_attribute("werkzeug.local", "LocalProxy")
+    return WerkzeugLocalProxy is not None and isinstance(obj, WerkzeugLocalProxy)
 
-    def is_werkzeug_local_proxy(obj: Any) -> bool:
-        return isinstance(obj, WerkzeugLocalProxy)
 
-    INSPECT_EXCLUSION_FILTERS.append(is_werkzeug_local_proxy)
+MARKER_EXTRACTORS: List[Callable[[Any], Any]] = [
+    extract_marker_from_fastapi,
+    extract_marker_from_fast_depends,
+]
+INSPECT_EXCLUSION_FILTERS: List[Callable[[Any], bool]] = [
+    isbuiltin,
+    is_starlette_request_cls,
+    is_werkzeug_local_proxy,
+]
 
 from . import providers  # noqa: E402
 
@@ -124,11 +130,16 @@ __all__ = (
     "install_loader",
     "uninstall_loader",
     "is_loader_installed",
+    "clear_cache",
+    "cache_info",
+    "CacheInfo",
 )
 
 T = TypeVar("T")
 F = TypeVar("F", bound=Callable[..., Any])
 
+CACHE_MAXSIZE = 4096
+
 if TYPE_CHECKING:
     from .containers import Container
 else:
@@ -147,18 +158,30 @@ class PatchedRegistry:
 
     def __init__(self) -> None:
         self._callables: Dict[Callable[..., Any], "PatchedCallable"] = {}
-        self._attributes: Set[PatchedAttribute] = set()
+        self._module_callables: Dict[str, Dict[Callable[..., Any], None]] = {}
+        self._wired_callables: Dict[str, Dict[Callable[..., Any], None]] = {}
+        self._module_attributes: Dict[str, Dict[PatchedAttribute, None]] = {}
 
     def register_callable(self, patched: "PatchedCallable") -> None:
         self._callables[patched.patched] = patched
+        self._module_callables.setdefault(patched.patched.__module__, {})[patched.patched] = None
+
+    def register_module_callable(
+        self,
+        module_name: str,
+        fn: Callable[..., Any],
+    ) -> None:
+        self._wired_callables.setdefault(module_name, {})[fn] = None
 
     def get_callables_from_module(
         self, module: ModuleType
     ) -> Iterator[Callable[..., Any]]:
-        for patched_callable in self._callables.values():
-            if not patched_callable.is_in_module(module):
-                continue
-            yield patched_callable.patched
+        callables = dict.fromkeys(self._module_callables.get(module.__name__, ()))
+        callables.update(self._wired_callables.get(module.__name__, {}))
+        yield from callables
+
+    def clear_module_callables(self, module: ModuleType) -> None:
+        self._wired_callables.pop(module.__name__, None)
 
     def get_callable(self, fn: Callable[..., Any]) -> "PatchedCallable":
         return self._callables.get(fn)
@@ -167,21 +190,15 @@ class PatchedRegistry:
         return fn in self._callables
 
     def register_attribute(self, patched: "PatchedAttribute") -> None:
-        self._attributes.add(patched)
+        self._module_attributes.setdefault(patched.module_name, {})[patched] = None
 
     def get_attributes_from_module(
         self, module: ModuleType
     ) -> Iterator["PatchedAttribute"]:
-        for attribute in self._attributes:
-            if not attribute.is_in_module(module):
-                continue
-            yield attribute
+        yield from self._module_attributes.get(module.__name__, ())
 
     def clear_module_attributes(self, module: ModuleType) -> None:
-        for attribute in self._attributes.copy():
-            if not attribute.is_in_module(module):
-                continue
-            self._attributes.remove(attribute)
+        self._module_attributes.pop(module.__name__, None)
 
 
 class PatchedCallable:
@@ -215,11 +232,6 @@ class PatchedCallable:
         self.reference_closing: Dict[Any, Any] = reference_closing.copy()
         self.closing: Dict[Any, Any] = {}
 
-    def is_in_module(self, module: ModuleType) -> bool:
-        if self.patched is None:
-            return False
-        return self.patched.__module__ == module.__name__
-
     def add_injection(self, kwarg: Any, injection: Any) -> None:
         self.injections[kwarg] = injection
 
@@ -251,9 +263,6 @@ class PatchedAttribute:
         else:
             return self.member.__module__
 
-    def is_in_module(self, module: ModuleType) -> bool:
-        return self.module_name == module.__name__
-
 
 class ProvidersMap:
 
@@ -261,6 +270,7 @@ class ProvidersMap:
 
     def __init__(self, container) -> None:
         self._container = container
+        self._versions: List[Tuple[Any, Optional[int]]] = []
         self._map = self._create_providers_map(
             current_container=container,
             original_container=(
@@ -268,8 +278,15 @@ class ProvidersMap:
                 if container.declarative_parent
                 else container
             ),
+            versions=self._versions,
         )
 
+    def is_actual(self) -> bool:
+        for container, version in self._versions:
+            if version is None or container.providers_version != version:
+                return False
+        return True
+
     def resolve_provider(
         self,
         provider: Union[providers.Provider, str],
@@ -400,7 +417,13 @@ class ProvidersMap:
         cls,
         current_container: Container,
         original_container: Container,
+        versions: List[Tuple[Any, Optional[int]]],
     ) -> Dict[providers.Provider, providers.Provider]:
+        for container in (current_container, original_container):
+            versions.append(
+                (container, getattr(container, "providers_version", None))
+            )
+
         current_providers = current_container.providers
         current_providers["__self__"] = current_container.__self__
 
@@ -418,12 +441,22 @@ class ProvidersMap:
                 subcontainer_map = cls._create_providers_map(
                     current_container=current_provider.container,
                     original_container=original_provider.container,
+                    versions=versions,
                 )
                 providers_map.update(subcontainer_map)
 
         return providers_map
 
 
+def _get_providers_map(container: Container) -> ProvidersMap:
+    """Return providers map of the container, reusing it while providers are unchanged."""
+    providers_map = getattr(container, "_providers_map", None)
+    if providers_map is None or not providers_map.is_actual():
+        providers_map = ProvidersMap(container)
+        container._providers_map = providers_map
+    return providers_map
+
+
 def is_excluded_from_inspect(obj: Any) -> bool:
     for is_excluded in INSPECT_EXCLUSION_FILTERS:
         if is_excluded(obj):
@@ -436,24 +469,37 @@ def wire(  # noqa: C901
     *,
     modules: Optional[Iterable[ModuleType]] = None,
     packages: Optional[Iterable[ModuleType]] = None,
-    keep_cache: bool = False,
+    keep_cache: bool = True,
     warn_unresolved: bool = False,
+    lazy_attributes: bool = False,
 ) -> None:
-    """Wire container providers with provided packages and modules."""
+    """Wire container providers with provided packages and modules.
+
+    With ``lazy_attributes=True`` module and class attributes marked with
+    ``Provide[...]`` are resolved on first access instead of at wiring time.
+    """
     modules = [*modules] if modules else []
 
     if packages:
         for package in packages:
             modules.extend(_fetch_modules(package))
 
-    providers_map = ProvidersMap(container)
+    providers_map = _get_providers_map(container)
 
     for module in modules:
+        global_reads = None
         for member_name, member in _get_members_and_annotated(module):
             if is_excluded_from_inspect(member):
                 continue
 
             if _is_marker(member):
+                lazy = lazy_attributes
+                if lazy:
+                    # Module globals lookups can't be intercepted, so the attributes read by
+                    # the code of the module itself are resolved at wiring time.
+                    if global_reads is None:
+                        global_reads = _get_module_global_reads(module)
+                    lazy = member_name not in global_reads
                 _patch_attribute(
                     module,
                     member_name,
@@ -461,9 +507,10 @@ def wire(  # noqa: C901
                     providers_map,
                     warn_unresolved=warn_unresolved,
                     warn_unresolved_stacklevel=1,
+                    lazy=lazy,
                 )
             elif inspect.isfunction(member):
-                _patch_fn(
+                patched = _patch_fn(
                     module,
                     member_name,
                     member,
@@ -471,6 +518,10 @@ def wire(  # noqa: C901
                     warn_unresolved=warn_unresolved,
                     warn_unresolved_stacklevel=1,
                 )
+                if patched is not None:
+                    _patched_registry.register_module_callable(
+                        module.__name__, patched
+                    )
             elif inspect.isclass(member):
                 cls = member
                 try:
@@ -488,9 +539,10 @@ def wire(  # noqa: C901
                                 providers_map,
                                 warn_unresolved=warn_unresolved,
                                 warn_unresolved_stacklevel=1,
+                                lazy=lazy_attributes,
                             )
                         elif _is_method(cls_member):
-                            _patch_method(
+                            patched = _patch_method(
                                 cls,
                                 cls_member_name,
                                 cls_member,
@@ -498,6 +550,10 @@ def wire(  # noqa: C901
                                 warn_unresolved=warn_unresolved,
                                 warn_unresolved_stacklevel=1,
                             )
+                            if patched is not None:
+                                _patched_registry.register_module_callable(
+                                    module.__name__, patched
+                                )
 
         for patched in _patched_registry.get_callables_from_module(module):
             _bind_injections(
@@ -524,17 +580,9 @@ def unwire(  # noqa: C901
             modules.extend(_fetch_modules(package))
 
     for module in modules:
-        for name, member in inspect.getmembers(module):
-            if inspect.isfunction(member):
-                _unpatch(module, name, member)
-            elif inspect.isclass(member):
-                for method_name, method in inspect.getmembers(
-                    member, inspect.isfunction
-                ):
-                    _unpatch(member, method_name, method)
-
         for patched in _patched_registry.get_callables_from_module(module):
             _unbind_injections(patched)
+        _patched_registry.clear_module_callables(module)
 
         for patched_attribute in _patched_registry.get_attributes_from_module(module):
             _unpatch_attribute(patched_attribute)
@@ -560,11 +608,11 @@ def _patch_fn(
     providers_map: ProvidersMap,
     warn_unresolved: bool = False,
     warn_unresolved_stacklevel: int = 0,
-) -> None:
+) -> Optional[Callable[..., Any]]:
     if not _is_patched(fn):
         reference_injections, reference_closing = _fetch_reference_injections(fn)
         if not reference_injections:
-            return
+            return None
         fn = _get_patched(fn, reference_injections, reference_closing)
 
     _bind_injections(
@@ -575,6 +623,7 @@ def _patch_fn(
     )
 
     setattr(module, name, fn)
+    return fn
 
 
 def _patch_method(
@@ -584,7 +633,7 @@ def _patch_method(
     providers_map: ProvidersMap,
     warn_unresolved: bool = False,
     warn_unresolved_stacklevel: int = 0,
-) -> None:
+) -> Optional[Callable[..., Any]]:
     if (
         hasattr(cls, "__dict__")
         and name in cls.__dict__
@@ -598,7 +647,7 @@ def _patch_method(
     if not _is_patched(fn):
         reference_injections, reference_closing = _fetch_reference_injections(fn)
         if not reference_injections:
-            return
+            return None
         fn = _get_patched(fn, reference_injections, reference_closing)
 
     _bind_injections(
@@ -610,31 +659,14 @@ def _patch_method(
 
     if fn is method:
         # Hotfix, see: https://github.com/ets-labs/python-dependency-injector/issues/884
-        return
+        return fn
 
+    patched = fn
     if isinstance(method, (classmethod, staticmethod)):
         fn = type(method)(fn)
 
     setattr(cls, name, fn)
-
-
-def _unpatch(
-    module: ModuleType,
-    name: str,
-    fn: Callable[..., Any],
-) -> None:
-    if (
-        hasattr(module, "__dict__")
-        and name in module.__dict__
-        and isinstance(module.__dict__[name], (classmethod, staticmethod))
-    ):
-        method = module.__dict__[name]
-        fn = method.__func__
-
-    if not _is_patched(fn):
-        return
-
-    _unbind_injections(fn)
+    return patched
 
 
 def _patch_attribute(
@@ -644,6 +676,7 @@ def _patch_attribute(
     providers_map: ProvidersMap,
     warn_unresolved: bool = False,
     warn_unresolved_stacklevel: int = 0,
+    lazy: bool = False,
 ) -> None:
     provider = providers_map.resolve_provider(marker.provider, marker.modifier)
     if provider is None:
@@ -658,8 +691,13 @@ def _patch_attribute(
     _patched_registry.register_attribute(PatchedAttribute(member, name, marker))
 
     if isinstance(marker, Provide):
-        instance = provider()
-        setattr(member, name, instance)
+        if not lazy:
+            instance = provider()
+            setattr(member, name, instance)
+        elif isinstance(member, ModuleType):
+            _LazyModuleAttributes.install(member).add(name, provider)
+        else:
+            setattr(member, name, _LazyClassAttribute(member, name, provider))
     elif isinstance(marker, Provider):
         setattr(member, name, provider)
     else:
@@ -667,9 +705,97 @@ def _patch_attribute(
 
 
 def _unpatch_attribute(patched: PatchedAttribute) -> None:
+    if isinstance(patched.member, ModuleType):
+        _LazyModuleAttributes.discard(patched.member, patched.name)
     setattr(patched.member, patched.name, patched.marker)
 
 
+class _LazyClassAttribute:
+    """Class attribute descriptor resolving the provider on first access."""
+
+    __slots__ = ("cls", "name", "provider")
+
+    def __init__(self, cls: Type, name: str, provider: providers.Provider) -> None:
+        self.cls = cls
+        self.name = name
+        self.provider = provider
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+        value = self.provider()
+        if self.cls.__dict__.get(self.name) is self:
+            setattr(self.cls, self.name, value)
+        return value
+
+
+class _LazyModuleAttributes:
+    """Module ``__getattr__`` hook resolving wired attributes on first access."""
+
+    def __init__(self, module: ModuleType, fallback: Optional[Callable[[str], Any]]) -> None:
+        self.module = module
+        self.fallback = fallback
+        self.providers: Dict[str, providers.Provider] = {}
+
+    @classmethod
+    def install(cls, module: ModuleType) -> "_LazyModuleAttributes":
+        hook = module.__dict__.get("__getattr__")
+        if not isinstance(hook, cls):
+            hook = cls(module, hook)
+            module.__getattr__ = hook
+        return hook
+
+    @classmethod
+    def discard(cls, module: ModuleType, name: str) -> None:
+        hook = module.__dict__.get("__getattr__")
+        if not isinstance(hook, cls):
+            return
+        hook.providers.pop(name, None)
+        if hook.providers:
+            return
+        if hook.fallback is None:
+            del module.__getattr__
+        else:
+            module.__getattr__ = hook.fallback
+
+    def add(self, name: str, provider: providers.Provider) -> None:
+        self.providers[name] = provider
+        with suppress(AttributeError):
+            delattr(self.module, name)
+
+    def __call__(self, name: str) -> Any:
+        provider = self.providers.get(name)
+        if provider is None:
+            if self.fallback is not None:
+                return self.fallback(name)
+            raise AttributeError(
+                f"module {self.module.__name__!r} has no attribute {name!r}"
+            )
+        value = provider()
+        setattr(self.module, name, value)
+        self.providers.pop(name, None)
+        return value
+
+
+def _get_module_global_reads(module: ModuleType) -> Set[str]:
+    """Return names of the globals read by the code of the module."""
+    loader = getattr(module.__spec__, "loader", None)
+    try:
+        code = loader.get_code(module.__name__)
+    except Exception:  # noqa
+        code = None
+    if code is None:
+        return set(vars(module))
+
+    names = set()
+    codes = [code]
+    while codes:
+        code = codes.pop()
+        for instruction in dis.get_instructions(code):
+            if instruction.opname in ("LOAD_GLOBAL", "LOAD_NAME", "LOAD_FROM_DICT_OR_GLOBALS"):
+                names.add(instruction.argval)
+        codes.extend(const for const in code.co_consts if inspect.iscode(const))
+    return names
+
+
 def _extract_marker(parameter: inspect.Parameter) -> Optional["_Marker"]:
     if get_origin(parameter.annotation) is Annotated:
         args = get_args(parameter.annotation)
@@ -691,7 +817,80 @@ def _extract_marker(parameter: inspect.Parameter) -> Optional["_Marker"]:
     return marker
 
 
-@cache
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _WeakLRUCache(Generic[T]):
+    """Bounded LRU cache keyed by weak references to the callables.
+
+    Entries are dropped as soon as the cached callable is garbage collected,
+    so the cache can be kept between :func:`wire` calls without leaking memory.
+    """
+
+    def __init__(self, fn: Callable[[Any], T], maxsize: Optional[int]) -> None:
+        self._fn = fn
+        self._maxsize = maxsize
+        self._data: "OrderedDict[weakref.ref, T]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        functools.update_wrapper(self, fn)
+
+    def __call__(self, obj: Any) -> T:
+        try:
+            key = weakref.ref(obj)
+        except TypeError:
+            with self._lock:
+                self._misses += 1
+            return self._fn(obj)
+
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value
+
+        value = self._fn(obj)
+
+        with self._lock:
+            self._data[weakref.ref(obj, self._remove)] = value
+            if self._maxsize is not None and len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def _remove(self, key: weakref.ref) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _weak_lru_cache(
+    maxsize: Optional[int],
+) -> Callable[[Callable[[Any], T]], _WeakLRUCache[T]]:
+    def _decorator(fn: Callable[[Any], T]) -> _WeakLRUCache[T]:
+        return _WeakLRUCache(fn, maxsize)
+
+    return _decorator
+
+
+@_weak_lru_cache(maxsize=CACHE_MAXSIZE)
 def _fetch_reference_injections(  # noqa: C901
     fn: Callable[..., Any],
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -773,6 +972,39 @@ def _unbind_injections(fn: Callable[..., Any]) -> None:
     patched_callable.unwind_injections()
 
 
+def _get_wiring_scope(
+    container: Container,
+    calling_package: Optional[str] = None,
+) -> Optional[Tuple[Set[str], Tuple[str, ...]]]:
+    wiring_config = container.wiring_config
+    if not wiring_config.modules and not wiring_config.packages:
+        return None
+
+    from_package = wiring_config.from_package
+    if from_package is None:
+        if container.declarative_parent is not None:
+            parent_module = sys.modules.get(container.declarative_parent.__module__)
+            from_package = getattr(parent_module, "__package__", None)
+        else:
+            from_package = calling_package
+
+    def _resolve_name(module: Union[ModuleType, str]) -> str:
+        if isinstance(module, ModuleType):
+            return module.__name__
+        if module.startswith(".") and not from_package:
+            raise ImportError(
+                f"Can not resolve relative module name \"{module}\" of container {container!r}, "
+                f"specify \"from_package\" in its wiring configuration",
+            )
+        return importlib.util.resolve_name(module, from_package)
+
+    module_names = {_resolve_name(module) for module in wiring_config.modules}
+    package_names = [_resolve_name(package) for package in wiring_config.packages]
+    module_names.update(package_names)
+    package_prefixes = tuple(f"{package_name}." for package_name in package_names)
+    return module_names, package_prefixes
+
+
 def _fetch_modules(package):
     modules = [package]
     if not hasattr(package, "__path__") or not hasattr(package, "__name__"):
@@ -1066,10 +1298,26 @@ class AutoLoader:
 
     def __init__(self) -> None:
         self.containers = []
+        self._scopes: Dict[int, Tuple[Set[str], Tuple[str, ...]]] = {}
         self._path_hook = None
 
-    def register_containers(self, *containers) -> None:
+    def register_containers(
+        self,
+        *containers,
+        scoped: bool = False,
+        calling_package: Optional[str] = None,
+    ) -> None:
+        scopes = [
+            _get_wiring_scope(container, calling_package) if scoped else None
+            for container in containers
+        ]
+
         self.containers.extend(containers)
+        for container, scope in zip(containers, scopes):
+            if scope is None:
+                self._scopes.pop(id(container), None)
+            else:
+                self._scopes[id(container)] = scope
 
         if not self.installed:
             self.install()
@@ -1077,13 +1325,23 @@ class AutoLoader:
     def unregister_containers(self, *containers) -> None:
         for container in containers:
             self.containers.remove(container)
+            if container not in self.containers:
+                self._scopes.pop(id(container), None)
 
         if not self.containers:
             self.uninstall()
 
+    def is_in_scope(self, container: Container, module_name: str) -> bool:
+        scope = self._scopes.get(id(container))
+        if scope is None:
+            return True
+        module_names, package_prefixes = scope
+        return module_name in module_names or module_name.startswith(package_prefixes)
+
     def wire_module(self, module) -> None:
         for container in self.containers:
-            container.wire(modules=[module])
+            if self.is_in_scope(container, module.__name__):
+                container.wire(modules=[module])
 
     @property
     def installed(self) -> bool:
@@ -1128,9 +1386,15 @@ class AutoLoader:
         importlib.invalidate_caches()
 
 
-def register_loader_containers(*containers: Container) -> None:
-    """Register containers in auto-wiring module loader."""
-    _loader.register_containers(*containers)
+def register_loader_containers(*containers: Container, scoped: bool = False) -> None:
+    """Register containers in auto-wiring module loader.
+
+    With ``scoped=True`` a container is wired only to modules that match its
+    ``WiringConfiguration`` modules and packages. Relative names are resolved the same way
+    as ``container.wire()`` does.
+    """
+    calling_package = sys._getframe(1).f_globals.get("__package__") if scoped else None
+    _loader.register_containers(*containers, scoped=scoped, calling_package=calling_package)
 
 
 def unregister_loader_containers(*containers: Container) -> None:
@@ -1222,3 +1486,8 @@ def _get_members_and_annotated(obj: Any) -> Iterable[Tuple[str, Any]]:
 def clear_cache() -> None:
     """Clear all caches used by :func:`wire`."""
     _fetch_reference_injections.cache_clear()
+
+
+def cache_info() -> CacheInfo:
+    """Return statistics of the caches used by :func:`wire`."""
+    return _fetch_reference_injections.cache_info()
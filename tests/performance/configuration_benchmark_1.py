@@ -0,0 +1,101 @@
+"""Dependency Injector Configuration loading benchmark."""
+
+import json
+import os
+import tempfile
+import time
+
+from dependency_injector import providers
+
+
+N = 10
+SECTIONS = 500
+OPTIONS = 20
+
+os.environ["BENCHMARK_HOST"] = "localhost"
+os.environ["BENCHMARK_PORT"] = "5432"
+
+
+def write_config_files(directory):
+    yaml_lines = []
+    json_options = {}
+    ini_lines = []
+    for section in range(SECTIONS):
+        yaml_lines.append(f"section{section}:")
+        ini_lines.append(f"[section{section}]")
+        json_section = json_options[f"section{section}"] = {}
+        for option in range(OPTIONS):
+            if option % 2:
+                marker = "${BENCHMARK_HOST}"
+            else:
+                marker = f"${{BENCHMARK_UNDEFINED_{option}:{option}}}"
+            yaml_lines.append(f"  option{option}: {marker}")
+            ini_lines.append(f"option{option}={marker}")
+            json_section[f"option{option}"] = marker
+
+    files = {
+        "yaml": os.path.join(directory, "config.yml"),
+        "json": os.path.join(directory, "config.json"),
+        "ini": os.path.join(directory, "config.ini"),
+    }
+    with open(files["yaml"], "w") as file:
+        file.write("\n".join(yaml_lines))
+    with open(files["json"], "w") as file:
+        json.dump(json_options, file)
+    with open(files["ini"], "w") as file:
+        file.write("\n".join(ini_lines))
+    return files
+
+
+def benchmark(name, load, **kwargs):
+    start = time.time()
+    for _ in range(N):
+        load(providers.Configuration(**kwargs))
+    finish = time.time()
+    print(f"{name}: {(finish - start) / N}")
+
+
+with tempfile.TemporaryDirectory() as directory:
+    files = write_config_files(directory)
+
+    print(f"{SECTIONS * OPTIONS} environment variable markers per file")
+    benchmark("from_yaml", lambda config: config.from_yaml(files["yaml"]))
+    benchmark("from_json", lambda config: config.from_json(files["json"]))
+    benchmark("from_ini", lambda config: config.from_ini(files["ini"]))
+    benchmark("from_yaml (envs_required=None)", lambda config: config.from_yaml(files["yaml"], envs_required=None))
+
+    cache_dir = os.path.join(directory, "cache")
+    providers.Configuration(cache_dir=cache_dir).from_yaml(files["yaml"])
+    benchmark("from_yaml (cache_dir)", lambda config: config.from_yaml(files["yaml"]), cache_dir=cache_dir)
+
+# ------
+# Result
+# ------
+#
+# Python 3.11.7, markers replaced one by one
+#
+# $ python tests/performance/configuration_benchmark_1.py
+# 10000 environment variable markers per file
+# from_yaml: 1.418767476081848
+# from_json: 0.48283843994140624
+# from_ini: 0.5468760013580323
+# from_yaml (envs_required=None): 1.1411925077438354
+#
+# Python 3.11.7, markers replaced in a single pass
+#
+# $ python tests/performance/configuration_benchmark_1.py
+# 10000 environment variable markers per file
+# from_yaml: 0.982714033126831
+# from_json: 0.016736292839050294
+# from_ini: 0.12469220161437988
+# from_yaml (envs_required=None): 1.134041714668274
+#
+# Python 3.11.7, parsed files cache
+#
+# $ python tests/performance/configuration_benchmark_1.py
+# 10000 environment variable markers per file
+# from_yaml: 1.0414058923721314
+# from_json: 0.022522807121276855
+# from_ini: 0.1293633460998535
+# from_yaml (envs_required=None): 1.1718889951705933
+# from_yaml (cache_dir): 0.017957448959350586
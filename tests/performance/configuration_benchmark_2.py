@@ -0,0 +1,67 @@
+"""Dependency Injector Configuration parsers benchmark."""
+
+import json
+import os
+import tempfile
+import time
+
+from dependency_injector import providers
+
+
+N = 10
+SECTIONS = 1000
+OPTIONS = 20
+
+
+def write_config_files(directory):
+    options = {
+        f"section{section}": {
+            f"option{option}": f"value-{section}-{option}" if option % 2 else option
+            for option in range(OPTIONS)
+        }
+        for section in range(SECTIONS)
+    }
+
+    files = {
+        "yaml": os.path.join(directory, "config.yml"),
+        "json": os.path.join(directory, "config.json"),
+    }
+    with open(files["yaml"], "w") as file:
+        for section, section_options in options.items():
+            file.write(f"{section}:\n")
+            for option, value in section_options.items():
+                file.write(f"  {option}: {value}\n")
+    with open(files["json"], "w") as file:
+        json.dump(options, file)
+    return files
+
+
+def benchmark(file_type, filepath):
+    for name in providers.get_config_parser_names(file_type):
+        start = time.time()
+        for _ in range(N):
+            config = providers.Configuration(parsers={file_type: name})
+            getattr(config, f"from_{file_type}")(filepath)
+        finish = time.time()
+        print(f"{file_type} ({name}): {(finish - start) / N}")
+
+
+with tempfile.TemporaryDirectory() as directory:
+    files = write_config_files(directory)
+
+    print(f"{SECTIONS * OPTIONS} options per file")
+    benchmark("yaml", files["yaml"])
+    benchmark("json", files["json"])
+
+# ------
+# Result
+# ------
+#
+# Python 3.11.7, PyYAML 6 with libyaml, orjson 3
+#
+# $ python tests/performance/configuration_benchmark_2.py
+# 20000 options per file
+# yaml (libyaml): 0.32280137538909914
+# yaml (pyyaml): 1.8169705390930175
+# json (orjson): 0.003702521324157715
+# json (json): 0.009566569328308105
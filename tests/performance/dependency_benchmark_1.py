@@ -0,0 +1,64 @@
+"""Dependency Injector Dependency provider instance type check benchmark."""
+
+import abc
+import time
+from typing import Protocol, runtime_checkable
+
+from dependency_injector import providers
+
+
+N = 1000000
+
+
+class AbstractRepository(abc.ABC):
+    @abc.abstractmethod
+    def get(self): ...
+
+
+@runtime_checkable
+class RepositoryProtocol(Protocol):
+    def get(self): ...
+    def add(self): ...
+    def remove(self): ...
+
+
+class Repository(AbstractRepository):
+    def get(self): ...
+    def add(self): ...
+    def remove(self): ...
+
+
+repository = providers.Object(Repository())
+
+
+def benchmark(name, provider):
+    start = time.time()
+    for _ in range(1, N):
+        provider()
+    finish = time.time()
+    print(f"{name}: {finish - start}")
+
+
+benchmark("class", providers.Dependency(Repository, default=repository))
+benchmark("abc", providers.Dependency(AbstractRepository, default=repository))
+benchmark("protocol", providers.Dependency(RepositoryProtocol, default=repository))
+benchmark("protocol, check_once=True", providers.Dependency(RepositoryProtocol, default=repository, check_once=True))
+
+# ------
+# Result
+# ------
+#
+# Python 3.11.7, instance type checked on every call
+#
+# $ python tests/performance/dependency_benchmark_1.py
+# class: 0.21012544631958008
+# abc: 0.4698905944824219
+# protocol: 6.816277742385864
+#
+# Python 3.11.7, checked instance types memorized
+#
+# $ python tests/performance/dependency_benchmark_1.py
+# class: 0.12056660652160645
+# abc: 0.12604784965515137
+# protocol: 0.12700653076171875
+# protocol, check_once=True: 0.12747550010681152
@@ -0,0 +1,55 @@
+"""Dependency Injector Factory providers context keyword arguments benchmark."""
+
+import time
+
+from dependency_injector import providers
+
+
+N = 1000000
+
+
+class Client(object):
+    def __init__(self, timeout=None, retries=None):
+        self.timeout = timeout
+        self.retries = retries
+
+
+class Service(object):
+    def __init__(self, client, user_id, name=None):
+        self.client = client
+        self.user_id = user_id
+        self.name = name
+
+
+service_factory = providers.Factory(
+    Service,
+    client=providers.Factory(Client),
+)
+
+
+def benchmark(name, call):
+    start = time.time()
+    for _ in range(1, N):
+        call()
+    finish = time.time()
+    print(f"{name}: {finish - start}")
+
+
+benchmark("plain context kwargs", lambda: service_factory(user_id=5, name="name"))
+benchmark("prefixed context kwargs", lambda: service_factory(client__timeout=3, client__retries=2, user_id=5))
+
+# ------
+# Result
+# ------
+#
+# Python 3.11.7, prefixed context kwargs separated on every call
+#
+# $ python tests/performance/factory_benchmark_3.py
+# plain context kwargs: 1.6659481525421143
+# prefixed context kwargs: 2.8216869831085205
+#
+# Python 3.11.7, context kwargs routes cached per set of argument names
+#
+# $ python tests/performance/factory_benchmark_3.py
+# plain context kwargs: 1.434009075164795
+# prefixed context kwargs: 2.336890697479248
@@ -0,0 +1,59 @@
+"""Dependency Injector import time benchmark.
+
+Uses ``python -X importtime`` output, times are in microseconds.
+"""
+
+import re
+import subprocess
+import sys
+
+
+N = 10
+MODULES = ["dependency_injector.providers", "dependency_injector.containers"]
+OPTIONAL_MODULES = ["yaml", "orjson", "msgspec", "pydantic", "pydantic_settings"]
+
+importtime_pattern = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def measure(module):
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        stderr=subprocess.PIPE,
+        text=True,
+    ).stderr
+
+    cumulative = {}
+    for line in output.splitlines():
+        match = importtime_pattern.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative
+
+
+for module in MODULES:
+    results = [measure(module) for _ in range(N)]
+    print(f"{module}: {min(result[module] for result in results)}")
+
+    imported = sorted({name for result in results for name in result if name in OPTIONAL_MODULES})
+    print(f"{module} optional imports: {', '.join(imported) or '-'}")
+
+# ------
+# Result
+# ------
+#
+# Python 3.11.7, optional libraries imported with the module
+#
+# $ python tests/performance/import_benchmark_1.py
+# dependency_injector.providers: 169284
+# dependency_injector.providers optional imports: msgspec, orjson, pydantic, pydantic_settings, yaml
+# dependency_injector.containers: 476671
+# dependency_injector.containers optional imports: msgspec, orjson, pydantic, pydantic_settings, yaml
+#
+# Python 3.11.7, optional libraries imported on the first use
+#
+# $ python tests/performance/import_benchmark_1.py
+# dependency_injector.providers: 43063
+# dependency_injector.providers optional imports: -
+# dependency_injector.containers: 57182
+# dependency_injector.containers optional imports: -
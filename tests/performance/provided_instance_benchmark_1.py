@@ -0,0 +1,58 @@
+"""Dependency Injector ProvidedInstance chains benchmark."""
+
+import time
+
+from dependency_injector import providers
+
+
+N = 1000000
+
+
+class Session(object):
+    def get_value(self):
+        return 42
+
+
+class Client(object):
+    def __init__(self):
+        self.session = Session()
+        self.sessions = {"default": self.session}
+
+
+class Service(object):
+    def __init__(self):
+        self.client = Client()
+
+
+service = providers.Singleton(Service)
+
+
+def benchmark(name, provider):
+    start = time.time()
+    for _ in range(1, N):
+        provider()
+    finish = time.time()
+    print(f"{name}: {finish - start}")
+
+
+benchmark("service.provided.client.session", service.provided.client.session)
+benchmark("service.provided.client.sessions[\"default\"]", service.provided.client.sessions["default"])
+benchmark("service.provided.client.session.get_value.call()", service.provided.client.session.get_value.call())
+
+# ------
+# Result
+# ------
+#
+# Python 3.11.7, every chain link called as a provider
+#
+# $ python tests/performance/provided_instance_benchmark_1.py
+# service.provided.client.session: 1.6131775379180908
+# service.provided.client.sessions["default"]: 3.165046453475952
+# service.provided.client.session.get_value.call(): 3.391555070877075
+#
+# Python 3.11.7, chain links provided directly
+#
+# $ python tests/performance/provided_instance_benchmark_1.py
+# service.provided.client.session: 1.3993511199951172
+# service.provided.client.sessions["default"]: 2.0822911262512207
+# service.provided.client.session.get_value.call(): 2.788383960723877
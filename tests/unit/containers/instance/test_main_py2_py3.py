@@ -504,3 +504,16 @@ def test_resolve_provider_name_no_provider():
     container = Container()
     with raises(errors.Error):
         container.resolve_provider_name(providers.Provider())
+
+
+def test_string_imports_are_not_resolved_on_instantiation():
+    class ContainerWithStringImports(containers.DeclarativeContainer):
+        factory = providers.Factory("missing_module.Class")
+        singleton = providers.Singleton("missing_module.Class")
+        callable = providers.Callable("missing_module.function")
+
+    container = ContainerWithStringImports()
+
+    assert len(list(container.traverse())) == 3
+    with raises(ImportError):
+        container.factory()
@@ -1,5 +1,7 @@
 """Dict provider async mode tests."""
 
+import asyncio
+
 from dependency_injector import containers, providers
 from pytest import mark
 
@@ -21,3 +23,14 @@ async def test_provide():
 
     assert resources["foo"] == "foo"
     assert resources["bar"] == "bar"
+
+
+@mark.asyncio
+async def test_future_constants_injection():
+    future = asyncio.get_running_loop().create_future()
+    future.set_result("foo")
+
+    provider = providers.Dict(foo=future, bar="bar")
+    provider.enable_async_mode()
+
+    assert await provider() == {"foo": "foo", "bar": "bar"}
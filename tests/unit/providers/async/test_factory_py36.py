@@ -421,3 +421,22 @@ async def test_async_instance_and_sync_attributes_injection():
     assert service2.client.resource2 is RESOURCE2
 
     assert service1.client is not service2.client
+
+
+@mark.asyncio
+async def test_future_constants_injection():
+    loop = asyncio.get_running_loop()
+    futures = [loop.create_future() for _ in range(3)]
+    for value, future in enumerate(futures):
+        future.set_result(value)
+
+    provider = providers.Factory(Client, futures[0], resource2=futures[1])
+    provider.add_attributes(resource3=futures[2], resource4=4)
+    provider.enable_async_mode()
+
+    client = await provider()
+
+    assert client.resource1 == 0
+    assert client.resource2 == 1
+    assert client.resource3 == 2
+    assert client.resource4 == 4
@@ -44,6 +44,39 @@ def test_set_provides_string_imports(str_name, cls):
     assert providers.Callable(str_name).provides is cls
 
 
+def test_set_provides_string_import_is_resolved_on_call():
+    provider = providers.Callable(".common.example", 1, 2, 3, 4)
+    assert provider() == (1, 2, 3, 4)
+
+
+def test_set_provides_string_import_is_not_callable():
+    provider = providers.Callable("sys.version")
+    with raises(errors.Error):
+        provider()
+
+
+def test_string_import_is_not_resolved_on_deepcopy():
+    provider = providers.Callable("missing_module.function")
+    provider_copy = providers.deepcopy(provider)
+
+    assert "missing_module" not in sys.modules
+    with raises(ImportError):
+        provider_copy()
+
+
+def test_string_import_is_copied_with_calling_module():
+    provider = providers.Callable(".common.example", 1, 2, 3, 4)
+    assert providers.deepcopy(provider)() == (1, 2, 3, 4)
+
+
+def test_repr_of_string_import():
+    provider = providers.Callable("missing_module.function")
+    assert repr(provider) == (
+        "<dependency_injector.providers."
+        "Callable('missing_module.function') at {0}>".format(hex(id(provider)))
+    )
+
+
 def test_provided_instance_provider():
     provider = providers.Callable(example)
     assert isinstance(provider.provided, providers.ProvidedInstance)
@@ -84,6 +117,98 @@ def test_call_with_context_args_and_kwargs():
     assert provider(2, arg3=3, arg4=4) == (1, 2, 3, 4)
 
 
+def test_call_with_constant_and_provider_kwargs():
+    provider = providers.Callable(example, 1, providers.Object(2), arg3=3, arg4=providers.Object(4))
+    assert provider() == (1, 2, 3, 4)
+
+
+def test_call_context_kwargs_override_constant_kwargs():
+    provider = providers.Callable(example, arg1=1, arg2=2, arg3=3, arg4=providers.Object(4))
+    assert provider(arg1=10, arg4=40) == (10, 2, 3, 40)
+
+
+def test_call_with_prefixed_context_kwargs_and_constant_kwargs():
+    provider = providers.Callable(
+        example,
+        arg1=1,
+        arg2=2,
+        arg3=providers.Callable(dict, value=3),
+        arg4=4,
+    )
+    assert provider(arg3__value=30) == (1, 2, {"value": 30}, 4)
+
+
+def test_call_with_prefixed_context_kwargs_repeated():
+    provider = providers.Callable(
+        example,
+        arg1=providers.Callable(dict),
+        arg2=providers.Callable(dict),
+        arg3=3,
+        arg4=4,
+    )
+
+    for value in range(3):
+        assert provider(arg1__value=value, arg2__a=1, arg2__b=2) == ({"value": value}, {"a": 1, "b": 2}, 3, 4)
+        assert provider(arg2__a=value, arg4=value) == ({}, {"a": value}, 3, value)
+        assert provider(arg3=value) == ({}, {}, value, 4)
+
+
+def test_call_with_many_context_kwargs_shapes():
+    provider = providers.Callable(lambda **kwargs: kwargs, arg=providers.Callable(dict))
+
+    for index in range(200):
+        name = "arg__value{0}".format(index)
+        assert provider(**{name: index}) == {"arg": {"value{0}".format(index): index}}
+
+
+def test_call_constant_kwargs_are_not_shared():
+    provider = providers.Callable(lambda **kwargs: kwargs, arg1=1)
+
+    provider()["arg1"] = 10
+    assert provider() == {"arg1": 1}
+
+
+def test_call_after_changing_constant_injections():
+    provider = providers.Callable(example, 1, 2, arg3=3, arg4=4)
+    assert provider() == (1, 2, 3, 4)
+
+    provider.set_args(10, 20)
+    provider.set_kwargs(arg3=30, arg4=providers.Object(40))
+    assert provider() == (10, 20, 30, 40)
+
+    provider.clear_args()
+    provider.add_args(100, providers.Object(200))
+    provider.clear_kwargs()
+    provider.add_kwargs(arg3=300)
+    provider.add_kwargs(arg4=400)
+    assert provider() == (100, 200, 300, 400)
+
+
+def test_call_with_mixed_injections():
+    dependency = providers.Object(2)
+    delegated = providers.DelegatedFactory(object)
+    provider = providers.Callable(example, 1, dependency, arg3=delegated, arg4=4)
+
+    assert provider() == (1, 2, delegated, 4)
+    assert provider.args == (1, dependency)
+    assert provider.kwargs == {"arg3": delegated, "arg4": 4}
+
+
+def test_add_kwargs_last_injection_wins():
+    provider = providers.Callable(example, 1, 2) \
+        .add_kwargs(arg3=providers.Object(3), arg4=4) \
+        .add_kwargs(arg3=30)
+    assert provider() == (1, 2, 30, 4)
+    assert provider.kwargs == {"arg3": 30, "arg4": 4}
+
+
+def test_add_kwargs_last_provider_injection_wins():
+    provider = providers.Callable(example, 1, 2) \
+        .add_kwargs(arg3=3, arg4=4) \
+        .add_kwargs(arg3=providers.Object(30))
+    assert provider() == (1, 2, 30, 4)
+
+
 def test_fluent_interface():
     provider = providers.Singleton(example) \
         .add_args(1, 2) \
@@ -0,0 +1,197 @@
+"""Configuration(cache_dir=...) tests."""
+
+import json
+import os
+
+from dependency_injector import providers
+from pytest import fixture
+
+
+@fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+@fixture
+def config(cache_dir):
+    return providers.Configuration(cache_dir=cache_dir)
+
+
+@fixture
+def json_config_file(tmp_path):
+    config_file = str(tmp_path / "config.json")
+    with open(config_file, "w") as file:
+        json.dump({"section": {"value": "${CONFIG_CACHE_TEST_ENV:default}"}}, file)
+    return config_file
+
+
+@fixture(autouse=True)
+def environment_variables():
+    yield
+    os.environ.pop("CONFIG_CACHE_TEST_ENV", None)
+
+
+def test_cache_dir(config, cache_dir):
+    assert config.get_cache_dir() == cache_dir
+
+
+def test_set_cache_dir(tmp_path):
+    config = providers.Configuration()
+    assert config.get_cache_dir() is None
+
+    config.set_cache_dir(str(tmp_path))
+    assert config.get_cache_dir() == str(tmp_path)
+
+
+def test_from_json_writes_cache(config, cache_dir, json_config_file):
+    config.from_json(json_config_file)
+
+    assert config.section.value() == "default"
+    assert len(os.listdir(cache_dir)) == 1
+    assert os.listdir(cache_dir)[0].endswith(".pickle")
+
+
+def test_cache_hit(cache_dir, json_config_file, monkeypatch):
+    providers.Configuration(cache_dir=cache_dir).from_json(json_config_file)
+
+    def loads(*_, **__):
+        raise AssertionError("Configuration file is parsed")
+    monkeypatch.setattr(json, "loads", loads)
+
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_json(json_config_file)
+    assert config.section.value() == "default"
+
+
+def test_cache_key_includes_env_values(cache_dir, json_config_file):
+    providers.Configuration(cache_dir=cache_dir).from_json(json_config_file)
+
+    os.environ["CONFIG_CACHE_TEST_ENV"] = "env"
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_json(json_config_file)
+
+    assert config.section.value() == "env"
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_cache_key_includes_content(cache_dir, json_config_file):
+    providers.Configuration(cache_dir=cache_dir).from_json(json_config_file)
+
+    with open(json_config_file, "w") as file:
+        json.dump({"section": {"value": "changed"}}, file)
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_json(json_config_file)
+
+    assert config.section.value() == "changed"
+
+
+def test_corrupted_cache_is_ignored(config, cache_dir, json_config_file):
+    providers.Configuration(cache_dir=cache_dir).from_json(json_config_file)
+    for name in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, name), "w") as file:
+            file.write("corrupted")
+
+    config.from_json(json_config_file)
+    assert config.section.value() == "default"
+
+
+def test_unwritable_cache_dir_is_ignored(tmp_path, json_config_file):
+    cache_dir = tmp_path / "file"
+    cache_dir.write_text("not a directory")
+
+    config = providers.Configuration(cache_dir=str(cache_dir))
+    config.from_json(json_config_file)
+    assert config.section.value() == "default"
+
+
+def test_from_yaml_cache_hit(cache_dir, yaml_config_file_1, monkeypatch):
+    import yaml
+    providers.Configuration(cache_dir=cache_dir).from_yaml(yaml_config_file_1)
+
+    def load(*_, **__):
+        raise AssertionError("Configuration file is parsed")
+    monkeypatch.setattr(yaml, "load", load)
+
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_yaml(yaml_config_file_1)
+    assert config() == {"section1": {"value1": 1}, "section2": {"value2": 2}}
+
+
+def upper_constructor(loader, node):
+    return loader.construct_scalar(node).upper()
+
+
+def lower_constructor(loader, node):
+    return loader.construct_scalar(node).lower()
+
+
+def test_from_yaml_cache_key_includes_loader_class(cache_dir, tmp_path):
+    import yaml
+
+    class UpperLoader(yaml.SafeLoader):
+        pass
+
+    class LowerLoader(yaml.SafeLoader):
+        pass
+
+    UpperLoader.add_constructor("!case", upper_constructor)
+    LowerLoader.add_constructor("!case", lower_constructor)
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("value: !case Text\n")
+
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_yaml(str(config_file), loader=UpperLoader)
+    assert config.value() == "TEXT"
+
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_yaml(str(config_file), loader=LowerLoader)
+    assert config.value() == "text"
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_from_yaml_cache_key_includes_loader_cache_version(cache_dir, tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("value: !case Text\n")
+
+    constructors = dict(providers.YamlLoader.yaml_constructors)
+    monkeypatch.setattr(providers.YamlLoader, "yaml_constructors", constructors)
+
+    constructors["!case"] = upper_constructor
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_yaml(str(config_file))
+    assert config.value() == "TEXT"
+
+    constructors["!case"] = lower_constructor
+    monkeypatch.setattr(providers.YamlLoader, "cache_version", 2, raising=False)
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_yaml(str(config_file))
+    assert config.value() == "text"
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_cache_size_is_bounded(cache_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(providers, "CONFIG_CACHE_MAXSIZE", 2)
+
+    for index in range(3):
+        config_file = tmp_path / f"config{index}.json"
+        config_file.write_text(json.dumps({"value": index}))
+        providers.Configuration(cache_dir=cache_dir).from_json(str(config_file))
+
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_from_ini_uses_cache(config, cache_dir, ini_config_file_1):
+    config.from_ini(ini_config_file_1)
+    assert len(os.listdir(cache_dir)) == 1
+
+    config = providers.Configuration(cache_dir=cache_dir)
+    config.from_ini(ini_config_file_1)
+    assert config() == {"section1": {"value1": "1"}, "section2": {"value2": "2"}}
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_option_from_json_uses_cache(config, cache_dir, json_config_file):
+    config.option.from_json(json_config_file)
+
+    assert config.option.section.value() == "default"
+    assert len(os.listdir(cache_dir)) == 1
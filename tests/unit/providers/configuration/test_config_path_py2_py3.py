@@ -0,0 +1,57 @@
+"""Configuration.path() tests."""
+
+from dependency_injector import errors
+from pytest import mark, raises
+
+
+def test_path(config):
+    config.from_dict({"a": {"b": {"c": 1}}})
+
+    path = config.path("a.b.c")
+
+    assert path() == 1
+    assert path.selector == "a.b.c"
+    assert path.keys == ("a", "b", "c")
+    assert path.root is config
+
+
+def test_path_follows_config_changes(config):
+    path = config.path("a.b")
+
+    assert path() is None
+
+    config.from_dict({"a": {"b": 1}})
+    assert path() == 1
+
+    with config.set("a.b", 2):
+        assert path() == 2
+    assert path() == 1
+
+
+def test_path_undefined(config):
+    config.from_dict({"a": {}})
+
+    assert config.path("a.b")() is None
+
+    with raises(errors.Error, match="Undefined configuration option \"config.a.b\""):
+        config.path("a.b")(required=True)
+
+
+@mark.parametrize("config_type", ["strict"])
+def test_path_undefined_in_strict_mode(config):
+    with raises(errors.Error, match="Undefined configuration option \"config.a.b\""):
+        config.path("a.b")()
+
+
+def test_get_with_repeated_selector(config):
+    config.from_dict({"tenants": {"t1": {"rps": 10}, "t2": {"rps": 20}}})
+
+    for _ in range(3):
+        assert config.get("tenants.t1.rps") == 10
+        assert config.get("tenants.t2.rps") == 20
+
+
+def test_repr(config):
+    assert repr(config.path("a.b")).startswith(
+        "<dependency_injector.providers.ConfigurationPath('config.a.b') at "
+    )
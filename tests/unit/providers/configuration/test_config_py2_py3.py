@@ -178,6 +178,50 @@ def test_configuration_option_override_and_reset_override(config):
     assert config.a.b.c() == 1
 
 
+def test_reset_cache_of_materialized_options(config):
+    config.from_dict({"a": {"b": {"c": 1}}})
+    options = [config.a, config.a.b, config.a.b.c, config.a["b"]["c"]]
+
+    assert [option() for option in options] == [{"b": {"c": 1}}, {"c": 1}, 1, 1]
+
+    config.from_dict({"a": {"b": {"c": 2}}})
+    assert [option() for option in options] == [{"b": {"c": 2}}, {"c": 2}, 2, 2]
+
+    config.override({"a": {"b": {}}})
+    assert [option() for option in options] == [{"b": {}}, {}, None, None]
+
+
+def test_set_shares_unchanged_options(config):
+    config.from_dict({"a": {"b": {"c": 1}, "x": [1, 2]}, "d": {"e": 2}})
+    original = config()
+
+    with config.set("a.b.c", 3):
+        assert config() == {"a": {"b": {"c": 3}, "x": [1, 2]}, "d": {"e": 2}}
+        assert config()["d"] is original["d"]
+        assert config()["a"]["x"] is original["a"]["x"]
+        assert original == {"a": {"b": {"c": 1}, "x": [1, 2]}, "d": {"e": 2}}
+
+    assert config() is original
+
+
+def test_set_creates_missing_sections(config):
+    config.from_dict({"a": {}})
+
+    config.set("a.b.c", 1)
+
+    assert config() == {"a": {"b": {"c": 1}}}
+
+
+def test_from_dict_does_not_change_given_dictionary(config):
+    config.from_dict({"a": {"b": 1}})
+    options = {"a": {"c": 2}}
+
+    config.from_dict(options)
+
+    assert config() == {"a": {"b": 1, "c": 2}}
+    assert options == {"a": {"c": 2}}
+
+
 def test_providers_with_already_overridden_value(config):
     config.override({"a": {"b": {"c": 1, "d": 2}}})
 
@@ -0,0 +1,144 @@
+"""Configuration.snapshot() tests."""
+
+from types import MappingProxyType
+
+from dependency_injector import providers
+from pytest import fixture, raises
+
+
+@fixture
+def config(config):
+    config.from_dict(
+        {
+            "db": {
+                "host": "localhost",
+                "port": "5432",
+            },
+            "hosts": ["a", "b"],
+            "tenants": {
+                "tenant-1": {"limit": 10},
+            },
+        },
+    )
+    return config
+
+
+def test_snapshot(config):
+    snapshot = config.snapshot()()
+
+    assert isinstance(snapshot, providers.FrozenOptions)
+    assert snapshot.db.host == "localhost"
+    assert snapshot.db.port == "5432"
+    assert snapshot.hosts == ("a", "b")
+    assert isinstance(snapshot.tenants, MappingProxyType)
+    assert snapshot.tenants["tenant-1"].limit == 10
+
+
+def test_snapshot_is_immutable(config):
+    snapshot = config.snapshot()()
+
+    with raises(AttributeError):
+        snapshot.db.host = "remote"
+    with raises(AttributeError):
+        del snapshot.db
+    with raises(AttributeError):
+        snapshot.undefined = 1
+    with raises(TypeError):
+        snapshot.tenants["tenant-2"] = {}
+
+
+def test_snapshot_uses_slots(config):
+    snapshot = config.snapshot()()
+
+    assert not hasattr(snapshot, "__dict__")
+    assert list(snapshot) == ["db", "hosts", "tenants"]
+    assert list(snapshot.db) == ["host", "port"]
+
+
+def test_snapshot_mapping_access(config):
+    snapshot = config.snapshot()()
+
+    assert snapshot["db"]["port"] == "5432"
+    assert "db" in snapshot
+    assert "undefined" not in snapshot
+    assert len(snapshot.db) == 2
+    with raises(KeyError):
+        snapshot["undefined"]
+
+
+def test_schema(config):
+    snapshot = config.snapshot({"db": {"port": int}, "debug": bool})()
+
+    assert list(snapshot) == ["db", "debug"]
+    assert list(snapshot.db) == ["port"]
+    assert snapshot.db.port == 5432
+    assert snapshot.debug is None
+
+
+def test_schema_with_nested_snapshot(config):
+    snapshot = config.snapshot({"db": None})()
+    assert snapshot.db.host == "localhost"
+
+
+def test_snapshot_is_cached(config):
+    provider = config.snapshot()
+    assert provider() is provider()
+
+
+def test_snapshot_is_rebuilt_on_change(config):
+    provider = config.snapshot({"db": {"port": int}})
+    snapshot = provider()
+
+    config.db.port.from_value("5433")
+
+    assert provider() is not snapshot
+    assert provider().db.port == 5433
+    assert snapshot.db.port == 5432
+
+
+def test_option_snapshot(config):
+    provider = config.db.snapshot({"port": int})
+
+    assert provider.selector == "db"
+    assert provider().port == 5432
+
+
+def test_equality(config):
+    assert config.snapshot()() == config.snapshot()()
+    assert config.db.snapshot()() != config.snapshot()()
+
+
+def test_classes_cache_is_bounded(config, monkeypatch):
+    monkeypatch.setattr(providers, "FROZEN_OPTIONS_CLASSES_MAXSIZE", 2)
+    snapshot = config.db.snapshot()()
+
+    for index in range(3):
+        providers.Configuration(default={f"option{index}": index}).snapshot()()
+
+    new_snapshot = config.db.snapshot()()
+    assert type(new_snapshot) is not type(snapshot)
+    assert new_snapshot == snapshot
+
+
+def test_repr(config):
+    assert repr(config.db.snapshot()()) == "FrozenOptions(host='localhost', port='5432')"
+
+
+def test_injection(config):
+    class Service:
+        def __init__(self, settings):
+            self.settings = settings
+
+    service = providers.Singleton(Service, settings=config.snapshot({"db": {"port": int}}))
+    assert service().settings.db.port == 5432
+
+
+def test_deepcopy(config):
+    provider = config.snapshot({"db": {"port": int}})
+
+    provider_copy = providers.deepcopy(provider)
+
+    assert provider_copy is not provider
+    assert provider_copy.root is not config
+    assert provider_copy.schema == provider.schema
+    assert provider_copy().db.port == 5432
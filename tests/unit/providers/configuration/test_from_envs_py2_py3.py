@@ -0,0 +1,110 @@
+"""Configuration.from_envs() tests."""
+
+import os
+
+from pytest import fixture, mark, raises
+
+
+@fixture(autouse=True)
+def environment_variables():
+    os.environ["APP_NAME"] = "app"
+    os.environ["APP_DB__HOST"] = "localhost"
+    os.environ["APP_DB__PORT"] = "5432"
+    os.environ["APP_DB__POOL__SIZE"] = "10"
+    os.environ["OTHER_NAME"] = "other"
+    yield
+    for name in ("APP_NAME", "APP_DB__HOST", "APP_DB__PORT", "APP_DB__POOL__SIZE", "OTHER_NAME"):
+        os.environ.pop(name, None)
+
+
+def test(config):
+    config.from_envs("APP_")
+
+    assert config() == {
+        "name": "app",
+        "db": {
+            "host": "localhost",
+            "port": "5432",
+            "pool": {
+                "size": "10",
+            },
+        },
+    }
+
+
+def test_overrides_once(config):
+    config.from_envs("APP_")
+    assert len(config.overridden) == 1
+
+
+def test_merge_over_current_config(config):
+    config.from_dict({"db": {"host": "remote", "user": "admin"}})
+    config.from_envs("APP_")
+
+    assert config.db.host() == "localhost"
+    assert config.db.user() == "admin"
+
+
+def test_delimiter(config):
+    os.environ["APP_CACHE_TTL"] = "60"
+    try:
+        config.from_envs("APP_", delimiter="_")
+    finally:
+        del os.environ["APP_CACHE_TTL"]
+
+    assert config.cache.ttl() == "60"
+
+
+def test_case_sensitive(config):
+    config.from_envs("APP_", case_sensitive=True)
+    assert config.DB.HOST() == "localhost"
+
+
+def test_as_(config):
+    config.from_envs("APP_DB__POOL__", as_=int)
+    assert config() == {"size": 10}
+
+
+def test_as__by_selector(config):
+    config.from_envs("APP_", as_={"db.port": int, "db.pool.size": int})
+
+    assert config.name() == "app"
+    assert config.db.port() == 5432
+    assert config.db.pool.size() == 10
+
+
+def test_undefined(config):
+    config.from_envs("UNDEFINED_")
+
+    assert config() == {}
+    assert len(config.overridden) == 0
+
+
+def test_undefined_required(config):
+    with raises(ValueError, match="Environment variables with prefix \"UNDEFINED_\" are undefined"):
+        config.from_envs("UNDEFINED_", required=True)
+
+
+@mark.parametrize("config_type", ["strict"])
+def test_undefined_strict_mode(config):
+    with raises(ValueError, match="Environment variables with prefix \"UNDEFINED_\" are undefined"):
+        config.from_envs("UNDEFINED_")
+
+
+@mark.parametrize("config_type", ["strict"])
+def test_undefined_strict_mode_not_required(config):
+    config.from_envs("UNDEFINED_", required=False)
+    assert config() == {}
+
+
+def test_option(config):
+    config.option.from_envs("APP_DB__")
+
+    assert config.option() == {
+        "host": "localhost",
+        "port": "5432",
+        "pool": {
+            "size": "10",
+        },
+    }
+    assert config.option.pool.size() == "10"
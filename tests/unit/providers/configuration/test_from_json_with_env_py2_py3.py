@@ -213,3 +213,24 @@ def test_option_env_variable_interpolation(config, json_config_file_3):
     }
     assert config.option.section1.value1() == "test-value"
     assert config.option.section1.value2() == "test-path/path"
+
+
+def test_repeated_markers(config, json_config_file_3):
+    with open(json_config_file_3, "w") as file:
+        file.write(
+            json.dumps(
+                {
+                    "section": {
+                        "defined": "${DEFINED}-${DEFINED:default}-${DEFINED}",
+                        "undefined": "${UNDEFINED:first}-${UNDEFINED}-${UNDEFINED:second}",
+                    },
+                },
+            ),
+        )
+
+    config.from_json(json_config_file_3)
+
+    assert config.section() == {
+        "defined": "defined-defined-defined",
+        "undefined": "first--second",
+    }
@@ -0,0 +1,78 @@
+"""Configuration.load() tests."""
+
+import json
+
+from dependency_injector import providers
+from pytest import fixture, mark, raises
+
+
+@fixture
+def config(ini_config_file_1, yaml_config_file_2, json_config_file_2):
+    return providers.Configuration(
+        ini_files=[ini_config_file_1],
+        yaml_files=[yaml_config_file_2],
+        json_files=[json_config_file_2],
+    )
+
+
+@mark.parametrize("max_workers", [None, 1, 2])
+def test_load_merges_files_in_declared_order(config, max_workers):
+    config.load(max_workers=max_workers)
+
+    assert config() == {
+        "section1": {
+            "value1": 11,
+            "value11": 11,
+        },
+        "section2": {
+            "value2": "2",
+        },
+        "section3": {
+            "value3": 3,
+        },
+    }
+
+
+def test_load_overrides_once(config):
+    config.load()
+    assert len(config.overridden) == 1
+
+
+def test_load_merges_over_current_config(config):
+    config.from_dict({"section0": {"value0": 0}})
+    config.load()
+
+    assert config.section0.value0() == 0
+    assert config.section1.value1() == 11
+
+
+def test_load_many_files(tmp_path):
+    files = []
+    for index in range(60):
+        config_file = str(tmp_path / "config_{0}.json".format(index))
+        with open(config_file, "w") as file:
+            json.dump({"last": index, "files": {str(index): index}}, file)
+        files.append(config_file)
+
+    config = providers.Configuration(json_files=files)
+    config.load()
+
+    assert config.last() == 59
+    assert config.files() == {str(index): index for index in range(60)}
+
+
+def test_load_missing_files(tmp_path):
+    config = providers.Configuration(json_files=[str(tmp_path / "missing.json")])
+    config.load()
+
+    assert config() == {}
+    assert len(config.overridden) == 0
+
+
+def test_load_required_missing_file_does_not_change_config(config, tmp_path):
+    config.set_json_files([str(tmp_path / "missing.json")] + config.get_json_files())
+
+    with raises(IOError):
+        config.load(required=True)
+
+    assert config() == {}
@@ -0,0 +1,93 @@
+"""Configuration(max_children=...) tests."""
+
+from dependency_injector import providers
+from pytest import fixture, raises
+
+
+@fixture
+def config():
+    config = providers.Configuration(max_children=2)
+    config.from_dict(
+        {
+            "tenants": {
+                "tenant1": {"limit": 1},
+                "tenant2": {"limit": 2},
+                "tenant3": {"limit": 3},
+            },
+        },
+    )
+    return config
+
+
+def _children_names(option):
+    return [child.get_name_segments()[-1] for child in option.related]
+
+
+def test_max_children(config):
+    assert config.get_max_children() == 2
+
+
+def test_max_children_not_limited():
+    config = providers.Configuration()
+    assert config.get_max_children() is None
+
+
+def test_set_max_children():
+    config = providers.Configuration()
+    config.set_max_children(10)
+    assert config.get_max_children() == 10
+
+
+def test_set_invalid_max_children():
+    config = providers.Configuration()
+    with raises(ValueError):
+        config.set_max_children(0)
+
+
+def test_children_are_bounded(config):
+    tenants = config.tenants
+    for tenant_id in ("tenant1", "tenant2", "tenant3"):
+        assert tenants[tenant_id].limit() == int(tenant_id[-1])
+
+    assert _children_names(tenants) == ["tenant2", "tenant3"]
+
+
+def test_least_recently_used_child_is_dropped(config):
+    tenants = config.tenants
+    tenant1 = tenants["tenant1"]
+    tenants["tenant2"]
+    assert tenants["tenant1"] is tenant1
+
+    tenants["tenant3"]
+
+    assert _children_names(tenants) == ["tenant1", "tenant3"]
+    assert tenants["tenant1"] is tenant1
+
+
+def test_dropped_child_keeps_working(config):
+    tenant1 = config.tenants["tenant1"].limit
+    config.tenants["tenant2"]
+    config.tenants["tenant3"]
+
+    config.tenants.tenant1.limit.from_value(10)
+
+    assert tenant1() == 10
+    assert config.tenants["tenant1"].limit() == 10
+
+
+def test_root_children_are_bounded(config):
+    config.option1
+    config.option2
+    config.option3
+
+    assert list(config.get_children()) == ["option2", "option3"]
+
+
+def test_root_getitem(config):
+    assert config["tenants"]["tenant1"].limit() == 1
+    assert config["tenants"] is config.tenants
+
+
+def test_deepcopy(config):
+    config_copy = providers.deepcopy(config)
+    assert config_copy.get_max_children() == 2
@@ -0,0 +1,160 @@
+"""Configuration parsers tests."""
+
+import json
+
+import yaml
+from dependency_injector import errors, providers
+from pytest import fixture, mark, raises, skip
+
+
+@fixture(scope="module", autouse=True)
+def upper_case_json_parser():
+    def parser(content):
+        return json.loads(content.upper())
+    providers.register_config_parser("json", "test-upper-case", parser)
+    yield parser
+    providers.unregister_config_parser("json", "test-upper-case")
+
+
+def test_ini_parsers():
+    assert providers.get_config_parser_names("ini") == ["configparser"]
+
+
+def test_yaml_parsers():
+    names = providers.get_config_parser_names("yaml")
+    assert names[-1] == "pyyaml"
+    if yaml.__with_libyaml__:
+        assert names[0] == "libyaml"
+
+
+def test_json_parsers():
+    names = providers.get_config_parser_names("json")
+    assert names[0] == "json"
+    assert names.index("json") < names.index("test-upper-case")
+
+
+def test_json_parser_default():
+    assert providers.get_config_parser("json") is json.loads
+
+
+@mark.parametrize(
+    "content,expected",
+    [
+        ('{"value": 18446744073709551616}', {"value": 18446744073709551616}),
+        ('{"value": -9223372036854775809}', {"value": -9223372036854775809}),
+    ],
+)
+def test_from_json_big_integers(tmp_path, content, expected):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(content)
+    config = providers.Configuration()
+
+    config.from_json(str(config_file))
+
+    assert config() == expected
+    assert type(config.value()) is int
+
+
+@mark.parametrize("content", ["NaN", "Infinity", "-Infinity"])
+def test_from_json_non_finite_numbers(tmp_path, content):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(f'{{"value": {content}}}')
+    config = providers.Configuration()
+
+    config.from_json(str(config_file))
+
+    assert repr(config.value()) == repr(float(content))
+
+
+@mark.parametrize("name", ["orjson", "msgspec"])
+def test_json_fast_parser_selected_by_name(json_config_file_2, name):
+    if name not in providers.get_config_parser_names("json"):
+        skip(f"{name} is not installed")
+    config = providers.Configuration(parsers={"json": name})
+    default_config = providers.Configuration()
+
+    config.from_json(json_config_file_2)
+    default_config.from_json(json_config_file_2)
+
+    assert config() == default_config()
+
+
+def test_get_config_parser(upper_case_json_parser):
+    assert providers.get_config_parser("json", "test-upper-case") is upper_case_json_parser
+    assert providers.get_config_parser("json", "json") is json.loads
+
+
+def test_get_config_parser_automatic_selection():
+    name = providers.get_config_parser_names("json")[0]
+    assert providers.get_config_parser("json") is providers.get_config_parser("json", name)
+
+
+def test_unregister_config_parser():
+    providers.register_config_parser("json", "test-unregister", json.loads)
+
+    providers.unregister_config_parser("json", "test-unregister")
+
+    assert "test-unregister" not in providers.get_config_parser_names("json")
+
+
+def test_unregister_undefined_config_parser():
+    with raises(errors.Error, match="Parser \"undefined\" of json configuration files is not registered"):
+        providers.unregister_config_parser("json", "undefined")
+
+
+def test_get_undefined_config_parser():
+    with raises(errors.Error, match="Parser \"undefined\" of json configuration files is not registered"):
+        providers.get_config_parser("json", "undefined")
+
+
+def test_parsers():
+    config = providers.Configuration(parsers={"json": "test-upper-case"})
+    assert config.get_parsers() == {"json": "test-upper-case"}
+
+
+def test_set_undefined_parser():
+    config = providers.Configuration()
+    with raises(errors.Error, match="Parser \"undefined\" of yaml configuration files is not registered"):
+        config.set_parsers({"yaml": "undefined"})
+
+
+def test_from_json_with_selected_parser(config, json_config_file_1):
+    config.set_parsers({"json": "test-upper-case"})
+    config.from_json(json_config_file_1)
+
+    assert config() == {
+        "SECTION1": {"VALUE1": 1},
+        "SECTION2": {"VALUE2": 2},
+    }
+
+
+def test_option_from_json_with_selected_parser(config, json_config_file_1):
+    config.set_parsers({"json": "test-upper-case"})
+    config.option.from_json(json_config_file_1)
+
+    assert config.option() == {
+        "SECTION1": {"VALUE1": 1},
+        "SECTION2": {"VALUE2": 2},
+    }
+
+
+def test_parsers_produce_same_options(yaml_config_file_2, json_config_file_2):
+    for file_type, config_file in (("yaml", yaml_config_file_2), ("json", json_config_file_2)):
+        with open(config_file) as file:
+            content = file.read()
+        results = [
+            providers.get_config_parser(file_type, name)(content)
+            for name in providers.get_config_parser_names(file_type)
+            if name != "test-upper-case"
+        ]
+        assert all(result == results[0] for result in results)
+
+
+@mark.skipif(not yaml.__with_libyaml__, reason="PyYAML is built without libyaml")
+def test_libyaml_parser_uses_customized_loader(monkeypatch):
+    constructors = dict(providers.YamlLoader.yaml_constructors)
+    constructors["!upper"] = lambda loader, node: loader.construct_scalar(node).upper()
+    monkeypatch.setattr(providers.YamlLoader, "yaml_constructors", constructors)
+
+    parser = providers.get_config_parser("yaml", "libyaml")
+    assert parser("value: !upper text") == {"value": "TEXT"}
@@ -0,0 +1,184 @@
+"""Configuration.watch() tests."""
+
+import json
+import os
+import time
+
+from dependency_injector import providers
+from pytest import fixture
+
+
+@fixture
+def json_config_file(tmp_path):
+    config_file = str(tmp_path / "config.json")
+    _write_json(config_file, {"section1": {"value1": 1}, "section2": {"value2": 2}})
+    return config_file
+
+
+@fixture
+def config(json_config_file):
+    config = providers.Configuration(json_files=[json_config_file])
+    config.load()
+    return config
+
+
+@fixture
+def watcher(config):
+    watcher = providers.ConfigurationWatcher(config)
+    yield watcher
+    watcher.stop()
+
+
+def _write_json(filepath, options):
+    with open(filepath, "w") as file:
+        json.dump(options, file)
+    stat = os.stat(filepath)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_check_without_changes(watcher, config):
+    value = config()
+    assert watcher.check() == []
+    assert config() is value
+
+
+def test_check_reloads_changed_file(watcher, config, json_config_file):
+    _write_json(json_config_file, {"section1": {"value1": 10}, "section2": {"value2": 2}})
+
+    assert watcher.check() == ["section1.value1"]
+    assert config.section1.value1() == 10
+    assert config.section2.value2() == 2
+
+
+def test_check_resets_changed_options_only(watcher, config, json_config_file):
+    section1 = config.section1()
+    section2 = config.section2()
+
+    _write_json(json_config_file, {"section1": {"value1": 10}, "section2": {"value2": 2}})
+    watcher.check()
+
+    assert config.section1() is not section1
+    assert config.section1() == {"value1": 10}
+    assert config.section2() is section2
+
+
+def test_check_resets_required_options(watcher, config, json_config_file):
+    value1 = config.section1.value1.required()
+    assert value1() == 1
+
+    _write_json(json_config_file, {"section1": {"value1": 10}, "section2": {"value2": 2}})
+    watcher.check()
+
+    assert value1() == 10
+
+
+def test_check_new_option(watcher, config, json_config_file):
+    assert config.section3.value3() is None
+
+    _write_json(json_config_file, {"section1": {"value1": 1}, "section2": {"value2": 2}, "section3": {"value3": 3}})
+
+    assert watcher.check() == ["section3"]
+    assert config.section3.value3() == 3
+
+
+def test_check_does_not_stack_overridings(watcher, config, json_config_file):
+    overridden = len(config.overridden)
+
+    for value in range(3):
+        _write_json(json_config_file, {"section1": {"value1": value}})
+        watcher.check()
+
+    assert len(config.overridden) == overridden + 1
+    assert config.section1.value1() == 2
+
+
+def test_check_calls_on_change(config, json_config_file):
+    calls = []
+    watcher = providers.ConfigurationWatcher(config, on_change=calls.append)
+
+    _write_json(json_config_file, {"section1": {"value1": 1}, "section2": {"value2": 20}})
+    watcher.check()
+
+    assert calls == [["section2.value2"]]
+
+
+def test_full_reset_after_watched_change(watcher, config, json_config_file):
+    _write_json(json_config_file, {"section1": {"value1": 10}})
+    watcher.check()
+    assert config.section1.value1() == 10
+
+    config.from_dict({"section1": {"value1": 100}})
+    assert config.section1.value1() == 100
+
+
+def test_watch(config, json_config_file):
+    calls = []
+    with config.watch(interval=0.01, on_change=calls.append) as watcher:
+        assert watcher.is_running
+        _write_json(json_config_file, {"section1": {"value1": 10}, "section2": {"value2": 2}})
+
+        deadline = time.monotonic() + 5.0
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert not watcher.is_running
+    assert calls == [["section1.value1"]]
+    assert config.section1.value1() == 10
+
+
+def test_check_keeps_files_precedence(tmp_path):
+    file_a = str(tmp_path / "a.json")
+    file_b = str(tmp_path / "b.json")
+    _write_json(file_a, {"section": {"value": "a", "a": 1}})
+    _write_json(file_b, {"section": {"value": "b"}})
+    config = providers.Configuration(json_files=[file_a, file_b])
+    config.load()
+    watcher = providers.ConfigurationWatcher(config)
+
+    _write_json(file_a, {"section": {"value": "a2", "a": 2}})
+
+    assert watcher.check() == ["section.a"]
+    assert config.section() == {"value": "b", "a": 2}
+
+
+def test_check_removed_option(watcher, config, json_config_file):
+    _write_json(json_config_file, {"section1": {"value1": 1}})
+
+    assert watcher.check() == ["section2"]
+    assert config.section2() is None
+    assert config() == {"section1": {"value1": 1}}
+
+
+def test_check_removed_nested_option(watcher, config, json_config_file):
+    _write_json(json_config_file, {"section1": {}, "section2": {"value2": 2}})
+
+    assert watcher.check() == ["section1.value1"]
+    assert config.section1() == {}
+
+
+def test_check_keeps_options_not_from_files(json_config_file):
+    config = providers.Configuration(json_files=[json_config_file])
+    config.from_dict({"section3": {"value3": 3}})
+    config.load()
+    watcher = providers.ConfigurationWatcher(config)
+
+    _write_json(json_config_file, {"section1": {"value1": 10}})
+
+    assert sorted(watcher.check()) == ["section1.value1", "section2"]
+    assert config() == {"section1": {"value1": 10}, "section3": {"value3": 3}}
+
+
+def test_check_keeps_options_set_after_watch(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "remote")
+    config_file = str(tmp_path / "config.json")
+    _write_json(config_file, {"db": {"host": "localhost", "port": 5432}})
+    config = providers.Configuration(json_files=[config_file])
+    config.load()
+    config.db.host.from_env("DB_HOST")
+    watcher = providers.ConfigurationWatcher(config)
+    config.set("feature.flag", True)
+
+    _write_json(config_file, {"db": {"host": "localhost", "port": 5433}})
+
+    assert watcher.check() == ["db.port"]
+    assert config() == {"db": {"host": "remote", "port": 5433}, "feature": {"flag": True}}
@@ -44,6 +44,40 @@ def test_set_provides_string_imports(str_name, cls):
     assert providers.Factory(str_name).provides is cls
 
 
+def test_string_import_is_resolved_on_call():
+    provider = providers.Factory(".common.Example", init_arg1=1)
+    assert isinstance(provider(), Example)
+
+
+def test_string_import_of_missing_member_fails_on_call():
+    provider = providers.Factory("decimal.MissingClass")
+    with raises(AttributeError):
+        provider()
+
+
+def test_string_import_of_member_defined_later():
+    provider = providers.Factory("ExampleDefinedLater")
+    assert provider() == "example"
+
+
+def test_string_import_is_not_resolved_on_deepcopy():
+    provider = providers.Factory("missing_module.Class")
+    provider_copy = providers.deepcopy(provider)
+
+    assert "missing_module" not in sys.modules
+    assert list(provider_copy.related) == []
+    with raises(ImportError):
+        provider_copy()
+
+
+def test_repr_of_string_import():
+    provider = providers.Factory("missing_module.Class")
+    assert repr(provider) == (
+        "<dependency_injector.providers."
+        "Factory('missing_module.Class') at {0}>".format(hex(id(provider)))
+    )
+
+
 def test_init_with_valid_provided_type():
     class ExampleProvider(providers.Factory):
         provided_type = Example
@@ -157,6 +191,26 @@ def test_call_with_attributes():
     assert isinstance(instance2, Example)
 
 
+def test_call_with_mixed_attributes():
+    dependency = providers.Object("dependency")
+    provider = providers.Factory(Example).add_attributes(attribute1=dependency)
+    provider.add_attributes(attribute2="a2")
+
+    instance = provider()
+    assert instance.attribute1 == "dependency"
+    assert instance.attribute2 == "a2"
+
+    provider.set_attributes(attribute2=dependency)
+    instance = provider()
+    assert instance.attribute1 is None
+    assert instance.attribute2 == "dependency"
+
+    provider.clear_attributes()
+    instance = provider()
+    assert instance.attribute1 is None
+    assert instance.attribute2 is None
+
+
 def test_call_with_context_args():
     provider = providers.Factory(Example, 11, 22)
 
@@ -260,6 +314,16 @@ def test_set_kwargs():
     assert provider.kwargs == dict(init_arg3=4, init_arg4=5)
 
 
+def test_add_kwargs_last_injection_wins():
+    provider = providers.Factory(Example) \
+        .add_kwargs(init_arg3=providers.Object(3), init_arg4=4) \
+        .add_kwargs(init_arg3=30)
+    instance = provider()
+    assert instance.init_arg3 == 30
+    assert instance.init_arg4 == 4
+    assert provider.kwargs == dict(init_arg3=30, init_arg4=4)
+
+
 def test_set_attributes():
     provider = providers.Factory(Example) \
         .add_attributes(attribute1=5, attribute2=6) \
@@ -383,6 +447,25 @@ def test_deepcopy_attributes():
     assert dependent_provider2 is not dependent_provider_copy2
 
 
+def test_deepcopy_with_shared_injection_kinds():
+    dependency = providers.Object("dependency")
+    provider1 = providers.Factory(Example, 1, dependency).add_attributes(attribute1=dependency)
+    provider2 = providers.Factory(Example, 2, dependency).add_attributes(attribute1=dependency)
+
+    provider_copy = providers.deepcopy(provider1)
+    provider_copy.add_args(providers.Object(3))
+    provider_copy.add_attributes(attribute2=4)
+
+    instance = provider_copy()
+    assert (instance.init_arg1, instance.init_arg2, instance.init_arg3) == (1, "dependency", 3)
+    assert (instance.attribute1, instance.attribute2) == ("dependency", 4)
+
+    for provider, value in ((provider1, 1), (provider2, 2)):
+        instance = provider()
+        assert (instance.init_arg1, instance.init_arg2, instance.init_arg3) == (value, "dependency", None)
+        assert (instance.attribute1, instance.attribute2) == ("dependency", None)
+
+
 def test_deepcopy_overridden():
     provider = providers.Factory(Example)
     object_provider = providers.Object(object())
@@ -421,3 +504,8 @@ def test_repr():
         "<dependency_injector.providers."
         "Factory({0}) at {1}>".format(repr(Example), hex(id(provider)))
     )
+
+
+class ExampleDefinedLater:
+    def __eq__(self, other):
+        return other == "example"
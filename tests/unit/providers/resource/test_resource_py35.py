@@ -76,6 +76,18 @@ def test_injection():
     assert _init.counter == 1
 
 
+def test_init_with_mixed_injections():
+    def _init(*args, **kwargs):
+        return args, kwargs
+
+    dependency = providers.Object("dependency")
+    provider = providers.Resource(_init, 1, dependency, kwarg1=dependency, kwarg2=2)
+    provider.add_args(3)
+    provider.add_kwargs(kwarg3=providers.Object(3))
+
+    assert provider() == ((1, "dependency", 3), {"kwarg1": "dependency", "kwarg2": 2, "kwarg3": 3})
+
+
 def test_init_function():
     def _init():
         _init.counter += 1
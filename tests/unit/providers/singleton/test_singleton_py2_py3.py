@@ -285,6 +285,18 @@ def test_deepcopy(singleton_cls):
     assert isinstance(provider, singleton_cls)
 
 
+def test_deepcopy_string_import(singleton_cls):
+    provider = singleton_cls("missing_module.Class")
+    provider_copy = providers.deepcopy(provider)
+
+    assert "missing_module" not in sys.modules
+    assert repr(provider_copy).startswith(
+        "<dependency_injector.providers.{0}('missing_module.Class')".format(singleton_cls.__name__)
+    )
+    with raises(ImportError):
+        provider_copy()
+
+
 def test_deepcopy_from_memo(singleton_cls):
     provider = singleton_cls(Example)
     provider_copy_memo = singleton_cls(Example)
@@ -118,6 +118,60 @@ def test_call_overridden_but_not_instance_of(provider):
         provider()
 
 
+def test_call_overridden_but_not_instance_of_repeatedly(provider):
+    provider.provided_by(providers.Factory(list))
+    provider()
+
+    provider.provided_by(providers.Factory(dict))
+    for _ in range(2):
+        with raises(errors.Error):
+            provider()
+
+
+def test_call_set_instance_of_resets_checked_types(provider):
+    provider.provided_by(providers.Factory(list))
+    provider()
+
+    provider.set_instance_of(dict)
+    with raises(errors.Error):
+        provider()
+
+
+def test_set_instance_of_before_call(provider):
+    provider.set_instance_of(dict)
+    provider.provided_by(providers.Factory(dict))
+    assert provider() == {}
+
+    provider.provided_by(providers.Factory(list))
+    with raises(errors.Error):
+        provider()
+
+
+def test_check_once():
+    values = iter([[], {}])
+    provider = providers.Dependency(instance_of=list, check_once=True)
+    assert provider.check_once is True
+
+    provider.override(providers.Callable(next, values))
+    assert provider() == []
+    assert provider() == {}
+
+
+def test_check_once_checks_new_overriding():
+    provider = providers.Dependency(instance_of=list, check_once=True)
+    provider.override(providers.Factory(list))
+    provider()
+
+    provider.override(providers.Factory(dict))
+    with raises(errors.Error):
+        provider()
+
+
+def test_set_check_once_returns_self(provider):
+    assert provider.set_check_once(True) is provider
+    assert provider.check_once is True
+
+
 def test_call_undefined(provider):
     with raises(errors.Error, match="Dependency is not defined"):
         provider()
@@ -256,6 +310,23 @@ def test_deepcopy(provider):
     assert isinstance(provider, providers.Dependency)
 
 
+def test_deepcopy_checks_types_separately(provider):
+    provider.provided_by(providers.Factory(list))
+    provider_copy = providers.deepcopy(provider)
+    assert provider() == []
+
+    provider_copy.set_instance_of(dict)
+    with raises(errors.Error):
+        provider_copy()
+    assert provider() == []
+
+
+def test_deepcopy_check_once():
+    provider = providers.Dependency(instance_of=list, check_once=True)
+    provider_copy = providers.deepcopy(provider)
+    assert provider_copy.check_once is True
+
+
 def test_deepcopy_from_memo(provider):
     provider_copy_memo = providers.Provider()
     provider_copy = providers.deepcopy(provider, memo={id(provider): provider_copy_memo})
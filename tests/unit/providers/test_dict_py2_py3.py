@@ -96,6 +96,16 @@ def test_add_kwargs_string_and_non_string_keys():
     assert provider.kwargs == {"a1": "i1", a2: "i2"}
 
 
+def test_add_kwargs_dict_and_keyword_args():
+    a2 = object()
+    dependency = providers.Object("dependency")
+    provider = providers.Dict(a1="i1") \
+        .add_kwargs({a2: dependency, "a3": "i3"}, a4=dependency, a5="i5")
+
+    assert provider() == {"a1": "i1", a2: "dependency", "a3": "i3", "a4": "dependency", "a5": "i5"}
+    assert provider.kwargs == {"a1": "i1", a2: dependency, "a3": "i3", "a4": dependency, "a5": "i5"}
+
+
 def test_set_kwargs():
     provider = providers.Dict() \
         .add_kwargs(a1="i1", a2="i2") \
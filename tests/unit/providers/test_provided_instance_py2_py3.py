@@ -111,6 +111,34 @@ def test_call_overridden(container):
         assert container.client_method_call().value == value
 
 
+def test_call_repeatedly_with_changing_root():
+    service = providers.Factory(Service)
+    value = service.provided.values[0]
+
+    assert [value(value=index) for index in range(3)] == [0, 1, 2]
+
+
+def test_call_chain_link_overridden():
+    service = providers.Singleton(Service, value="foo")
+    value = service.provided.get_closure.call().call()
+    assert value() == "foo"
+
+    closure = value.provides.provides
+    with closure.override(providers.Object(lambda: lambda: "bar")):
+        assert value() == "bar"
+    assert value() == "foo"
+
+
+def test_call_chain_link_provides_changed():
+    service = providers.Singleton(Service, value="foo")
+    values = service.provided.values
+    value = values[0]
+    assert value() == "foo"
+
+    values.set_name("value")
+    assert value() == "f"
+
+
 def test_repr_provided_instance(container):
     provider = container.service.provided
     assert repr(provider) == "ProvidedInstance(\"{0}\")".format(repr(container.service))
@@ -165,6 +193,15 @@ def test_method_caller():
     assert provider.set_provides(providers.Provider()) is provider
 
 
+def test_method_caller_with_mixed_injections():
+    dependency = providers.Object("dependency")
+    provides = providers.Object(lambda *args, **kwargs: (args, kwargs))
+    provider = providers.MethodCaller(provides, 1, dependency, kwarg1=dependency, kwarg2=2)
+
+    assert provider() == ((1, "dependency"), {"kwarg1": "dependency", "kwarg2": 2})
+    assert provider(3, kwarg3=3) == ((1, "dependency", 3), {"kwarg1": "dependency", "kwarg2": 2, "kwarg3": 3})
+
+
 def test_puzzled():
     service = providers.Singleton(Service, value="foo-bar")
 
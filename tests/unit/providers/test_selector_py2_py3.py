@@ -32,6 +32,8 @@ def selector_type():
 def selector(selector_type, switch, one, two):
     if selector_type == "default":
         return providers.Selector(switch, one=one, two=two)
+    elif selector_type == "cached":
+        return providers.Selector(switch, cache=True, one=one, two=two)
     elif selector_type == "empty":
         return providers.Selector()
     elif selector_type == "sys-streams":
@@ -73,6 +75,7 @@ def test_provided_instance_provider(selector):
     assert isinstance(selector.provided, providers.ProvidedInstance)
 
 
+@mark.parametrize("selector_type", ["default", "cached"])
 def test_call(selector, switch):
     with switch.override("one"):
         assert selector() == 1
@@ -81,12 +84,14 @@ def test_call(selector, switch):
         assert selector() == 2
 
 
+@mark.parametrize("selector_type", ["default", "cached"])
 def test_call_undefined_provider(selector, switch):
     with switch.override("three"):
         with raises(errors.Error):
             selector()
 
 
+@mark.parametrize("selector_type", ["default", "cached"])
 def test_call_selector_is_none(selector, switch):
     with switch.override(None):
         with raises(errors.Error):
@@ -119,6 +124,104 @@ def test_call_with_context_args(selector, switch):
     assert kwargs == {"three": 3, "four": 4}
 
 
+def test_cache(switch, one, two):
+    selector = providers.Selector(switch, cache=True, one=one, two=two)
+    assert selector.is_cache_enabled() is True
+
+    switch.from_value("one")
+    assert selector() == 1
+
+    one.override(providers.Object(10))
+    assert selector() == 10
+
+    switch.from_value("two")
+    assert selector() == 2
+
+
+def test_cache_option_changed():
+    config = providers.Configuration()
+    config.from_dict({"storage": {"backend": "one"}, "other": 1})
+    selector = providers.Selector(
+        config.storage.backend,
+        cache=True,
+        one=providers.Object(1),
+        two=providers.Object(2),
+    )
+    assert selector() == 1
+
+    config.storage.backend.override("two")
+    assert selector() == 2
+
+    config.reset_cache()
+    config.from_dict({"storage": {"backend": "one"}})
+    assert selector() == 1
+
+    config.set("storage.backend", "two")
+    assert selector() == 2
+
+
+def test_cache_typed_option_changed():
+    config = providers.Configuration()
+    config.from_dict({"backend": 1})
+    selector = providers.Selector(config.backend.as_(str), cache=True, **{"1": providers.Object(1), "2": providers.Object(2)})
+    assert selector() == 1
+
+    config.backend.override(2)
+    assert selector() == 2
+
+
+def test_cache_any_callable():
+    selector = providers.Selector(
+        functools.partial(next, itertools.cycle(["one", "two"])),
+        cache=True,
+        one=providers.Object(1),
+        two=providers.Object(2),
+    )
+
+    assert selector() == 1
+    assert selector() == 1
+
+    selector.reset_cache()
+    assert selector() == 2
+    assert selector() == 2
+
+    selector.set_cache(False)
+    assert selector() == 1
+    assert selector() == 2
+
+
+def test_cache_dynamic_option_name():
+    config = providers.Configuration()
+    config.from_dict({"env": "dev", "backends": {"dev": "one", "prod": "two"}})
+    selector = providers.Selector(
+        config.backends[config.env],
+        cache=True,
+        one=providers.Object(1),
+        two=providers.Object(2),
+    )
+    assert selector() == 1
+
+    with config.env.override("prod"):
+        assert selector() == 2
+
+
+def test_cache_provider_named_cache(switch, one):
+    selector = providers.Selector(switch, cache=one)
+
+    assert selector.cache is one
+    assert selector.is_cache_enabled() is False
+
+
+def test_deepcopy_cache(switch, one, two):
+    selector = providers.Selector(switch, cache=True, one=one, two=two)
+    provider_copy = providers.deepcopy(selector)
+    assert provider_copy.is_cache_enabled() is True
+
+
+def test_set_cache_returns_self(selector):
+    assert selector.set_cache(True) is selector
+
+
 def test_getattr(selector, one, two):
     assert selector.one is one
     assert selector.two is two
@@ -0,0 +1,15 @@
+"""Test module for auto-wiring with nested imports."""
+
+from dependency_injector.wiring import inject, Provide
+
+from ..container import Container
+from ..service import Service
+from . import inner
+
+
+inner_service_on_import = inner.test_function()
+
+
+@inject
+def test_function(service: Service = Provide[Container.service]):
+    return service, inner.test_function()
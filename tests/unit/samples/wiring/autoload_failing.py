@@ -0,0 +1,15 @@
+"""Test module for auto-wiring of a module that fails to import."""
+
+from dependency_injector.wiring import inject, Provide
+
+from .autoload import inner
+from .container import Container
+from .service import Service
+
+
+@inject
+def test_function(service: Service = Provide[Container.service]):
+    return service
+
+
+raise RuntimeError("Import error")
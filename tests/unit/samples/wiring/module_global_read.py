@@ -0,0 +1,14 @@
+"""Test module reading its own wired attribute."""
+
+from dependency_injector.wiring import Provide
+
+from .container import Container
+from .service import Service
+
+
+service: Service = Provide[Container.service]
+lazy_service: Service = Provide[Container.service]
+
+
+def get_service():
+    return service
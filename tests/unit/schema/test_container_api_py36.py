@@ -143,3 +143,45 @@ def test_from_json_schema(container: containers.DynamicContainer, tmp_path: path
     assert isinstance(container.provider2, providers.Factory)
     assert container.provider2.provides is dict
     assert container.provider2.kwargs == {"one": container.provider1, "two": 2}
+
+
+def test_from_json_schema_with_parser(container: containers.DynamicContainer, tmp_path: pathlib.Path):
+    schema_path = tmp_path / "schema.json"
+    with open(schema_path, "w") as file:
+        file.write(
+            json.dumps(
+                {
+                    "version": "1",
+                    "container": {
+                        "provider": {
+                            "provider": "Factory",
+                            "provides": "list",
+                            "args": [1, 2, 3],
+                        },
+                    },
+                },
+            ),
+        )
+    container.from_json_schema(schema_path, parser="json")
+
+    assert isinstance(container.provider, providers.Factory)
+    assert container.provider.provides is list
+    assert container.provider.args == (1, 2, 3)
+
+
+def test_from_yaml_schema_with_parser(container: containers.DynamicContainer, tmp_path: pathlib.Path):
+    schema_path = tmp_path / "schema.yml"
+    with open(schema_path, "w") as file:
+        file.write("""
+        version: "1"
+        container:
+          provider:
+            provider: Factory
+            provides: list
+            args: [1, 2, 3]
+        """)
+    container.from_yaml_schema(schema_path, parser="pyyaml")
+
+    assert isinstance(container.provider, providers.Factory)
+    assert container.provider.provides is list
+    assert container.provider.args == (1, 2, 3)
@@ -0,0 +1,93 @@
+"""Optional dependencies import tests."""
+
+import json
+import subprocess
+import sys
+
+from pytest import importorskip, mark
+
+
+OPTIONAL_MODULES = [
+    "yaml",
+    "orjson",
+    "msgspec",
+    "pydantic",
+    "pydantic_settings",
+    "fastapi",
+    "fast_depends",
+    "starlette",
+    "werkzeug",
+]
+
+
+def _run_python(code):
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _imported_optional_modules(code):
+    code += "\nimport json, sys\nprint(json.dumps([name for name in {0!r} if name in sys.modules]))".format(
+        OPTIONAL_MODULES,
+    )
+    return _run_python(code)
+
+
+@mark.parametrize(
+    "module",
+    [
+        "dependency_injector.providers",
+        "dependency_injector.containers",
+        "dependency_injector.wiring",
+    ],
+)
+def test_import_does_not_import_optional_modules(module):
+    assert _imported_optional_modules("import {0}".format(module)) == []
+
+
+def test_yaml_is_imported_on_first_use():
+    importorskip("yaml")
+    code = "\n".join([
+        "from dependency_injector import providers",
+        "providers.Configuration().from_yaml('missing.yml')",
+    ])
+    assert "yaml" in _imported_optional_modules(code)
+
+
+def test_json_parsers_are_imported_when_selected():
+    importorskip("orjson")
+    code = "\n".join([
+        "from dependency_injector import providers",
+        "providers.get_config_parser_names('json')",
+        "providers.Configuration().from_json('missing.json')",
+    ])
+    assert _imported_optional_modules(code) == []
+
+    code += "\nproviders.get_config_parser('json', 'orjson')('{}')"
+    assert "orjson" in _imported_optional_modules(code)
+
+
+def test_yaml_module_attributes():
+    importorskip("yaml")
+    code = "\n".join([
+        "import json, yaml",
+        "from dependency_injector import containers, providers",
+        "print(json.dumps([providers.yaml is yaml, containers.yaml is yaml]))",
+    ])
+    assert _run_python(code) == [True, True]
+
+
+def test_optional_module_attributes_when_not_installed():
+    code = "\n".join([
+        "import json, sys",
+        "sys.modules.update(yaml=None, pydantic=None, pydantic_settings=None)",
+        "from dependency_injector import containers, providers",
+        "print(json.dumps([",
+        "    providers.yaml, containers.yaml, providers.PydanticSettings, providers.has_pydantic_settings,",
+        "]))",
+    ])
+    assert _run_python(code) == [None, None, None, False]
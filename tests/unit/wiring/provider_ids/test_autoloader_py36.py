@@ -2,9 +2,18 @@
 
 import contextlib
 import importlib
+import sys
+import types
+from unittest import mock
 
-from dependency_injector.wiring import register_loader_containers, unregister_loader_containers
-from pytest import fixture
+from dependency_injector import containers, providers
+from dependency_injector.containers import WiringConfiguration
+from dependency_injector.wiring import (
+    Provide,
+    register_loader_containers,
+    unregister_loader_containers,
+)
+from pytest import fixture, raises
 
 from samples.wiring import module
 from samples.wiring.service import Service
@@ -23,6 +32,14 @@ def container():
     importlib.reload(module)
 
 
+def _forget_autoload_modules() -> None:
+    package = importlib.import_module("samples.wiring.autoload")
+    for name in ("outer", "inner"):
+        sys.modules.pop(f"{package.__name__}.{name}", None)
+        package.__dict__.pop(name, None)
+    sys.modules.pop("samples.wiring.autoload_failing", None)
+
+
 def test_register_container(container: Container) -> None:
     register_loader_containers(container)
     importlib.reload(module)
@@ -39,3 +56,98 @@ def test_numpy_scipy_and_builtins_dont_break_wiring(container: Container) -> Non
     service = module.test_function()
 
     assert isinstance(service, Service)
+
+
+def test_nested_imports_are_wired_when_their_import_finishes(container: Container) -> None:
+    _forget_autoload_modules()
+
+    register_loader_containers(container)
+    with mock.patch.object(container, "wire", wraps=container.wire) as wire:
+        outer = importlib.import_module("samples.wiring.autoload.outer")
+
+    assert [call.kwargs["modules"] for call in wire.call_args_list] == [
+        [outer.inner],
+        [outer],
+    ]
+
+    assert isinstance(outer.inner_service_on_import, Service)
+    service, inner_service = outer.test_function()
+    assert isinstance(service, Service)
+    assert isinstance(inner_service, Service)
+
+
+def test_module_failed_to_import_is_not_wired(container: Container) -> None:
+    _forget_autoload_modules()
+
+    register_loader_containers(container)
+    with mock.patch.object(container, "wire", wraps=container.wire) as wire:
+        with raises(RuntimeError):
+            importlib.import_module("samples.wiring.autoload_failing")
+
+    inner = importlib.import_module("samples.wiring.autoload.inner")
+    assert [call.kwargs["modules"] for call in wire.call_args_list] == [[inner]]
+
+
+def test_scoped_container_is_wired_only_to_configured_packages(container: Container) -> None:
+    _forget_autoload_modules()
+
+    container.wiring_config = WiringConfiguration(packages=["samples.wiring.autoload"])
+    register_loader_containers(container, scoped=True)
+    with mock.patch.object(container, "wire", wraps=container.wire) as wire:
+        importlib.reload(module)
+        outer = importlib.import_module("samples.wiring.autoload.outer")
+
+    assert [call.kwargs["modules"] for call in wire.call_args_list] == [
+        [outer.inner],
+        [outer],
+    ]
+    assert isinstance(module.test_function(), Provide)
+    assert isinstance(outer.test_function()[0], Service)
+
+
+def test_scoped_container_with_relative_module_names(container: Container) -> None:
+    container.wiring_config = WiringConfiguration(
+        modules=[".module"],
+        from_package="samples.wiring",
+    )
+    register_loader_containers(container, scoped=True)
+    importlib.reload(module)
+
+    assert isinstance(module.test_function(), Service)
+
+
+def test_scoped_dynamic_container_with_relative_module_names() -> None:
+    container = containers.DynamicContainer()
+    container.service = providers.Factory(Service)
+    container.wiring_config = WiringConfiguration(modules=[".module"])
+
+    register_loader_containers(container, scoped=True)
+    try:
+        with mock.patch.object(container, "wire", wraps=container.wire) as wire:
+            importlib.reload(module)
+    finally:
+        unregister_loader_containers(container)
+
+    assert wire.call_args_list == []
+
+
+def test_scoped_container_declared_without_package() -> None:
+    declaring_module = types.ModuleType("autoload_without_package")
+    declaring_module.__package__ = ""
+    sys.modules[declaring_module.__name__] = declaring_module
+    try:
+        exec(
+            "from dependency_injector import containers\n"
+            "class Container(containers.DeclarativeContainer):\n"
+            "    wiring_config = containers.WiringConfiguration(modules=['.module'], auto_wire=False)\n",
+            declaring_module.__dict__,
+        )
+        container = declaring_module.Container()
+
+        with raises(ImportError, match="specify \"from_package\""):
+            register_loader_containers(container, scoped=True)
+    finally:
+        sys.modules.pop(declaring_module.__name__)
+
+    with raises(ValueError):
+        unregister_loader_containers(container)
@@ -0,0 +1,72 @@
+"""Lazy attributes wiring tests."""
+
+from dependency_injector.wiring import Provide, Provider
+from pytest import fixture, raises
+
+from samples.wiring import module, module_global_read
+from samples.wiring.service import Service
+from samples.wiring.container import Container
+
+
+@fixture
+def container():
+    container = Container()
+    container.wire(modules=[module], lazy_attributes=True)
+    yield container
+    container.unwire()
+
+
+def test_module_attribute_is_resolved_on_access(container: Container):
+    assert "service" not in vars(module)
+
+    service = module.service
+
+    assert isinstance(service, Service)
+    assert vars(module)["service"] is service
+    assert module.service is service
+
+
+def test_module_provider_attribute_is_not_deferred(container: Container):
+    assert module.service_provider is container.service
+
+
+def test_module_unknown_attribute(container: Container):
+    with raises(AttributeError):
+        module.unknown_attribute
+
+
+def test_class_attribute_is_resolved_on_access(container: Container):
+    assert not isinstance(vars(module.TestClass)["service"], (Service, Provide))
+
+    service = module.TestClass.service
+
+    assert isinstance(service, Service)
+    assert vars(module.TestClass)["service"] is service
+
+
+def test_wiring_config(container: Container):
+    container.unwire()
+    container.wiring_config.lazy_attributes = True
+
+    container.wire(modules=[module])
+
+    assert "service" not in vars(module)
+    assert isinstance(module.service, Service)
+
+
+def test_unwire(container: Container):
+    container.unwire()
+
+    assert "__getattr__" not in vars(module)
+    assert isinstance(module.service, Provide)
+    assert isinstance(module.service_provider, Provider)
+    assert isinstance(module.TestClass.service, Provide)
+
+
+def test_module_attribute_read_from_same_module(container: Container):
+    container.wire(modules=[module_global_read], lazy_attributes=True)
+
+    assert isinstance(vars(module_global_read)["service"], Service)
+    assert module_global_read.get_service() is module_global_read.service
+    assert "lazy_service" not in vars(module_global_read)
+    assert isinstance(module_global_read.lazy_service, Service)
@@ -0,0 +1,65 @@
+"""Unwiring tests."""
+
+from types import ModuleType
+
+from dependency_injector.wiring import Provide, _patched_registry, unwire
+from pytest import fixture
+
+from samples.wiring import module
+from samples.wiring.service import Service
+from samples.wiring.container import Container
+
+
+def _create_module(name):
+    importing_module = ModuleType(name)
+    importing_module.test_function = module.test_function
+    importing_module.TestClass = module.TestClass
+    return importing_module
+
+
+@fixture
+def module_a():
+    return _create_module("samples.wiring.importing_module_a")
+
+
+@fixture
+def module_b():
+    return _create_module("samples.wiring.importing_module_b")
+
+
+@fixture
+def container():
+    container = Container()
+    yield container
+    container.unwire()
+
+
+def test_unwire_clears_module_index(container, module_a, module_b):
+    container.wire(modules=[module_a, module_b])
+    assert module.test_function in _patched_registry.get_callables_from_module(module_a)
+
+    unwire(modules=[module_a])
+
+    assert list(_patched_registry.get_callables_from_module(module_a)) == []
+    assert module.test_function in _patched_registry.get_callables_from_module(module_b)
+
+
+def test_unwire_unwired_module_keeps_other_module_injections(container, module_a, module_b):
+    container.wire(modules=[module_a, module_b])
+    unwire(modules=[module_a])
+    assert isinstance(module.test_function(), Provide)
+
+    container.wire(modules=[module_b])
+    unwire(modules=[module_a])
+
+    assert isinstance(module.test_function(), Service)
+    assert isinstance(module.TestClass().method(), Service)
+
+
+def test_unwire_method_of_imported_class(container, module_a):
+    container.wire(modules=[module_a])
+    assert isinstance(module.TestClass().method(), Service)
+
+    unwire(modules=[module_a])
+
+    assert isinstance(module.TestClass().method(), Provide)
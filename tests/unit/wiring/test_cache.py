@@ -1,11 +1,22 @@
 """Tests for string module and package names."""
 
+import gc
 from typing import Iterator, Optional
 
 from pytest import fixture, mark
 from samples.wiring.container import Container
+from samples.wiring.service import Service
 
-from dependency_injector.wiring import _fetch_reference_injections
+from dependency_injector import providers
+from dependency_injector.wiring import (
+    CACHE_MAXSIZE,
+    Provide,
+    _fetch_reference_injections,
+    _get_providers_map,
+    _WeakLRUCache,
+    cache_info,
+    clear_cache,
+)
 
 
 @fixture
@@ -22,15 +33,17 @@ def container() -> Iterator[Container]:
         (False, True, True),
         (True, False, False),
         (None, True, False),
+        (None, None, False),
     ],
 )
 def test_fetch_reference_injections_cache(
     container: Container,
     arg_value: Optional[bool],
-    wc_value: bool,
+    wc_value: Optional[bool],
     empty_cache: bool,
 ) -> None:
-    container.wiring_config.keep_cache = wc_value
+    if wc_value is not None:
+        container.wiring_config.keep_cache = wc_value
     container.wire(
         modules=["samples.wiring.module"],
         packages=["samples.wiring.package"],
@@ -39,8 +52,76 @@ def test_fetch_reference_injections_cache(
     cache_info = _fetch_reference_injections.cache_info()
 
     if empty_cache:
-        assert cache_info == (0, 0, None, 0)
+        assert cache_info == (0, 0, CACHE_MAXSIZE, 0)
     else:
         assert cache_info.hits > 0
         assert cache_info.misses > 0
         assert cache_info.currsize > 0
+
+
+def test_providers_map_is_reused(container: Container) -> None:
+    container.wire(modules=["samples.wiring.module"])
+    providers_map = _get_providers_map(container)
+
+    container.wire(modules=["samples.wiring.module"])
+
+    assert _get_providers_map(container) is providers_map
+
+
+def test_providers_map_is_invalidated_on_providers_change(container: Container) -> None:
+    providers_map = _get_providers_map(container)
+
+    container.service = providers.Factory(Service)
+
+    assert not providers_map.is_actual()
+    assert _get_providers_map(container) is not providers_map
+
+
+def test_providers_map_is_invalidated_on_sub_container_change(
+    container: Container,
+) -> None:
+    providers_map = _get_providers_map(container)
+
+    container.sub.container.int_object = providers.Object(2)
+
+    assert not providers_map.is_actual()
+
+
+def test_cache_info() -> None:
+    clear_cache()
+
+    def fn(service: Service = Provide["service"]) -> None: ...
+
+    _fetch_reference_injections(fn)
+    _fetch_reference_injections(fn)
+
+    assert cache_info() == (1, 1, CACHE_MAXSIZE, 1)
+
+
+def test_cache_entry_is_dropped_with_callable() -> None:
+    clear_cache()
+
+    def fn(service: Service = Provide["service"]) -> None: ...
+
+    _fetch_reference_injections(fn)
+    del fn
+    gc.collect()
+
+    assert cache_info().currsize == 0
+
+
+def test_cache_is_bounded() -> None:
+    cache = _WeakLRUCache(lambda fn: fn.__name__, maxsize=2)
+
+    def fn1() -> None: ...
+    def fn2() -> None: ...
+    def fn3() -> None: ...
+
+    assert [cache(fn) for fn in (fn1, fn2, fn1, fn3, fn1)] == [
+        "fn1",
+        "fn2",
+        "fn1",
+        "fn3",
+        "fn1",
+    ]
+    assert cache.cache_info() == (2, 3, 2, 2)